@@ -0,0 +1,5 @@
+"""Pacote responsável pelas comparações de desempenho
+(benchmarks), executadas a partir do diretório 'source':
+
+    python -m benchmarks.<nome>
+"""
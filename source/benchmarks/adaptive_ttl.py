@@ -0,0 +1,113 @@
+"""Arquivo responsável pela comparação do TTL adaptativo com
+TTLs fixos em topologias de lei de potência."""
+
+from random import Random
+from typing import Any
+
+from graph import Network
+from graph import power_law_topology
+from searchs import AdaptiveTTL
+from searchs import WorkloadSummary
+from searchs import run_workload
+from searchs import voronoi_regions
+
+# * Os TTLs fixos comparados.
+FIXED_TTLS: list[float] = [2, 3, 4, float('inf')]
+
+def compare_adaptive_ttl(
+        algorithm: str = 'flooding',
+        num_nodes: int = 2000,
+        edges_per_node: int = 2,
+        num_queries: int = 2000,
+        target: float = 0.9,
+        num_regions: int = 16,
+        seed: int = 0
+    ) -> dict[str, WorkloadSummary]:
+    """Executa a mesma carga de buscas com cada TTL fixo e com o
+    TTL adaptativo, em uma topologia de lei de potência.
+
+    A popularidade dos recursos segue uma distribuição de Zipf e o
+    controlador adaptativo aprende durante a própria carga, por
+    região de origem (as regiões de Voronoi de nós sorteados). Cada
+    execução usa uma cópia nova da topologia, para que as buscas
+    informadas não se beneficiem dos caches da execução anterior.
+
+    Parameters
+    ----------
+    algorithm : str, optional
+        O nome do algoritmo de busca, por padrão 'flooding'.
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 2000.
+    edges_per_node : int, optional
+        A qntd. de conexões de cada novo nó, por padrão 2.
+    num_queries : int, optional
+        A qntd. de buscas, por padrão 2000.
+    target : float, optional
+        A probabilidade de sucesso alvo, por padrão 0.9.
+    num_regions : int, optional
+        A qntd. de regiões da topologia, por padrão 16.
+    seed : int, optional
+        A semente da topologia e da carga, por padrão 0.
+
+    Returns
+    -------
+    dict[str, WorkloadSummary]
+        As métricas agregadas de cada TTL (a chave 'auto' é a
+        do TTL adaptativo).
+    """
+    data_info: dict[str, Any] = power_law_topology(
+        num_nodes=num_nodes,
+        edges_per_node=edges_per_node,
+        seed=seed
+    )
+    rng: Random = Random(seed)
+    resources: list[str] = [f'r{i}' for i in range(1, num_nodes + 1)]
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, num_nodes)}', resource)
+        for resource in rng.choices(
+            resources,
+            weights=[1 / i for i in range(1, num_nodes + 1)],
+            k=num_queries
+        )
+    ]
+
+    summaries: dict[str, WorkloadSummary] = {}
+    for ttl in FIXED_TTLS:
+        summaries[str(ttl)] = run_workload(
+            network=Network(data_info=data_info),
+            algorithm=algorithm,
+            queries=queries,
+            ttl=ttl,
+            seed=seed
+        )
+
+    network: Network = Network(data_info=data_info)
+    regions: dict[Any, int] = voronoi_regions(
+        nodes=network.nodes,
+        centers=[
+            network.find_node_by_id(node_id=f'n{rng.randint(1, num_nodes)}')
+            for _ in range(num_regions)
+        ]
+    )
+    summaries['auto'] = run_workload(
+        network=network,
+        algorithm=algorithm,
+        queries=queries,
+        seed=seed,
+        ttl_controller=AdaptiveTTL(target=target, region_of=regions.get)
+    )
+    return summaries
+
+def main() -> None:
+    """Exibe a comparação do TTL adaptativo com os TTLs fixos."""
+    summaries: dict[str, WorkloadSummary] = compare_adaptive_ttl()
+    baseline: WorkloadSummary = summaries['inf']
+    for ttl, summary in summaries.items():
+        print(
+            f'\n[TTL: {ttl}]' + summary.report() +\
+            '\n\t`--> Mensagens em relação ao TTL infinito: ' +\
+            f'{summary.mean_messages / max(baseline.mean_messages, 1):.2f}x'
+        )
+
+if __name__ == '__main__':
+    main()
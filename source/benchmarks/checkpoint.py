@@ -0,0 +1,145 @@
+"""Arquivo responsável pela medição do custo dos pontos de retomada
+em uma carga de buscas longa e do tempo da retomada."""
+
+import os
+from sys import argv
+from random import Random
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Any
+
+from graph import Network
+from graph import power_law_topology
+from searchs import WorkloadSummary
+from searchs import WorkloadCheckpoint
+from searchs import run_workload
+
+class _Interrupted(Exception):
+    """Simula a parada do processo durante a carga."""
+
+
+class _InterruptedCheckpoint(WorkloadCheckpoint):
+    """Pontos de retomada que param a carga em uma posição."""
+
+    def __init__(self, stop_at: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.stop_at = stop_at
+
+    def record(self, position: int, **kwargs) -> None:
+        if position == self.stop_at:
+            raise _Interrupted()
+        super().record(position=position, **kwargs)
+
+def _run(
+        data_info: dict[str, Any],
+        queries: list[tuple[str, str]],
+        checkpoint: Any = None
+    ) -> tuple[WorkloadSummary, float, Network]:
+    """Aquece os caches de uma nova topologia com a carga, informando
+    as métricas, o tempo e a topologia."""
+    network: Network = Network(data_info=data_info)
+    started: float = perf_counter()
+    summary: WorkloadSummary = run_workload(
+        network=network,
+        algorithm='informed_random_walk',
+        queries=queries,
+        ttl=200,
+        seed=0,
+        checkpoint=checkpoint
+    )
+    return summary, perf_counter() - started, network
+
+def _caches(network: Network) -> dict[str, list[tuple[str, list[str]]]]:
+    """Informa os caches dos nós, na ordem em que foram preenchidos."""
+    return {
+        node_id: [
+            (holder.node_id, sorted(resources))
+            for holder, resources in node.cache.items()
+        ]
+        for node_id, node in network.nodes_by_id.items()
+    }
+
+def main(
+        num_nodes: int = 10_000,
+        num_queries: int = 2000,
+        interval: int = 200
+    ) -> None:
+    """Compara a carga sem e com os pontos de retomada e, após parar
+    a carga em 80% das buscas, o tempo da retomada, conferindo que o
+    resultado é idêntico ao da execução sem interrupções.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 10000.
+    num_queries : int, optional
+        A qntd. de buscas da carga, por padrão 2000.
+    interval : int, optional
+        A qntd. de buscas entre os pontos de retomada, por padrão 200.
+    """
+    data_info: dict[str, Any] = power_law_topology(num_nodes=num_nodes, seed=0)
+    rng: Random = Random(0)
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, num_nodes)}', f'r{rng.randint(1, num_nodes // 20)}')
+        for _ in range(num_queries)
+    ]
+    directory: str = mkdtemp(prefix='p2p-')
+    file_path: str = os.path.join(directory, 'checkpoint.jsonl')
+    try:
+        summary, plain_time, network = _run(data_info=data_info, queries=queries)
+        expected: tuple[dict[str, Any], Any] = (
+            vars(summary), _caches(network=network)
+        )
+        print(
+            f'[Sem pontos] {num_queries} buscas em {plain_time:.2f} segundos.'
+        )
+
+        summary, checkpoint_time, _ = _run(
+            data_info=data_info,
+            queries=queries,
+            checkpoint=WorkloadCheckpoint(file_path=file_path, interval=interval)
+        )
+        print(
+            f'[Com pontos] {num_queries} buscas em {checkpoint_time:.2f}' +\
+            f' segundos ({checkpoint_time / plain_time - 1:+.1%}),' +\
+            f' arquivo de {os.path.getsize(file_path) / 2 ** 20:.1f} MiB.'
+        )
+
+        stop_at: int = num_queries * 4 // 5
+        try:
+            _run(
+                data_info=data_info,
+                queries=queries,
+                checkpoint=_InterruptedCheckpoint(
+                    stop_at=stop_at,
+                    file_path=file_path,
+                    interval=interval
+                )
+            )
+        except _Interrupted:
+            pass
+
+        checkpoint: WorkloadCheckpoint = WorkloadCheckpoint(
+            file_path=file_path,
+            interval=interval,
+            resume=True
+        )
+        summary, resume_time, network = _run(
+            data_info=data_info,
+            queries=queries,
+            checkpoint=checkpoint
+        )
+        identical: bool = (vars(summary), _caches(network=network)) == expected
+        print(
+            f'[Retomada] {checkpoint.restored_queries} buscas refeitas e' +\
+            f' {num_queries - checkpoint.restored_queries} executadas em' +\
+            f' {resume_time:.2f} segundos, resultado' +\
+            f' {"idêntico" if identical else "DIFERENTE"} ao da execução' +\
+            ' sem interrupções.'
+        )
+    finally:
+        rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:4]))
@@ -0,0 +1,95 @@
+"""Arquivo responsável pela comparação do tempo de aplicação de
+alterações incrementais a uma topologia grande com o tempo de
+recriá-la por inteiro."""
+
+import gc
+from sys import argv
+from random import Random
+from time import perf_counter
+from typing import Any
+
+from graph import Network
+from graph import TopologyDelta
+from graph import power_law_topology
+
+def _random_delta(network: Network, size: int, rng: Random) -> TopologyDelta:
+    """Sorteia alterações válidas: nós adicionados (cada um com o
+    mínimo de conexões), conexões removidas entre nós com vizinhos
+    de sobra e recursos adicionados e removidos, um quarto de cada."""
+    nodes: list[Any] = list(network.nodes_by_id.values())
+    degrees: dict[str, int] = {}
+
+    def degree(node: Any) -> int:
+        return degrees.setdefault(node.node_id, len(node.neighbors))
+
+    quarter: int = max(size // 4, 1)
+    delta: TopologyDelta = TopologyDelta()
+    next_id: int = max(int(node_id[1:]) for node_id in network.nodes_by_id) + 1
+    for i in range(next_id, next_id + quarter):
+        delta.add_nodes.append(f'n{i}')
+        targets: set[str] = set()
+        while len(targets) < network.min_neighbors:
+            target: Any = rng.choice(nodes)
+            if degree(target) < network.max_neighbors and \
+                    target.node_id not in targets:
+                targets.add(target.node_id)
+                degrees[target.node_id] += 1
+        delta.add_edges += [(f'n{i}', target_id) for target_id in targets]
+
+    removed: set[frozenset[str]] = set()
+    while len(delta.remove_edges) < quarter:
+        node: Any = rng.choice(nodes)
+        if degree(node) <= network.min_neighbors + 1:
+            continue
+        neighbor: Any = rng.choice(tuple(node.neighbors))
+        edge: frozenset[str] = frozenset((node.node_id, neighbor.node_id))
+        if degree(neighbor) > network.min_neighbors + 1 and edge not in removed:
+            removed.add(edge)
+            degrees[node.node_id] -= 1
+            degrees[neighbor.node_id] -= 1
+            delta.remove_edges.append((node.node_id, neighbor.node_id))
+
+    for i in range(quarter):
+        delta.add_resources.setdefault(
+            rng.choice(nodes).node_id, []
+        ).append(f'rd{next_id}-{i}')
+    while len(delta.remove_resources) < quarter:
+        node = rng.choice(nodes)
+        if node.resources and node.node_id not in delta.remove_resources:
+            delta.remove_resources[node.node_id] = [min(node.resources)]
+    return delta
+
+def main(num_nodes: int = 200_000) -> None:
+    """Exibe, para alterações de tamanhos crescentes, o tempo de
+    aplicá-las (com as checagens) e o tempo de recriar a topologia a
+    partir do arquivo de entrada.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 200000.
+    """
+    network: Network = Network(
+        data_info=power_law_topology(num_nodes=num_nodes, seed=0)
+    )
+    rng: Random = Random(0)
+
+    gc.collect()
+    started: float = perf_counter()
+    Network(data_info=network.to_data_info())
+    reload_time: float = perf_counter() - started
+    print(f'[Recriação] {network.num_nodes} nós em {reload_time:.2f} segundos.')
+
+    for size in (10, 100, 1000, 10000):
+        delta: TopologyDelta = _random_delta(network=network, size=size, rng=rng)
+        gc.collect()
+        started = perf_counter()
+        changes: int = network.apply_delta(delta=delta)
+        elapsed: float = perf_counter() - started
+        print(
+            f'[Alterações] {changes} alterações em {elapsed * 1000:.2f}' +\
+            f' milissegundos ({reload_time / elapsed:.0f}x mais rápido).'
+        )
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:2]))
@@ -0,0 +1,88 @@
+"""Arquivo responsável pela comparação da memória e da velocidade de
+travessia de uma topologia congelada com a topologia original."""
+
+import gc
+import tracemalloc
+from sys import argv
+from collections import deque
+from time import perf_counter
+from typing import Any
+
+from graph import Network
+from graph import power_law_topology
+from searchs.flooding import flooding
+from searchs.random_walk import random_walk
+
+def _bfs_time(network: Network, repetitions: int) -> float:
+    """Informa o tempo, em segundos, de buscas em largura completas,
+    que apenas percorrem os vizinhos dos nós."""
+    started: float = perf_counter()
+    for i in range(1, repetitions + 1):
+        start: Any = network.find_node_by_id(node_id=f'n{i}')
+        visited: set[Any] = {start}
+        queue: deque[Any] = deque([start])
+        while queue:
+            for neighbor in queue.popleft().neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+    return perf_counter() - started
+
+def _traversal_time(network: Network, repetitions: int) -> float:
+    """Informa o tempo, em segundos, de inundações completas (e de
+    passeios aleatórios de até 500 saltos, limitados pela recursão)
+    por um recurso inexistente."""
+    started: float = perf_counter()
+    for i in range(1, repetitions + 1):
+        node: Any = network.find_node_by_id(node_id=f'n{i}')
+        flooding(node=node, resource='-', ttl=float('inf'))
+        random_walk(node=node, resource='-', ttl=500, seed=i)
+    return perf_counter() - started
+
+def main(num_nodes: int = 200_000, repetitions: int = 3) -> None:
+    """Exibe a memória por nó e o tempo das travessias (buscas em
+    largura e buscas do simulador) da topologia original e da
+    congelada.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 200000.
+    repetitions : int, optional
+        A qntd. de travessias de cada tipo, por padrão 3.
+    """
+    data_info: dict[str, Any] = power_law_topology(num_nodes=num_nodes, seed=0)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline: int = tracemalloc.get_traced_memory()[0]
+    network: Network = Network(data_info=data_info)
+    gc.collect()
+    original: int = tracemalloc.get_traced_memory()[0] - baseline
+    network.freeze()
+    gc.collect()
+    frozen: int = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    frozen_bfs: float = _bfs_time(network=network, repetitions=repetitions)
+    frozen_time: float = _traversal_time(network=network, repetitions=repetitions)
+    network.thaw()
+    gc.collect()
+    original_bfs: float = _bfs_time(network=network, repetitions=repetitions)
+    original_time: float = _traversal_time(network=network, repetitions=repetitions)
+
+    print(
+        f'[Original] {original / num_nodes:.0f} bytes por nó,' +\
+        f' buscas em largura em {original_bfs:.2f} segundos,' +\
+        f' buscas em {original_time:.2f} segundos.'
+    )
+    print(
+        f'[Congelada] {frozen / num_nodes:.0f} bytes por nó,' +\
+        f' buscas em largura em {frozen_bfs:.2f} segundos' +\
+        f' ({original_bfs / frozen_bfs:.2f}x),' +\
+        f' buscas em {frozen_time:.2f} segundos' +\
+        f' ({original_time / frozen_time:.2f}x).'
+    )
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:2]))
@@ -0,0 +1,48 @@
+"""Arquivo responsável pela comparação, por Monte Carlo, do passeio
+aleatório com o passeio aleatório informado."""
+
+from sys import argv
+from statistics import NormalDist
+
+from experiments import ExperimentCell
+from experiments import run_experiment
+from experiments import save_experiment
+
+# * O nível de confiança e a meia largura alvo dos intervalos.
+CONFIDENCE: float = 0.95
+PRECISION: float = 0.1
+
+def main(file_path: str = 'monte_carlo.npz') -> None:
+    """Executa o experimento, exibe um resumo de cada algoritmo e
+    grava as células no arquivo fornecido.
+
+    Parameters
+    ----------
+    file_path : str, optional
+        O caminho do arquivo '.npz', por padrão 'monte_carlo.npz'.
+    """
+    cells: list[ExperimentCell] = run_experiment(
+        algorithms=['random_walk', 'informed_random_walk'],
+        ttls=[8, 32, float('inf')],
+        topology_seeds=[0, 1],
+        confidence=CONFIDENCE,
+        precision=PRECISION
+    )
+    save_experiment(file_path=file_path, cells=cells, confidence=CONFIDENCE)
+
+    z: float = NormalDist().inv_cdf((1 + CONFIDENCE) / 2)
+
+    for cell in cells:
+        low, high = cell.success_interval(z=z)
+        print(
+            f'[{cell.algorithm}] TTL {cell.ttl}, topologia' +\
+            f' {cell.topology_seed}, origem {cell.start_node}:' +\
+            f' {cell.summary.queries} repetições,' +\
+            f' sucesso {cell.summary.success_rate:.2%}' +\
+            f' [{low:.2%}, {high:.2%}],' +\
+            f' {cell.summary.mean_messages:.1f} mensagens'
+        )
+    print(f'\nResultados gravados em \'{file_path}\'.')
+
+if __name__ == '__main__':
+    main(*argv[1:2])
@@ -0,0 +1,107 @@
+"""Arquivo responsável pela comparação do tempo de travessia de uma
+topologia grande antes e depois da reordenação dos nós."""
+
+import gc
+from sys import argv
+from random import Random
+from collections import deque
+from time import perf_counter
+from typing import Any, Union
+
+from graph import Network
+from graph import NODE_ORDERS
+from graph import CompactGraph
+from graph import edge_span
+from graph import power_law_topology
+
+def _shuffled_topology(num_nodes: int, seed: int) -> dict[str, Any]:
+    """Gera uma topologia com os ids dos nós embaralhados, já que,
+    nos arquivos de entrada, a ordem dos ids não segue as conexões
+    (no gerador, os primeiros nós são os de maior grau)."""
+    data_info: dict[str, Any] = power_law_topology(num_nodes=num_nodes, seed=seed)
+    labels: list[int] = list(range(1, num_nodes + 1))
+    Random(seed).shuffle(labels)
+
+    def rename(node_id: str) -> str:
+        return f'n{labels[int(node_id[1:]) - 1]}'
+
+    data_info['resources'] = {
+        rename(node_id): resources
+        for node_id, resources in data_info['resources'].items()
+    }
+    data_info['edges'] = {
+        rename(node_id): [rename(neighbor) for neighbor in neighbors]
+        for node_id, neighbors in data_info['edges'].items()
+    }
+    return data_info
+
+def _node_time(network: Network, starts: list[str]) -> float:
+    """Informa o tempo, em segundos, de buscas em largura completas
+    sobre os objetos dos nós."""
+    started: float = perf_counter()
+    for node_id in starts:
+        start: Any = network.find_node_by_id(node_id=node_id)
+        visited: set[Any] = {start}
+        queue: deque[Any] = deque([start])
+        while queue:
+            for neighbor in queue.popleft().neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+    return perf_counter() - started
+
+def _compact_time(network: Network, starts: list[str]) -> float:
+    """Informa o tempo, em segundos, de buscas em largura completas
+    sobre os vetores de inteiros (ver `CompactGraph`)."""
+    graph: CompactGraph = CompactGraph(network=network)
+    adjacency: list[list[int]] = graph.adjacency()
+    started: float = perf_counter()
+    for node_id in starts:
+        start: int = graph.index[network.find_node_by_id(node_id=node_id)]
+        visited: bytearray = bytearray(len(graph))
+        visited[start] = 1
+        queue: list[int] = [start]
+        for node in queue:
+            for neighbor in adjacency[node]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+    return perf_counter() - started
+
+def main(num_nodes: int = 300_000, repetitions: int = 3) -> None:
+    """Exibe, para a ordem dos ids e para cada reordenação, a
+    distância média entre os nós conectados e o tempo das buscas em
+    largura sobre os nós e sobre os vetores de inteiros.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 300000.
+    repetitions : int, optional
+        A qntd. de buscas em largura de cada tipo, por padrão 3.
+    """
+    data_info: dict[str, Any] = _shuffled_topology(num_nodes=num_nodes, seed=0)
+    starts: list[str] = [f'n{i}' for i in range(1, repetitions + 1)]
+
+    baseline: Union[tuple[float, float], None] = None
+    for method in [None, *NODE_ORDERS]:
+        network: Network = Network(data_info=data_info)
+        if method is not None:
+            network.reorder(method=method)
+        gc.collect()
+        node_time: float = _node_time(network=network, starts=starts)
+        compact_time: float = _compact_time(network=network, starts=starts)
+        if baseline is None:
+            baseline = (node_time, compact_time)
+        print(
+            f'[{method or "ids"}] distância média de' +\
+            f' {edge_span(network=network):.0f},' +\
+            f' nós em {node_time:.2f} segundos' +\
+            f' ({baseline[0] / node_time:.2f}x),' +\
+            f' vetores em {compact_time:.2f} segundos' +\
+            f' ({baseline[1] / compact_time:.2f}x).'
+        )
+        del network
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:2]))
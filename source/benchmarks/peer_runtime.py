@@ -0,0 +1,110 @@
+"""Arquivo responsável pela medição da execução concorrente das
+buscas, com cada nó como um par, em uma topologia grande."""
+
+from time import perf_counter
+from random import Random
+from typing import Any
+
+from graph import Network
+from graph import power_law_topology
+from replication import place_replicas
+from simulation import RuntimeStats
+from simulation import run_concurrent_workload
+
+# * Os algoritmos e TTLs medidos.
+RUNTIME_SCENARIOS: list[tuple[str, int]] = [
+    ('flooding', 3),
+    ('informed_flooding', 3),
+    ('random_walk', 64),
+    ('informed_random_walk', 64),
+]
+
+def _dedup_stress(seed: int = 0) -> None:
+    """Confere que os passeios sem sucesso (TTL infinito) terminam,
+    com as mesmas mensagens, mesmo com apenas 2 GUIDs guardados por
+    par, em uma topologia pequena."""
+    network: Network = Network(
+        data_info=power_law_topology(num_nodes=300, seed=seed)
+    )
+    rng: Random = Random(seed)
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, 300)}', '-') for _ in range(20)
+    ]
+    for algorithm in ('random_walk', 'informed_random_walk'):
+        messages: list[int] = [
+            run_concurrent_workload(
+                network=network,
+                algorithm=algorithm,
+                queries=queries,
+                concurrency=20,
+                dedup_capacity=dedup_capacity,
+                seed=seed
+            ).messages_count
+            for dedup_capacity in (1024, 2)
+        ]
+        print(
+            f'\n[{algorithm}] 2 GUIDs por par: {messages[1]} mensagens' +\
+            f' ({"iguais" if messages[0] == messages[1] else "DIFERENTES"}' +\
+            f' às {messages[0]} com 1024 GUIDs).'
+        )
+
+def main(
+        num_nodes: int = 100_000,
+        num_queries: int = 1000,
+        concurrency: int = 200,
+        seed: int = 0
+    ) -> None:
+    """Exibe as métricas de cada algoritmo, sob uma carga de buscas
+    simultâneas, em uma topologia de lei de potência.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 100000.
+    num_queries : int, optional
+        A qntd. de buscas, por padrão 1000.
+    concurrency : int, optional
+        A qntd. máxima de buscas simultâneas, por padrão 200.
+    seed : int, optional
+        A semente da topologia e da carga, por padrão 0.
+    """
+    started: float = perf_counter()
+    data_info: dict[str, Any] = power_law_topology(
+        num_nodes=num_nodes,
+        seed=seed
+    )
+    network: Network = Network(data_info=data_info)
+    # Réplicas dos 100 primeiros recursos em 1% dos nós, para que as
+    # buscas tenham sucesso dentro de poucos saltos.
+    place_replicas(
+        network=network,
+        allocation={f'r{i}': num_nodes // 100 for i in range(1, 101)},
+        mode='add',
+        seed=seed
+    )
+    print(
+        f'[Topologia] {num_nodes} nós criados em' +\
+        f' {perf_counter() - started:.2f} segundos.'
+    )
+
+    rng: Random = Random(seed)
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, num_nodes)}', f'r{rng.randint(1, 100)}')
+        for _ in range(num_queries)
+    ]
+    for algorithm, ttl in RUNTIME_SCENARIOS:
+        for node in network.nodes:
+            node.clear_cache()
+        stats: RuntimeStats = run_concurrent_workload(
+            network=network,
+            algorithm=algorithm,
+            queries=queries,
+            ttl=ttl,
+            concurrency=concurrency,
+            seed=seed
+        )
+        print(f'\n[{algorithm}] TTL {ttl}' + stats.report())
+    _dedup_stress(seed=seed)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Arquivo responsável pela comparação das previsões do simulador com
+a execução distribuída das buscas, em processos locais conectados
+por sockets."""
+
+from sys import argv
+from json import dump
+from os import path as os_path
+from random import Random
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Any
+
+from graph import Network
+from graph import power_law_topology
+from searchs import WorkloadSummary
+from searchs import run_workload
+from simulation import TransportStats
+from simulation import run_socket_workload
+
+# * Os algoritmos e TTLs medidos.
+SOCKET_SCENARIOS: list[tuple[str, int]] = [
+    ('flooding', 4),
+    ('informed_flooding', 4),
+    ('random_walk', 32),
+    ('informed_random_walk', 32),
+]
+
+def main(
+        transport: str = 'unix',
+        num_processes: int = 4,
+        num_nodes: int = 2000,
+        num_queries: int = 200,
+        seed: int = 0
+    ) -> None:
+    """Exibe, para cada algoritmo, as métricas previstas pelo simulador
+    e as medidas na execução distribuída, sobre a mesma topologia,
+    gravada no formato do arquivo de entrada.
+
+    Parameters
+    ----------
+    transport : str, optional
+        O meio de transporte ('unix' ou 'tcp'), por padrão 'unix'.
+    num_processes : int, optional
+        A qntd. de processos, por padrão 4.
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 2000.
+    num_queries : int, optional
+        A qntd. de buscas, por padrão 200.
+    seed : int, optional
+        A semente da topologia e da carga, por padrão 0.
+    """
+    directory: str = mkdtemp(prefix='p2p-')
+    file_path: str = os_path.join(directory, 'input.json')
+    data_info: dict[str, Any] = power_law_topology(
+        num_nodes=num_nodes,
+        seed=seed
+    )
+    with open(file_path, 'w', encoding='utf-8') as file:
+        dump(data_info, file)
+
+    rng: Random = Random(seed)
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, num_nodes)}', f'r{rng.randint(1, num_nodes)}')
+        for _ in range(num_queries)
+    ]
+    try:
+        for algorithm, ttl in SOCKET_SCENARIOS:
+            summary: WorkloadSummary = run_workload(
+                network=Network(data_info=data_info),
+                algorithm=algorithm,
+                queries=queries,
+                ttl=ttl,
+                seed=seed
+            )
+            stats: TransportStats = run_socket_workload(
+                file_path=file_path,
+                algorithm=algorithm,
+                queries=queries,
+                ttl=ttl,
+                num_processes=num_processes,
+                transport=transport,
+                seed=seed
+            )
+            print(f'\nTTL {ttl}' + summary.report() + stats.report())
+    finally:
+        rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main(*argv[1:2])
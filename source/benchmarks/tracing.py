@@ -0,0 +1,103 @@
+"""Arquivo responsável pela medição do custo do rastreamento em uma
+inundação de cerca de 1 milhão de mensagens."""
+
+import tracemalloc
+from sys import argv
+from os import path as os_path
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Any, Union
+
+from graph import Network
+from graph import power_law_topology
+from searchs import SearchResult
+from searchs import TraceRecorder
+from searchs import export_chrome_trace
+from searchs.flooding import flooding
+
+def _flood(node: Any, recorder: Union[TraceRecorder, None]) -> SearchResult:
+    """Executa uma inundação por um recurso inexistente."""
+    if recorder is None:
+        return flooding(node=node, resource='-', ttl=float('inf'))
+    with recorder:
+        return flooding(node=node, resource='-', ttl=float('inf'))
+
+def _measure(
+        node: Any,
+        file_path: Union[str, None] = None,
+        trace_format: str = 'binary',
+        capacity: int = 65536
+    ) -> tuple[SearchResult, float, int, int]:
+    """Executa a inundação duas vezes, informando o resultado, o tempo,
+    o pico de memória (em bytes, medido na segunda execução, para não
+    afetar o tempo) e a qntd. de eventos gravados."""
+    def recorder() -> Union[TraceRecorder, None]:
+        return None if file_path is None else TraceRecorder(
+            file_path=file_path,
+            trace_format=trace_format,
+            capacity=capacity
+        )
+
+    timed: Union[TraceRecorder, None] = recorder()
+    started: float = perf_counter()
+    result: SearchResult = _flood(node=node, recorder=timed)
+    elapsed: float = perf_counter() - started
+
+    tracemalloc.start()
+    _flood(node=node, recorder=recorder())
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak, 0 if timed is None else timed.events_count
+
+def main(num_nodes: int = 250_000, capacity: int = 65536) -> None:
+    """Compara a inundação sem rastreador e com o rastreador gravando
+    nos dois formatos, exibindo o tempo, o pico de memória e o tamanho
+    dos arquivos.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 250000.
+    capacity : int, optional
+        A capacidade do buffer de eventos, por padrão 65536.
+    """
+    network: Network = Network(
+        data_info=power_law_topology(num_nodes=num_nodes, seed=0)
+    )
+    node: Any = network.find_node_by_id(node_id='n1')
+    directory: str = mkdtemp(prefix='p2p-')
+    try:
+        result, elapsed, peak, _ = _measure(node=node)
+        print(
+            f'[Sem rastreador] {result.messages_count} mensagens em' +\
+            f' {elapsed:.2f} segundos, pico de {peak / 2 ** 20:.1f} MiB.'
+        )
+        for trace_format in ('binary', 'jsonl'):
+            file_path: str = os_path.join(directory, f'trace.{trace_format}.gz')
+            result, elapsed, peak, events_count = _measure(
+                node=node,
+                file_path=file_path,
+                trace_format=trace_format,
+                capacity=capacity
+            )
+            print(
+                f'[{trace_format}] {events_count} eventos em' +\
+                f' {elapsed:.2f} segundos, pico de {peak / 2 ** 20:.1f} MiB,' +\
+                f' arquivo de {os_path.getsize(file_path) / 2 ** 20:.1f} MiB.'
+            )
+
+        started: float = perf_counter()
+        count: int = export_chrome_trace(
+            file_path=os_path.join(directory, 'trace.binary.gz'),
+            output_path=os_path.join(directory, 'trace.json')
+        )
+        print(
+            f'[Chrome] {count} eventos exportados em' +\
+            f' {perf_counter() - started:.2f} segundos.'
+        )
+    finally:
+        rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:2]))
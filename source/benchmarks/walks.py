@@ -0,0 +1,123 @@
+"""Arquivo responsável pela comparação dos passeios aleatórios
+enviesados com o passeio aleatório em topologias de lei de potência."""
+
+from random import Random
+from functools import partial
+from typing import Any, Callable
+
+from graph import Network
+from graph import LandmarkIndex
+from graph import power_law_topology
+from searchs import SearchResult
+from searchs import WorkloadSummary
+from searchs import run_workload
+from searchs.biased_random_walk import biased_random_walk
+
+# * Os passeios aleatórios comparados.
+WALK_SEARCH_ALGORITHMS: list[str] = [
+    'random_walk',
+    'degree_random_walk',
+    'success_random_walk',
+    'mixed_random_walk',
+]
+
+def compare_walks(
+        num_nodes: int = 2000,
+        edges_per_node: int = 2,
+        num_queries: int = 1000,
+        ttl: int = 500,
+        seed: int = 0
+    ) -> dict[str, WorkloadSummary]:
+    """Executa a mesma carga de buscas com cada passeio aleatório,
+    cada um em uma cópia nova da mesma topologia de lei de potência.
+
+    A popularidade dos recursos segue uma distribuição de Zipf e,
+    como referência, também é executado um passeio de um único
+    andarilho sem viés ('uniform'), já que o 'random_walk' percorre
+    a topologia em profundidade, com retrocesso.
+
+    Parameters
+    ----------
+    num_nodes : int, optional
+        A qntd. de nós da topologia, por padrão 2000.
+    edges_per_node : int, optional
+        A qntd. de conexões de cada novo nó, por padrão 2.
+    num_queries : int, optional
+        A qntd. de buscas, por padrão 1000.
+    ttl : int, optional
+        O limitador de 'saltos' das buscas, por padrão 500.
+    seed : int, optional
+        A semente da topologia e da carga, por padrão 0.
+
+    Returns
+    -------
+    dict[str, WorkloadSummary]
+        As métricas agregadas de cada passeio.
+    """
+    data_info: dict[str, Any] = power_law_topology(
+        num_nodes=num_nodes,
+        edges_per_node=edges_per_node,
+        seed=seed
+    )
+    rng: Random = Random(seed)
+    resources: list[str] = [f'r{i}' for i in range(1, num_nodes + 1)]
+    queries: list[tuple[str, str]] = [
+        (f'n{rng.randint(1, num_nodes)}', resource)
+        for resource in rng.choices(
+            resources,
+            weights=[1 / i for i in range(1, num_nodes + 1)],
+            k=num_queries
+        )
+    ]
+
+    summaries: dict[str, WorkloadSummary] = {}
+
+    # Passeio de um único andarilho, sem viés, como referência.
+    network: Network = Network(data_info=data_info)
+    landmarks: LandmarkIndex = network.landmarks()
+    uniform_walk: Callable = partial(
+        biased_random_walk,
+        algorithm='uniform',
+        mode='uniform',
+        informed=False,
+        network=network
+    )
+    seeds: Random = Random(seed)
+    summaries['uniform'] = WorkloadSummary(algorithm='uniform')
+    for node_id, resource in queries:
+        result: SearchResult = uniform_walk(
+            node=network.find_node_by_id(node_id=node_id),
+            resource=resource,
+            ttl=ttl,
+            seed=seeds.getrandbits(63)
+        )
+        result.stretch = landmarks.stretch(result=result)
+        summaries['uniform'].add(result=result)
+
+    for algorithm in WALK_SEARCH_ALGORITHMS:
+        network = Network(data_info=data_info)
+        network.landmarks()
+        summaries[algorithm] = run_workload(
+            network=network,
+            algorithm=algorithm,
+            queries=queries,
+            ttl=ttl,
+            seed=seed
+        )
+    return summaries
+
+def main() -> None:
+    """Exibe a comparação dos passeios aleatórios."""
+    summaries: dict[str, WorkloadSummary] = compare_walks()
+    baseline: WorkloadSummary = summaries['random_walk']
+    for summary in summaries.values():
+        print(
+            summary.report() +\
+            '\n\t`--> Mensagens por busca com sucesso: ' +\
+            f'{summary.messages_count / max(summary.found, 1):.2f}' +\
+            '\n\t`--> Mensagens em relação ao \'random_walk\': ' +\
+            f'{summary.mean_messages / max(baseline.mean_messages, 1):.2f}x'
+        )
+
+if __name__ == '__main__':
+    main()
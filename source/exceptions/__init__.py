@@ -6,11 +6,15 @@ from .invalid_param import InvalidParam
 from .node_id_not_found import NodeIDNotFound
 from .missing_input_file import MissingInputFile
 from .too_many_neighbors import TooManyNeighbors
+from .message_budget_exceeded import MessageBudgetExceeded
+from .topology_mismatch import TopologyMismatch
 from .non_json_file_found import NonJSONFileFound
 from .not_enough_neighbors import NotEnoughNeighbors
 from .missing_node_resources import MissingNodeResources
 from .missing_node_neighbors import MissingNodeNeighbors
 from .network_is_partitioned import NetworkIsPartitioned
+from .network_is_frozen import NetworkIsFrozen
+from .invalid_topology_delta import InvalidTopologyDelta
 from .invalid_search_algorithm import InvalidSearchAlgorithm
 from .invalid_option_in_input_file import InvalidOptionInInputFile
 
@@ -20,11 +24,15 @@ __all__: list[str] = [
     'NodeIDNotFound',
     'MissingInputFile',
     'TooManyNeighbors',
+    'MessageBudgetExceeded',
+    'TopologyMismatch',
     'NonJSONFileFound',
     'NotEnoughNeighbors',
     'MissingNodeResources',
     'MissingNodeNeighbors',
     'NetworkIsPartitioned',
+    'NetworkIsFrozen',
+    'InvalidTopologyDelta',
     'InvalidSearchAlgorithm',
     'InvalidOptionInInputFile',
 ]
@@ -0,0 +1,7 @@
+"""Arquivo responsável pela exceção customizada relacionada
+a aplicação de alterações inválidas a uma topologia."""
+
+class InvalidTopologyDelta(Exception):
+    """Exceção lançada quando as alterações de uma topologia
+    (ver `TopologyDelta`) não podem ser aplicadas, por exemplo, ao
+    remover uma conexão inexistente ou adicionar um nó existente."""
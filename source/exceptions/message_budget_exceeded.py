@@ -0,0 +1,6 @@
+"""Arquivo responsável pela exceção customizada relacionada
+à previsão de um custo de busca acima do orçamento."""
+
+class MessageBudgetExceeded(Exception):
+    """Exceção lançada quando a qntd. prevista de mensagens
+    de uma busca ultrapassa o orçamento de mensagens fornecido."""
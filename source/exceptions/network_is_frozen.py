@@ -0,0 +1,7 @@
+"""Arquivo responsável pela exceção customizada relacionada
+a alteração de uma topologia congelada."""
+
+class NetworkIsFrozen(Exception):
+    """Exceção lançada ao tentar alterar os nós, as conexões
+    ou os recursos de uma topologia congelada (ver
+    `Network.freeze`)."""
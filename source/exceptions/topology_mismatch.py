@@ -0,0 +1,7 @@
+"""Arquivo responsável pela exceção customizada relacionada
+ao carregamento de dados salvos de uma topologia diferente."""
+
+class TopologyMismatch(Exception):
+    """Exceção lançada quando os dados salvos de uma
+    topologia (ex.: caches) são carregados em uma topologia
+    diferente daquela em que foram gerados."""
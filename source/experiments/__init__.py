@@ -0,0 +1,17 @@
+"""Pacote responsável pelos experimentos de Monte Carlo sobre
+os algoritmos de busca e pela gravação dos seus resultados."""
+
+from .npz import write_npz
+from .npz import read_npz
+from .runner import ExperimentCell
+from .runner import run_experiment
+from .runner import save_experiment
+
+# Indica o que está disponível para uso no pacote.
+__all__: list[str] = [
+    'write_npz',
+    'read_npz',
+    'ExperimentCell',
+    'run_experiment',
+    'save_experiment',
+]
@@ -0,0 +1,155 @@
+"""Arquivo responsável pela escrita e leitura de arquivos colunares
+no formato '.npz' do NumPy, sem depender do NumPy."""
+
+from ast import literal_eval
+from array import array
+from sys import byteorder
+from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+# * O início de todo arquivo '.npy' (versão 1.0 do formato).
+NPY_MAGIC: bytes = b'\x93NUMPY\x01\x00'
+
+def _npy(column: list[Any]) -> bytes:
+    """Converte uma coluna em um arquivo '.npy' unidimensional.
+
+    Inteiros são gravados com 64 bits, números reais com 64 bits,
+    booleanos com 1 byte e textos em UTF-32 de tamanho fixo.
+
+    Parameters
+    ----------
+    column : list[Any]
+        Os valores da coluna, todos do mesmo tipo.
+
+    Returns
+    -------
+    bytes
+        O conteúdo do arquivo '.npy'.
+    """
+    if all(isinstance(value, bool) for value in column):
+        descr: str = '|b1'
+        data: bytes = bytes(column)
+    elif all(isinstance(value, int) for value in column):
+        values: array = array('q', column)
+        descr = '<i8'
+        if byteorder == 'big':
+            values.byteswap()
+        data = values.tobytes()
+    elif all(isinstance(value, (int, float)) for value in column):
+        values = array('d', column)
+        descr = '<f8'
+        if byteorder == 'big':
+            values.byteswap()
+        data = values.tobytes()
+    elif all(isinstance(value, str) for value in column):
+        width: int = max((len(value) for value in column), default=1) or 1
+        descr = f'<U{width}'
+        data = b''.join(
+            value.ljust(width, '\0').encode('utf-32-le') for value in column
+        )
+    # Lança uma exceção se a coluna misturar tipos.
+    else:
+        raise InvalidParam(
+            'As colunas devem conter apenas booleanos, números ou textos.'
+        )
+
+    header: str = f"{{'descr': '{descr}', 'fortran_order': False," +\
+        f" 'shape': ({len(column)},), }}"
+    # O cabeçalho termina em '\n' e é alinhado a 64 bytes.
+    padding: int = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header += ' ' * padding + '\n'
+    return NPY_MAGIC + len(header).to_bytes(2, 'little') +\
+        header.encode('latin1') + data
+
+def write_npz(
+        file_path: str,
+        columns: dict[str, list[Any]],
+        compress: bool = True
+    ) -> None:
+    """Grava colunas em um arquivo '.npz', legível com `numpy.load`.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo.
+    columns : dict[str, list[Any]]
+        Os valores de cada coluna.
+    compress : bool, optional
+        Se o arquivo deve ser comprimido, por padrão verdadeiro.
+
+    Raises
+    ------
+    InvalidParam
+        Caso alguma coluna misture tipos ou as colunas tenham
+        tamanhos diferentes.
+    """
+    # Lança uma exceção se as colunas tiverem tamanhos diferentes.
+    if len({len(column) for column in columns.values()}) > 1:
+        raise InvalidParam('Todas as colunas devem ter o mesmo tamanho.')
+
+    with ZipFile(
+            file_path,
+            'w',
+            compression=ZIP_DEFLATED if compress else 0
+        ) as file:
+        for name, column in columns.items():
+            file.writestr(f'{name}.npy', _npy(column=column))
+
+def read_npz(file_path: str) -> dict[str, list[Any]]:
+    """Lê as colunas de um arquivo '.npz' gravado por `write_npz`.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo.
+
+    Returns
+    -------
+    dict[str, list[Any]]
+        Os valores de cada coluna.
+
+    Raises
+    ------
+    InvalidParam
+        Caso alguma coluna tenha um tipo não suportado.
+    """
+    columns: dict[str, list[Any]] = {}
+    with ZipFile(file_path) as file:
+        for name in file.namelist():
+            content: bytes = file.read(name)
+            size: int = int.from_bytes(
+                content[len(NPY_MAGIC):len(NPY_MAGIC) + 2], 'little'
+            )
+            start: int = len(NPY_MAGIC) + 2
+            header: dict[str, Any] = literal_eval(
+                content[start:start + size].decode('latin1')
+            )
+            data: bytes = content[start + size:]
+            descr: str = header['descr']
+
+            column: Union[list[Any], None] = None
+            if descr == '|b1':
+                column = [bool(value) for value in data]
+            elif descr.startswith('<U'):
+                width: int = int(descr[2:])
+                column = [
+                    data[i:i + 4 * width].decode('utf-32-le').rstrip('\0')
+                    for i in range(0, len(data), 4 * width)
+                ]
+            elif descr in ('<i8', '<f8'):
+                values: array = array('q' if descr == '<i8' else 'd')
+                values.frombytes(data)
+                if byteorder == 'big':
+                    values.byteswap()
+                column = values.tolist()
+
+            # Lança uma exceção se o tipo da coluna não for suportado.
+            if column is None:
+                raise InvalidParam(
+                    f'O tipo \'{descr}\' da coluna \'{name}\' não é suportado.'
+                )
+            columns[name.removesuffix('.npy')] = column
+    return columns
@@ -0,0 +1,399 @@
+"""Arquivo responsável pela execução de experimentos de Monte Carlo,
+varrendo algoritmos, TTLs, nós de origem e topologias."""
+
+from os import cpu_count
+from pickle import dumps
+from math import sqrt
+from random import Random
+from functools import partial
+from itertools import product
+from statistics import NormalDist
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+from graph import Network
+from graph import power_law_topology
+from searchs import WorkloadSummary
+from searchs import run_workload
+
+from .npz import write_npz
+
+# * As topologias já geradas em cada processo, por semente.
+_topologies: dict[tuple[bytes, int], dict[str, Any]] = {}
+
+def _run_batch(
+        topology: Callable[..., dict[str, Any]],
+        topology_seed: int,
+        algorithm: str,
+        ttl: Union[int, float],
+        queries: list[tuple[str, str]],
+        seed: int
+    ) -> WorkloadSummary:
+    """Executa um lote de repetições de uma célula do experimento.
+
+    Cada lote usa uma cópia nova da topologia, logo, os caches (e os
+    pesos dos passeios enviesados) partem do zero e o resultado não
+    depende de qual processo executou os lotes anteriores.
+
+    Parameters
+    ----------
+    topology : Callable[..., dict[str, Any]]
+        O gerador da topologia, que recebe a semente.
+    topology_seed : int
+        A semente da topologia.
+    algorithm : str
+        O nome do algoritmo de busca.
+    ttl : Union[int, float]
+        O limitador de 'saltos' das buscas.
+    queries : list[tuple[str, str]]
+        As buscas do lote.
+    seed : int
+        A semente das buscas aleatórias do lote.
+
+    Returns
+    -------
+    WorkloadSummary
+        As métricas agregadas do lote.
+    """
+    # O gerador chega serializado a cada lote, logo, a chave é a serialização.
+    key: tuple[bytes, int] = (dumps(topology), topology_seed)
+    if (data_info := _topologies.get(key)) is None:
+        data_info = _topologies[key] = topology(seed=topology_seed)
+    return run_workload(
+        network=Network(data_info=data_info),
+        algorithm=algorithm,
+        queries=queries,
+        ttl=ttl,
+        seed=seed
+    )
+
+
+class ExperimentCell:
+    """Representa uma célula do experimento, isto é, uma combinação
+    de algoritmo, TTL, semente da topologia e nó de origem, com as
+    métricas das repetições já executadas."""
+    algorithm: str
+    ttl: Union[int, float]
+    topology_seed: int
+    start_node: str
+    summary: WorkloadSummary
+    batches: int
+
+    def __init__(
+            self,
+            algorithm: str,
+            ttl: Union[int, float],
+            topology_seed: int,
+            start_node: str
+        ) -> None:
+        self.algorithm = algorithm
+        self.ttl = ttl
+        self.topology_seed = topology_seed
+        self.start_node = start_node
+        self.summary = WorkloadSummary(algorithm=algorithm)
+        self.batches = 0
+
+    def success_interval(self, z: float) -> tuple[float, float]:
+        """Calcula o intervalo de confiança (de Wilson) da taxa
+        de sucesso.
+
+        Parameters
+        ----------
+        z : float
+            O quantil da normal do nível de confiança.
+
+        Returns
+        -------
+        tuple[float, float]
+            Os limites inferior e superior do intervalo.
+        """
+        n: int = self.summary.queries
+        if n == 0:
+            return 0.0, 1.0
+        p: float = self.summary.success_rate
+        center: float = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half_width: float = z * sqrt(
+            p * (1 - p) / n + z * z / (4 * n * n)
+        ) / (1 + z * z / n)
+        return center - half_width, center + half_width
+
+    @staticmethod
+    def __mean_interval(
+            count: int,
+            total: float,
+            squares: float,
+            z: float
+        ) -> tuple[float, float]:
+        """Calcula o intervalo de confiança (normal) de uma média."""
+        if count < 2:
+            return 0.0, float('inf')
+        mean: float = total / count
+        variance: float = max(squares - total * mean, 0.0) / (count - 1)
+        half_width: float = z * sqrt(variance / count)
+        return mean - half_width, mean + half_width
+
+    def messages_interval(self, z: float) -> tuple[float, float]:
+        """Calcula o intervalo de confiança da média de mensagens.
+
+        Parameters
+        ----------
+        z : float
+            O quantil da normal do nível de confiança.
+
+        Returns
+        -------
+        tuple[float, float]
+            Os limites inferior e superior do intervalo.
+        """
+        return self.__mean_interval(
+            count=self.summary.queries,
+            total=self.summary.messages_count,
+            squares=self.summary.messages_squares,
+            z=z
+        )
+
+    def hops_interval(self, z: float) -> tuple[float, float]:
+        """Calcula o intervalo de confiança da média de 'saltos'
+        das buscas com sucesso.
+
+        Parameters
+        ----------
+        z : float
+            O quantil da normal do nível de confiança.
+
+        Returns
+        -------
+        tuple[float, float]
+            Os limites inferior e superior do intervalo.
+        """
+        return self.__mean_interval(
+            count=self.summary.found,
+            total=self.summary.hops_count,
+            squares=self.summary.hops_squares,
+            z=z
+        )
+
+    def converged(self, z: float, precision: float) -> bool:
+        """Informa se os intervalos de confiança estão estreitos o
+        suficiente: a meia largura da taxa de sucesso deve ser de até
+        'precision' e a das médias, de até 'precision' vezes a média.
+
+        Parameters
+        ----------
+        z : float
+            O quantil da normal do nível de confiança.
+        precision : float
+            A meia largura alvo dos intervalos.
+
+        Returns
+        -------
+        bool
+            Verdadeiro se a célula pode parar de ser repetida.
+        """
+        low, high = self.success_interval(z=z)
+        if (high - low) / 2 > precision:
+            return False
+        low, high = self.messages_interval(z=z)
+        if (high - low) / 2 > precision * max(self.summary.mean_messages, 1):
+            return False
+        # Sem buscas com sucesso o suficiente, os 'saltos' são ignorados.
+        if self.summary.found >= 2:
+            low, high = self.hops_interval(z=z)
+            if (high - low) / 2 > precision * max(self.summary.mean_hops, 1):
+                return False
+        return True
+
+
+def run_experiment(
+        algorithms: list[str],
+        ttls: list[Union[int, float]],
+        topology_seeds: list[int],
+        num_start_nodes: int = 4,
+        topology: Callable[..., dict[str, Any]] = partial(
+            power_law_topology, num_nodes=1000
+        ),
+        confidence: float = 0.95,
+        precision: float = 0.05,
+        batch_size: int = 32,
+        min_repetitions: int = 64,
+        max_repetitions: int = 2048,
+        processes: Union[int, None] = None,
+        seed: int = 0
+    ) -> list[ExperimentCell]:
+    """Executa um experimento de Monte Carlo, varrendo cada combinação
+    de algoritmo, TTL, semente da topologia e nó de origem.
+
+    Cada repetição busca um recurso sorteado entre os da topologia. As
+    repetições de cada célula são executadas em lotes, em paralelo, e a
+    célula para assim que os seus intervalos de confiança ficam estreitos
+    o suficiente (ver `ExperimentCell.converged`). Os lotes são sorteados
+    e contabilizados em rodadas, na ordem das células, logo, a mesma
+    semente repete exatamente o mesmo experimento, com qualquer qntd.
+    de processos.
+
+    Parameters
+    ----------
+    algorithms : list[str]
+        Os nomes dos algoritmos de busca.
+    ttls : list[Union[int, float]]
+        Os limitadores de 'saltos' das buscas.
+    topology_seeds : list[int]
+        As sementes das topologias.
+    num_start_nodes : int, optional
+        A qntd. de nós de origem sorteados em cada topologia, por
+        padrão 4.
+    topology : Callable[..., dict[str, Any]], optional
+        O gerador das topologias, que recebe a semente, por padrão
+        uma topologia de lei de potência com 1000 nós.
+    confidence : float, optional
+        O nível de confiança dos intervalos, por padrão 0.95.
+    precision : float, optional
+        A meia largura alvo dos intervalos, por padrão 0.05.
+    batch_size : int, optional
+        A qntd. de repetições de cada lote, por padrão 32.
+    min_repetitions : int, optional
+        A qntd. mínima de repetições de cada célula, por padrão 64.
+    max_repetitions : int, optional
+        A qntd. máxima de repetições de cada célula, por padrão 2048.
+    processes : Union[int, None], optional
+        A qntd. de processos, por padrão a qntd. de CPUs.
+    seed : int, optional
+        A semente do experimento, por padrão 0.
+
+    Returns
+    -------
+    list[ExperimentCell]
+        As células do experimento, com as métricas agregadas.
+
+    Raises
+    ------
+    InvalidParam
+        Caso o nível de confiança, a precisão ou o tamanho do lote
+        sejam inválidos.
+    """
+    # Lança uma exceção caso algum parâmetro seja inválido.
+    if not 0 < confidence < 1 or precision <= 0 or batch_size < 1:
+        raise InvalidParam(
+            'O nível de confiança deve estar em (0, 1) e a precisão' +\
+            ' e o tamanho do lote devem ser positivos.'
+        )
+    z: float = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    # Sorteia os nós de origem e lista os recursos de cada topologia.
+    cells: list[ExperimentCell] = []
+    resources: dict[int, list[str]] = {}
+    for topology_seed in topology_seeds:
+        data_info: dict[str, Any] = topology(seed=topology_seed)
+        resources[topology_seed] = sorted({
+            resource
+            for node_resources in data_info['resources'].values()
+            for resource in node_resources
+        })
+        start_nodes: list[str] = Random(f'{seed}:{topology_seed}').sample(
+            sorted(data_info['edges']),
+            min(num_start_nodes, len(data_info['edges']))
+        )
+        cells.extend(
+            ExperimentCell(
+                algorithm=algorithm,
+                ttl=ttl,
+                topology_seed=topology_seed,
+                start_node=start_node
+            )
+            for algorithm, ttl, start_node in product(
+                algorithms, ttls, start_nodes
+            )
+        )
+
+    processes = processes or cpu_count() or 1
+    executor: Union[Executor, None] = ProcessPoolExecutor(
+        max_workers=processes
+    ) if processes > 1 else None
+    try:
+        active: list[int] = list(range(len(cells)))
+        while active:
+            # Sorteia um lote para cada célula ativa.
+            batches: list[tuple] = []
+            for index in active:
+                cell: ExperimentCell = cells[index]
+                rng: Random = Random(f'{seed}:{index}:{cell.batches}')
+                batches.append((
+                    topology,
+                    cell.topology_seed,
+                    cell.algorithm,
+                    cell.ttl,
+                    [
+                        (cell.start_node, rng.choice(
+                            resources[cell.topology_seed]
+                        ))
+                        for _ in range(batch_size)
+                    ],
+                    rng.getrandbits(63)
+                ))
+
+            summaries: list[WorkloadSummary] = list(
+                executor.map(_run_batch, *zip(*batches))
+            ) if executor is not None else [
+                _run_batch(*batch) for batch in batches
+            ]
+
+            # Contabiliza os lotes e mantém apenas as células sem convergência.
+            next_active: list[int] = []
+            for index, summary in zip(active, summaries):
+                cell = cells[index]
+                cell.summary.merge(other=summary)
+                cell.batches += 1
+                repetitions: int = cell.summary.queries
+                if repetitions < max_repetitions and (
+                        repetitions < min_repetitions or
+                        not cell.converged(z=z, precision=precision)
+                    ):
+                    next_active.append(index)
+            active = next_active
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return cells
+
+def save_experiment(
+        file_path: str,
+        cells: list[ExperimentCell],
+        confidence: float = 0.95
+    ) -> None:
+    """Grava as células de um experimento em um arquivo '.npz',
+    uma coluna por campo e uma linha por célula.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo.
+    cells : list[ExperimentCell]
+        As células do experimento.
+    confidence : float, optional
+        O nível de confiança dos intervalos, por padrão 0.95.
+    """
+    z: float = NormalDist().inv_cdf((1 + confidence) / 2)
+    columns: dict[str, list[Any]] = {
+        'algorithm': [cell.algorithm for cell in cells],
+        'ttl': [float(cell.ttl) for cell in cells],
+        'topology_seed': [cell.topology_seed for cell in cells],
+        'start_node': [cell.start_node for cell in cells],
+        'repetitions': [cell.summary.queries for cell in cells],
+        'success_rate': [cell.summary.success_rate for cell in cells],
+        'mean_messages': [cell.summary.mean_messages for cell in cells],
+        'mean_hops': [cell.summary.mean_hops for cell in cells],
+    }
+    for metric, interval in (
+            ('success_rate', ExperimentCell.success_interval),
+            ('mean_messages', ExperimentCell.messages_interval),
+            ('mean_hops', ExperimentCell.hops_interval)
+        ):
+        bounds: list[tuple[float, float]] = [
+            interval(cell, z=z) for cell in cells
+        ]
+        columns[f'{metric}_low'] = [low for low, _ in bounds]
+        columns[f'{metric}_high'] = [high for _, high in bounds]
+    write_npz(file_path=file_path, columns=columns)
@@ -1,8 +1,38 @@
 """Pacote responsável pela criação de topologias e nós;"""
 
 from .network import Network
+from .network import FrozenNode
+from .alias import AliasTable
+from .compact import CompactGraph
+from .ordering import NODE_ORDERS
+from .ordering import node_order
+from .ordering import edge_span
+from .topology import save_topology
+from .delta import TopologyDelta
+from .landmarks import LandmarkIndex
+from .neighborhood import NeighborhoodIndex
+from .generators import power_law_topology
+from .caches import warm_caches
+from .caches import save_caches
+from .caches import load_caches
+from .caches import topology_fingerprint
 
 # Indica o que está disponível para uso no pacote.
 __all__: list[str] = [
     'Network',
+    'FrozenNode',
+    'AliasTable',
+    'CompactGraph',
+    'NODE_ORDERS',
+    'node_order',
+    'edge_span',
+    'save_topology',
+    'TopologyDelta',
+    'LandmarkIndex',
+    'NeighborhoodIndex',
+    'power_law_topology',
+    'warm_caches',
+    'save_caches',
+    'load_caches',
+    'topology_fingerprint',
 ]
@@ -0,0 +1,58 @@
+"""Arquivo responsável pela tabela de alias, usada para sortear,
+em O(1), um elemento de uma distribuição discreta qualquer."""
+
+from typing import Any, Sequence
+
+class AliasTable:
+    """Representa uma tabela de alias (método de Vose).
+
+    Construída em O(n) a partir dos pesos dos elementos, permite
+    sortear um elemento, proporcionalmente ao seu peso, com um
+    único número aleatório.
+    """
+    items: tuple[Any, ...]
+    probabilities: list[float]
+    aliases: list[int]
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]) -> None:
+        self.items = tuple(items)
+        size: int = len(self.items)
+        total_weight: float = sum(weights)
+
+        # Sem pesos positivos, a distribuição é uniforme.
+        scaled: list[float] = [
+            weight * size / total_weight for weight in weights
+        ] if total_weight > 0 else [1.0] * size
+        self.probabilities = [1.0] * size
+        self.aliases = list(range(size))
+
+        small: list[int] = [i for i, p in enumerate(scaled) if p < 1.0]
+        large: list[int] = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, uniform: float) -> Any:
+        """Sorteia um elemento da tabela.
+
+        Parameters
+        ----------
+        uniform : float
+            Um número aleatório uniforme em [0, 1).
+
+        Returns
+        -------
+        Any
+            O elemento sorteado.
+        """
+        scaled: float = uniform * len(self.items)
+        index: int = min(int(scaled), len(self.items) - 1)
+        if scaled - index >= self.probabilities[index]:
+            index = self.aliases[index]
+        return self.items[index]
@@ -0,0 +1,174 @@
+"""Arquivo responsável pelo aquecimento e pela persistência
+dos caches dos nós de uma topologia."""
+
+import json
+
+from hashlib import sha256
+from typing import Any, Union
+
+# Cargas de buscas.
+from searchs import WorkloadSummary
+from searchs import run_workload
+
+# Exceções customizadas.
+from exceptions import InvalidParam
+from exceptions import TopologyMismatch
+
+# * As buscas que atualizam o cache dos nós.
+INFORMED_SEARCH_ALGORITHMS: list[str] = [
+    'informed_flooding',
+    'informed_random_walk',
+]
+
+def topology_fingerprint(network: Any) -> str:
+    """Calcula a impressão digital de uma topologia.
+
+    Considera os nós, suas conexões e seus recursos, pois um
+    cache só é válido se os nós que ele aponta ainda existirem e
+    ainda contiverem os recursos.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+
+    Returns
+    -------
+    str
+        A impressão digital (SHA-256) da topologia.
+    """
+    digest = sha256()
+    for node_id in sorted(network.nodes_by_id):
+        node: Any = network.nodes_by_id[node_id]
+        digest.update(node_id.encode())
+        digest.update(b'|')
+        digest.update(
+            ','.join(sorted(n.node_id for n in node.neighbors)).encode()
+        )
+        digest.update(b'|')
+        digest.update(','.join(sorted(node.resources)).encode())
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+def warm_caches(
+        network: Any,
+        queries: list[tuple[str, str]],
+        algorithm: str = 'informed_flooding',
+        ttl: Union[int, float] = float('inf'),
+        checkpoint: Any = None
+    ) -> WorkloadSummary:
+    """Aquece os caches dos nós, reexecutando uma carga de buscas.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia, que terá os caches dos nós aquecidos.
+    queries : list[tuple[str, str]]
+        A carga de buscas, cada uma composta pelo id do nó de
+        origem e pelo recurso a ser buscado.
+    algorithm : str, optional
+        A busca informada usada no aquecimento, por padrão
+        'informed_flooding'.
+    ttl : Union[int, float], optional
+        O limitador de 'saltos' das buscas, por padrão infinito.
+    checkpoint : Any, optional
+        Os pontos de retomada do aquecimento (`WorkloadCheckpoint`),
+        por padrão nada.
+
+    Returns
+    -------
+    WorkloadSummary
+        As métricas agregadas do aquecimento.
+
+    Raises
+    ------
+    InvalidParam
+        Caso a busca não atualize o cache dos nós.
+    """
+    # Lança uma exceção se a busca não atualizar o cache dos nós.
+    if algorithm not in INFORMED_SEARCH_ALGORITHMS:
+        raise InvalidParam(
+            f'O algoritmo \'{algorithm}\' não atualiza o cache dos nós.'
+        )
+
+    return run_workload(
+        network=network,
+        algorithm=algorithm,
+        queries=queries,
+        ttl=ttl,
+        checkpoint=checkpoint
+    )
+
+def save_caches(network: Any, file_path: str) -> int:
+    """Salva os caches de todos os nós em um arquivo .json,
+    junto da impressão digital da topologia.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    file_path : str
+        O caminho do arquivo a ser salvo.
+
+    Returns
+    -------
+    int
+        A qntd. de nós com cache salvo.
+    """
+    # Ignora as informações que deixaram de valer (ver `Network.apply_delta`).
+    caches: dict[str, dict[str, list[str]]] = {}
+    for node in network.nodes:
+        cache: dict[str, list[str]] = {
+            holder.node_id: sorted(resources & holder.resources)
+            for holder, resources in node.cache.items()
+            if resources & holder.resources
+        }
+        if cache:
+            caches[node.node_id] = cache
+    with open(file=file_path, mode='w', encoding='utf-8') as file:
+        json.dump(
+            obj={
+                'fingerprint': topology_fingerprint(network=network),
+                'caches': caches,
+            },
+            fp=file
+        )
+    return len(caches)
+
+def load_caches(network: Any, file_path: str) -> int:
+    """Carrega os caches salvos para os nós da topologia.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    file_path : str
+        O caminho do arquivo salvo por `save_caches`.
+
+    Returns
+    -------
+    int
+        A qntd. de nós com cache carregado.
+
+    Raises
+    ------
+    TopologyMismatch
+        Caso os caches tenham sido salvos em outra topologia.
+    """
+    with open(file=file_path, mode='r', encoding='utf-8') as file:
+        data: Any = json.load(fp=file)
+
+    # Lança uma exceção se a topologia mudou desde que os caches foram salvos.
+    if data.get('fingerprint') != topology_fingerprint(network=network):
+        raise TopologyMismatch(
+            f'Os caches de {file_path} foram salvos em uma topologia' +\
+            ' diferente da atual.'
+        )
+
+    for node_id, cache in data['caches'].items():
+        node: Any = network.find_node_by_id(node_id=node_id)
+        for holder_id, resources in cache.items():
+            holder: Any = network.find_node_by_id(node_id=holder_id)
+            for resource in resources:
+                node.add_cache(node=holder, resource=resource)
+    return len(data['caches'])
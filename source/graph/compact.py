@@ -0,0 +1,82 @@
+"""Arquivo responsável pela representação compacta, em vetores
+de inteiros, das conexões de uma topologia."""
+
+from array import array
+from typing import Any, Union
+
+class CompactGraph:
+    """Representa as conexões de uma topologia no formato CSR
+    (Compressed Sparse Row).
+
+    Cada nó recebe um índice (a posição em 'nodes') e os vizinhos
+    do nó 'i' são 'targets[offsets[i]:offsets[i + 1]]', permitindo
+    que índices e travessias pesadas usem apenas vetores de
+    inteiros, ao invés dos objetos dos nós.
+    """
+    nodes: list[Any]
+    index: dict[Any, int]
+    offsets: array
+    targets: array
+
+    def __init__(
+            self,
+            network: Any,
+            order: Union[list[Any], None] = None
+        ) -> None:
+        self.nodes = list(order or network.nodes_by_id.values())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.offsets = array('L', [0])
+        self.targets = array('L')
+        for node in self.nodes:
+            self.targets.extend(
+                sorted(self.index[neighbor] for neighbor in node.neighbors)
+            )
+            self.offsets.append(len(self.targets))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def neighbors(self, node: int) -> array:
+        """Informa os índices dos vizinhos de um nó.
+
+        Parameters
+        ----------
+        node : int
+            O índice do nó.
+
+        Returns
+        -------
+        array
+            Os índices dos vizinhos.
+        """
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        """Informa a qntd. de vizinhos de um nó.
+
+        Parameters
+        ----------
+        node : int
+            O índice do nó.
+
+        Returns
+        -------
+        int
+            A qntd. de vizinhos.
+        """
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def adjacency(self) -> list[list[int]]:
+        """Informa os vizinhos de todos os nós como listas, mais
+        rápidas de percorrer em laços Python do que fatias.
+
+        Returns
+        -------
+        list[list[int]]
+            Os índices dos vizinhos de cada nó.
+        """
+        targets: list[int] = self.targets.tolist()
+        offsets: list[int] = self.offsets.tolist()
+        return [
+            targets[offsets[i]:offsets[i + 1]] for i in range(len(self.nodes))
+        ]
@@ -0,0 +1,469 @@
+"""Arquivo responsável pelas alterações incrementais de uma topologia
+(nós, conexões e recursos adicionados e removidos) e pela validação
+delas antes de serem aplicadas (ver `Network.apply_delta`)."""
+
+import re
+
+from itertools import chain
+from collections import deque
+from typing import Any, Iterable, Union
+
+# Exceções.
+from exceptions import NodeIDNotFound
+from exceptions import TooManyNeighbors
+from exceptions import NotEnoughNeighbors
+from exceptions import MissingNodeResources
+from exceptions import MissingNodeNeighbors
+from exceptions import NetworkIsPartitioned
+from exceptions import InvalidTopologyDelta
+
+# * O formato dos ids dos nós adicionados ('n1'...'nN').
+NODE_ID_PATTERN: re.Pattern = re.compile(r'n[1-9][0-9]*')
+
+class TopologyDelta:
+    """Representa as alterações de uma topologia, no formato lido
+    por `read_topology_delta`.
+
+    Remover um nó remove, também, as suas conexões e os seus
+    recursos, e as conexões são bidirecionais, logo, cada uma pode
+    aparecer uma única vez, em qualquer sentido.
+    """
+    add_nodes: list[str]
+    remove_nodes: list[str]
+    add_edges: list[tuple[str, str]]
+    remove_edges: list[tuple[str, str]]
+    add_resources: dict[str, list[str]]
+    remove_resources: dict[str, list[str]]
+
+    def __init__(
+            self,
+            add_nodes: Iterable[str] = (),
+            remove_nodes: Iterable[str] = (),
+            add_edges: Iterable[Iterable[str]] = (),
+            remove_edges: Iterable[Iterable[str]] = (),
+            add_resources: Union[dict[str, Iterable[str]], None] = None,
+            remove_resources: Union[dict[str, Iterable[str]], None] = None
+        ) -> None:
+        self.add_nodes = list(add_nodes)
+        self.remove_nodes = list(remove_nodes)
+        self.add_edges = [tuple(edge) for edge in add_edges]
+        self.remove_edges = [tuple(edge) for edge in remove_edges]
+        self.add_resources = {
+            node_id: list(resources)
+            for node_id, resources in (add_resources or {}).items()
+        }
+        self.remove_resources = {
+            node_id: list(resources)
+            for node_id, resources in (remove_resources or {}).items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'TopologyDelta':
+        """Cria as alterações a partir do conteúdo de um arquivo
+        lido por `read_topology_delta`.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            As alterações, no formato do arquivo.
+
+        Returns
+        -------
+        TopologyDelta
+            As alterações da topologia.
+        """
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Informa as alterações no formato do arquivo (ver
+        `read_topology_delta`), omitindo os campos vazios.
+
+        Returns
+        -------
+        dict[str, Any]
+            As alterações, no formato do arquivo.
+        """
+        data: dict[str, Any] = {
+            'add_nodes': self.add_nodes,
+            'remove_nodes': self.remove_nodes,
+            'add_edges': [list(edge) for edge in self.add_edges],
+            'remove_edges': [list(edge) for edge in self.remove_edges],
+            'add_resources': self.add_resources,
+            'remove_resources': self.remove_resources,
+        }
+        return {field: value for field, value in data.items() if value}
+
+    def __len__(self) -> int:
+        return len(self.add_nodes) + len(self.remove_nodes) +\
+            len(self.add_edges) + len(self.remove_edges) +\
+            sum(map(len, self.add_resources.values())) +\
+            sum(map(len, self.remove_resources.values()))
+
+
+class DeltaPlan:
+    """Representa o efeito das alterações sobre uma topologia,
+    calculado (e validado) sem alterá-la.
+
+    As novas vizinhanças são guardadas apenas para os nós afetados,
+    logo, tanto o cálculo quanto as checagens (ver `check`) custam
+    proporcionalmente ao tamanho das alterações, e não da topologia.
+    """
+    network: Any
+    removed_nodes: set[str]
+    added_nodes: list[str]
+    removed_neighbors: dict[str, set[str]]
+    added_neighbors: dict[str, set[str]]
+    removed_resources: dict[str, set[str]]
+    added_resources: dict[str, set[str]]
+
+    def __init__(self, network: Any, delta: TopologyDelta) -> None:
+        """Valida as alterações, calculando o seu efeito.
+
+        Parameters
+        ----------
+        network : Any
+            A topologia.
+        delta : TopologyDelta
+            As alterações da topologia.
+
+        Raises
+        ------
+        NodeIDNotFound
+            Caso algum nó alterado não exista na topologia.
+        InvalidTopologyDelta
+            Caso alguma alteração não possa ser aplicada.
+        MissingNodeResources
+            Caso nenhum recurso seja adicionado a algum nó.
+        """
+        self.network = network
+        self.removed_nodes = set()
+        self.added_nodes = []
+        self.__added: set[str] = set()
+        # Os vizinhos perdidos e ganhos, por nó mantido ou adicionado.
+        self.removed_neighbors = {}
+        self.added_neighbors = {}
+        self.removed_resources = {}
+        self.added_resources = {}
+        nodes_by_id: dict[str, Any] = network.nodes_by_id
+
+        for node_id in delta.remove_nodes:
+            self.__require(node_id=node_id)
+            # Lança uma exceção se o nó for removido mais de uma vez.
+            if node_id in self.removed_nodes:
+                raise InvalidTopologyDelta(
+                    f'O nó {node_id} é removido mais de uma vez.'
+                )
+            self.removed_nodes.add(node_id)
+
+        for node_id in delta.add_nodes:
+            # Lança uma exceção se o id não seguir o formato dos nós.
+            if not isinstance(node_id, str) or \
+                    not NODE_ID_PATTERN.fullmatch(node_id):
+                raise InvalidTopologyDelta(
+                    f'O id \'{node_id}\' do nó adicionado não segue' +\
+                    ' o formato \'n1\'...\'nN\'.'
+                )
+            # Lança uma exceção se o nó já existir (ou for repetido).
+            if node_id in nodes_by_id or node_id in self.__added:
+                raise InvalidTopologyDelta(
+                    f'O nó {node_id} adicionado já existe na topologia.'
+                )
+            self.__added.add(node_id)
+            self.added_nodes.append(node_id)
+
+        removed_edges: set[frozenset[str]] = set()
+        for node_id, neighbor_id in delta.remove_edges:
+            edge: frozenset[str] = self.__edge(
+                node_id=node_id,
+                neighbor_id=neighbor_id
+            )
+            self.__require(node_id=node_id)
+            self.__require(node_id=neighbor_id)
+            # Lança uma exceção se a conexão não existir (ou for repetida).
+            if nodes_by_id[neighbor_id] not in \
+                    nodes_by_id[node_id].neighbors or edge in removed_edges:
+                raise InvalidTopologyDelta(
+                    f'A conexão entre {node_id} e {neighbor_id} removida' +\
+                    ' não existe na topologia.'
+                )
+            removed_edges.add(edge)
+            self.__link(self.removed_neighbors, node_id, neighbor_id)
+
+        # As conexões dos nós removidos também são removidas.
+        for node_id in self.removed_nodes:
+            for neighbor in nodes_by_id[node_id].neighbors:
+                if neighbor.node_id not in self.removed_nodes:
+                    self.removed_neighbors.setdefault(
+                        neighbor.node_id, set()
+                    ).add(node_id)
+
+        added_edges: set[frozenset[str]] = set()
+        for node_id, neighbor_id in delta.add_edges:
+            edge = self.__edge(node_id=node_id, neighbor_id=neighbor_id)
+            self.__require(node_id=node_id, after=True)
+            self.__require(node_id=neighbor_id, after=True)
+            # Lança uma exceção se a conexão já existir (ou for repetida).
+            if edge in added_edges or (
+                    edge not in removed_edges and
+                    node_id in nodes_by_id and neighbor_id in nodes_by_id and
+                    nodes_by_id[neighbor_id] in nodes_by_id[node_id].neighbors
+                ):
+                raise InvalidTopologyDelta(
+                    f'A conexão entre {node_id} e {neighbor_id} adicionada' +\
+                    ' já existe na topologia.'
+                )
+            added_edges.add(edge)
+            self.__link(self.added_neighbors, node_id, neighbor_id)
+
+        for node_id, resources in delta.remove_resources.items():
+            self.__require(node_id=node_id)
+            for resource in resources:
+                # Lança uma exceção se o nó não contiver o recurso.
+                if resource not in nodes_by_id[node_id].resources:
+                    raise InvalidTopologyDelta(
+                        f'O recurso {resource} removido não pertence' +\
+                        f' ao nó {node_id}.'
+                    )
+            if node_id not in self.removed_nodes:
+                self.removed_resources[node_id] = set(resources)
+
+        for node_id, resources in delta.add_resources.items():
+            self.__require(node_id=node_id, after=True)
+            # Lança uma exceção se não houver recursos para o nó.
+            if len(resources) == 0:
+                raise MissingNodeResources(
+                    f'Durante a adição de recursos ao Nó {node_id},' +\
+                    ' nenhum recurso foi fornecido.'
+                )
+            self.added_resources[node_id] = set(resources)
+
+    @staticmethod
+    def __edge(node_id: str, neighbor_id: str) -> frozenset[str]:
+        """Informa a conexão (sem sentido) entre dois nós.
+
+        Raises
+        ------
+        InvalidTopologyDelta
+            Caso a conexão seja de um nó com ele mesmo.
+        """
+        # Lança uma exceção se a conexão for de um nó com ele mesmo.
+        if node_id == neighbor_id:
+            raise InvalidTopologyDelta(
+                f'A conexão do nó {node_id} com ele mesmo é inválida.'
+            )
+        return frozenset((node_id, neighbor_id))
+
+    def __link(
+            self,
+            neighbors: dict[str, set[str]],
+            node_id: str,
+            neighbor_id: str
+        ) -> None:
+        """Registra a conexão nos dois nós que continuam na topologia."""
+        if node_id not in self.removed_nodes:
+            neighbors.setdefault(node_id, set()).add(neighbor_id)
+        if neighbor_id not in self.removed_nodes:
+            neighbors.setdefault(neighbor_id, set()).add(node_id)
+
+    def __require(self, node_id: str, after: bool = False) -> None:
+        """Lança uma exceção caso o nó não exista na topologia (ou,
+        com 'after', após as alterações).
+
+        Raises
+        ------
+        NodeIDNotFound
+            Caso o nó não seja encontrado pelo id fornecido.
+        """
+        if after:
+            exists: bool = node_id in self.__added or (
+                node_id in self.network.nodes_by_id and
+                node_id not in self.removed_nodes
+            )
+        else:
+            exists = node_id in self.network.nodes_by_id
+        if not exists:
+            raise NodeIDNotFound(
+                f'O nó de id {node_id},' +\
+                ' não foi encontrado na topologia.'
+            )
+
+    def affected_nodes(self) -> set[str]:
+        """Informa os nós mantidos, ou adicionados, cujos vizinhos
+        mudam.
+
+        Returns
+        -------
+        set[str]
+            Os ids dos nós afetados.
+        """
+        return set(self.removed_neighbors) | set(self.added_neighbors) |\
+            set(self.added_nodes)
+
+    def neighbors(self, node_id: str) -> Iterable[str]:
+        """Informa os vizinhos de um nó após as alterações.
+
+        Parameters
+        ----------
+        node_id : str
+            O id de um nó mantido ou adicionado.
+
+        Returns
+        -------
+        Iterable[str]
+            Os ids dos vizinhos.
+        """
+        added: set[str] = self.added_neighbors.get(node_id, set())
+        if (node := self.network.nodes_by_id.get(node_id)) is None:
+            return added
+        if (lost := self.removed_neighbors.get(node_id)) is None:
+            current: Iterable[str] = (
+                neighbor.node_id for neighbor in node.neighbors
+            )
+        else:
+            current = (
+                neighbor.node_id for neighbor in node.neighbors
+                if neighbor.node_id not in lost
+            )
+        return chain(current, added)
+
+    def degree(self, node_id: str) -> int:
+        """Informa a qntd. de vizinhos de um nó após as alterações.
+
+        Parameters
+        ----------
+        node_id : str
+            O id de um nó mantido ou adicionado.
+
+        Returns
+        -------
+        int
+            A qntd. de vizinhos.
+        """
+        node: Any = self.network.nodes_by_id.get(node_id)
+        return (0 if node is None else len(node.neighbors)) -\
+            len(self.removed_neighbors.get(node_id, ())) +\
+            len(self.added_neighbors.get(node_id, ()))
+
+    def check(self) -> None:
+        """Checa, apenas nos nós afetados, os limites de vizinhos e a
+        conectividade da topologia após as alterações (ver
+        `Network.check_network`).
+
+        Raises
+        ------
+        MissingNodeNeighbors
+            Caso algum nó fique sem vizinhos.
+        NotEnoughNeighbors
+            Caso algum nó fique sem vizinhos o suficiente.
+        TooManyNeighbors
+            Caso algum nó fique com muitos vizinhos.
+        NetworkIsPartitioned
+            Caso a topologia fique particionada.
+        """
+        for node_id in sorted(self.affected_nodes()):
+            degree: int = self.degree(node_id=node_id)
+            # Lança uma exceção se o nó ficar sem vizinhos.
+            if degree == 0:
+                raise MissingNodeNeighbors(
+                    f'Após as alterações, o Nó {node_id},' +\
+                    ' não possui nenhum vizinho.'
+                )
+
+            # Lança uma exceção se a qntd. de vizinhos não for suficiente.
+            if degree < self.network.min_neighbors:
+                raise NotEnoughNeighbors(
+                    f'Após as alterações, o Nó {node_id},' +\
+                    ' não possui vizinhos suficientes,' +\
+                    f' possuindo {degree} vizinhos,' +\
+                    ' o limite definido no arquivo de entrada' +\
+                    f' é de {self.network.min_neighbors}.'
+                )
+
+            # Lança uma exceção se a qntd. de vizinhos for muito grande.
+            if degree > self.network.max_neighbors:
+                raise TooManyNeighbors(
+                    f'Após as alterações, o Nó {node_id},' +\
+                    ' possui muitos vizinhos,' +\
+                    f' possuindo {degree} vizinhos,' +\
+                    ' o limite definido no arquivo de entrada' +\
+                    f' é de {self.network.max_neighbors}.'
+                )
+
+        # Lança uma exceção se a topologia ficar particionada.
+        if not self.__connected():
+            raise NetworkIsPartitioned(
+                'Após as alterações, foi notado a existência de' +\
+                ' particionamento na topologia.'
+            )
+
+    def __connected(self) -> bool:
+        """Verifica se os nós que perderam vizinhos e os nós
+        adicionados continuam (ou passam a estar) conectados ao
+        restante da topologia.
+
+        Parte uma busca em largura de cada um desses nós, avançando
+        as buscas alternadamente e unindo duas buscas quando se
+        encontram. Se alguma terminar antes de todas se unirem, os
+        nós que ela visitou estão isolados do restante. Como a menor
+        das partes termina primeiro, a checagem percorre apenas os
+        arredores das alterações, e não a topologia inteira.
+
+        Returns
+        -------
+        bool
+            Se a topologia continua conectada.
+        """
+        sources: list[str] = sorted(self.removed_neighbors)
+        if self.added_nodes:
+            sources += self.added_nodes
+            # Um nó anterior às alterações, para que um grupo de nós
+            # adicionados, conectados apenas entre si, seja detectado.
+            sources.append(next(
+                (node_id for node_id in self.network.nodes_by_id
+                 if node_id not in self.removed_nodes),
+                self.added_nodes[0]
+            ))
+        if len(set(sources)) <= 1:
+            return True
+
+        owners: dict[str, int] = {}
+        parents: list[int] = []
+        frontiers: list[deque[str]] = []
+        for source in sources:
+            if source not in owners:
+                owners[source] = len(parents)
+                parents.append(len(parents))
+                frontiers.append(deque([source]))
+
+        def find(group: int) -> int:
+            while parents[group] != group:
+                parents[group] = parents[parents[group]]
+                group = parents[group]
+            return group
+
+        groups: int = len(parents)
+        while groups > 1:
+            for group in [g for g in range(len(parents)) if parents[g] == g]:
+                if groups == 1:
+                    break
+                if parents[group] != group:
+                    continue
+                frontier: deque[str] = frontiers[group]
+                if not frontier:
+                    return False
+                for neighbor_id in self.neighbors(node_id=frontier.popleft()):
+                    if (owner := owners.get(neighbor_id)) is None:
+                        owners[neighbor_id] = group
+                        frontier.append(neighbor_id)
+                        continue
+                    if (other := find(owner)) == group:
+                        continue
+                    # Une as buscas, mantendo a maior das filas.
+                    if len(frontiers[other]) > len(frontier):
+                        group, other = other, group
+                        frontier = frontiers[group]
+                    frontier.extend(frontiers[other])
+                    frontiers[other] = deque()
+                    parents[other] = group
+                    groups -= 1
+        return True
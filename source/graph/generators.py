@@ -0,0 +1,87 @@
+"""Arquivo responsável pela geração de topologias sintéticas,
+no mesmo formato do arquivo de entrada."""
+
+from random import Random
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+def power_law_topology(
+        num_nodes: int,
+        edges_per_node: int = 2,
+        num_resources: Union[int, None] = None,
+        seed: Union[int, None] = None
+    ) -> dict[str, Any]:
+    """Gera uma topologia cujo grau dos nós segue uma lei de
+    potência (modelo de Barabási-Albert).
+
+    Cada novo nó se conecta a 'edges_per_node' nós já existentes,
+    escolhidos proporcionalmente aos seus graus, e os recursos
+    ('r1'...'rR') são distribuídos aleatoriamente entre os nós.
+
+    Parameters
+    ----------
+    num_nodes : int
+        A qntd. de nós da topologia.
+    edges_per_node : int, optional
+        A qntd. de conexões de cada novo nó, por padrão 2.
+    num_resources : Union[int, None], optional
+        A qntd. de recursos, por padrão um por nó.
+    seed : Union[int, None], optional
+        A semente da geração, por padrão nada.
+
+    Returns
+    -------
+    dict[str, Any]
+        A topologia, no formato do arquivo de entrada.
+
+    Raises
+    ------
+    InvalidParam
+        Caso não haja nós o suficiente para as conexões.
+    """
+    # Lança uma exceção se não houver nós o suficiente para as conexões.
+    if edges_per_node < 1 or num_nodes <= edges_per_node:
+        raise InvalidParam(
+            f'Não é possível gerar uma topologia com {num_nodes} nós' +\
+            f' e {edges_per_node} conexões por nó.'
+        )
+
+    rng: Random = Random(seed)
+    edges: dict[str, list[str]] = {f'n{i}': [] for i in range(1, num_nodes + 1)}
+    degrees: list[int] = [0] * (num_nodes + 1)
+    # Cada nó aparece uma vez para cada conexão que possui, logo, sortear
+    # dessa lista é sortear proporcionalmente ao grau.
+    endpoints: list[int] = []
+
+    # Os primeiros nós formam um grafo completo.
+    for node in range(1, edges_per_node + 2):
+        for neighbor in range(node + 1, edges_per_node + 2):
+            edges[f'n{node}'].append(f'n{neighbor}')
+            endpoints += [node, neighbor]
+            degrees[node] += 1
+            degrees[neighbor] += 1
+
+    for node in range(edges_per_node + 2, num_nodes + 1):
+        targets: set[int] = set()
+        while len(targets) < edges_per_node:
+            targets.add(rng.choice(endpoints))
+        for target in targets:
+            edges[f'n{node}'].append(f'n{target}')
+            endpoints += [node, target]
+            degrees[node] += 1
+            degrees[target] += 1
+
+    resources: dict[str, list[str]] = {}
+    for resource in range(1, (num_resources or num_nodes) + 1):
+        holder: str = f'n{rng.randint(1, num_nodes)}'
+        resources.setdefault(holder, []).append(f'r{resource}')
+
+    return {
+        'num_nodes': num_nodes,
+        'min_neighbors': edges_per_node,
+        'max_neighbors': max(degrees),
+        'resources': resources,
+        'edges': edges,
+    }
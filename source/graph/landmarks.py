@@ -0,0 +1,395 @@
+"""Arquivo responsável pelo índice de distâncias por marcos
+(landmarks), usado para medir a qualidade dos caminhos encontrados
+pelas buscas sem uma busca em largura completa por consulta."""
+
+from os import cpu_count
+from array import array
+from random import Random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+from .compact import CompactGraph
+
+# * As estratégias de escolha dos marcos.
+LANDMARK_STRATEGIES: set[str] = {
+    'degree',
+    'random',
+}
+
+# * A qntd. mínima de nós para calcular as distâncias em paralelo, já
+# * que, abaixo dela, iniciar os processos custa mais do que as buscas.
+PARALLEL_MIN_NODES: int = 20_000
+
+# * Os vizinhos de cada nó, nos processos que calculam as distâncias.
+_worker_adjacency: list[list[int]] = []
+
+def _bfs(adjacency: list[list[int]], sources: list[int]) -> array:
+    """Calcula a distância, em 'saltos', de cada nó até a origem
+    mais próxima, com uma busca em largura.
+
+    Parameters
+    ----------
+    adjacency : list[list[int]]
+        Os índices dos vizinhos de cada nó.
+    sources : list[int]
+        Os índices dos nós de origem.
+
+    Returns
+    -------
+    array
+        As distâncias, com 8 bits por nó ('B') quando cabem, ou 16
+        bits ('H'), e o maior valor do tipo nos nós não alcançáveis.
+    """
+    distances: list[int] = [-1] * len(adjacency)
+    frontier: list[int] = []
+    for source in sources:
+        if distances[source] < 0:
+            distances[source] = 0
+            frontier.append(source)
+
+    # Percorre a topologia nível a nível.
+    depth: int = 0
+    while frontier:
+        depth += 1
+        next_frontier: list[int] = []
+        for node in frontier:
+            for neighbor in adjacency[node]:
+                if distances[neighbor] < 0:
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    typecode: str = 'B' if depth < 0xFF else 'H'
+    unreachable: int = 0xFF if typecode == 'B' else 0xFFFF
+    return array(
+        typecode,
+        [unreachable if d < 0 else d for d in distances]
+    )
+
+def _init_worker(adjacency: list[list[int]]) -> None:
+    """Recebe os vizinhos de cada nó, uma única vez por processo."""
+    global _worker_adjacency
+    _worker_adjacency = adjacency
+
+def _landmark_bfs(landmark: int) -> array:
+    """Calcula as distâncias até um marco, em um processo à parte."""
+    return _bfs(adjacency=_worker_adjacency, sources=[landmark])
+
+
+class LandmarkIndex:
+    """Representa as distâncias de todos os nós até alguns marcos.
+
+    Pela desigualdade triangular, para quaisquer nós 'u' e 'v' e
+    marco 'l', |d(u, l) - d(v, l)| <= d(u, v) <= d(u, l) + d(l, v),
+    logo, as distâncias até 'k' marcos dão limites para a distância
+    entre quaisquer dois nós em O(k). Para os recursos, guarda-se, uma
+    única vez por recurso, a menor e a maior distância de cada marco
+    até os nós que o contêm, logo, os limites até o mais próximo
+    deles também custam O(k), independente da qntd. de réplicas.
+    Quando os limites não coincidem, a distância exata até o recurso
+    é obtida com uma busca em largura a partir do nó, interrompida no
+    primeiro nó que o contém ou na profundidade do limite superior.
+    """
+    graph: CompactGraph
+    landmarks: list[int]
+    distances: list[array]
+
+    def __init__(
+            self,
+            network: Any,
+            num_landmarks: int = 16,
+            strategy: str = 'degree',
+            seed: Union[int, None] = None,
+            processes: Union[int, None] = None
+        ) -> None:
+        # Lança uma exceção ao tentar uma estratégia inválida.
+        if strategy not in LANDMARK_STRATEGIES:
+            raise InvalidParam(
+                f'A estratégia de escolha dos marcos \'{strategy}\'' +\
+                ' fornecida é inválida.'
+            )
+
+        self.graph = CompactGraph(network=network)
+        self.__adjacency: list[list[int]] = self.graph.adjacency()
+
+        # Os nós de maior grau ficam em muitos caminhos mínimos,
+        # dando limites mais justos nas topologias de lei de potência.
+        size: int = len(self.graph)
+        num_landmarks = min(num_landmarks, size)
+        if strategy == 'degree':
+            self.landmarks = sorted(
+                range(size),
+                key=lambda i: (-self.graph.degree(node=i), i)
+            )[:num_landmarks]
+        else:
+            self.landmarks = Random(seed).sample(range(size), num_landmarks)
+
+        # Calcula as distâncias até cada marco em paralelo, nas
+        # topologias grandes o bastante.
+        if processes is None:
+            processes = (cpu_count() or 1) if size >= PARALLEL_MIN_NODES else 1
+        processes = min(processes, num_landmarks)
+        if processes > 1:
+            with ProcessPoolExecutor(
+                    max_workers=processes,
+                    initializer=_init_worker,
+                    initargs=(self.__adjacency,)
+                ) as executor:
+                self.distances = list(
+                    executor.map(_landmark_bfs, self.landmarks)
+                )
+        else:
+            self.distances = [
+                _bfs(adjacency=self.__adjacency, sources=[landmark])
+                for landmark in self.landmarks
+            ]
+
+        # Os nós que contêm cada recurso e a menor e a maior distância
+        # de cada marco até eles.
+        self.__holders: Union[dict[str, list[int]], None] = None
+        self.__resource_ranges: dict[str, tuple[list[int], list[int]]] = {}
+
+    @staticmethod
+    def __unreachable(distances: array) -> int:
+        """Informa o valor usado nos nós não alcançáveis."""
+        return 0xFF if distances.typecode == 'B' else 0xFFFF
+
+    def __vector(self, node: int) -> list[int]:
+        """Informa as distâncias de um nó até cada marco (-1 nos
+        marcos não alcançáveis)."""
+        return [
+            -1 if (d := distances[node]) == self.__unreachable(distances)
+            else d
+            for distances in self.distances
+        ]
+
+    @staticmethod
+    def __pair_bounds(
+            source: list[int],
+            target: list[int]
+        ) -> tuple[float, float]:
+        """Calcula os limites da distância entre dois nós, a partir
+        das distâncias de ambos até os marcos."""
+        lower: float = 0
+        upper: float = float('inf')
+        for d_source, d_target in zip(source, target):
+            if d_source < 0 and d_target < 0:
+                continue
+            # Apenas um dos nós alcança o marco: não há caminho entre eles.
+            if d_source < 0 or d_target < 0:
+                return float('inf'), float('inf')
+            lower = max(lower, abs(d_source - d_target))
+            upper = min(upper, d_source + d_target)
+        return lower, upper
+
+    def bounds(self, source: Any, target: Any) -> tuple[float, float]:
+        """Informa os limites da distância, em 'saltos', entre dois nós.
+
+        Parameters
+        ----------
+        source : Any
+            Um nó da topologia.
+        target : Any
+            Outro nó da topologia.
+
+        Returns
+        -------
+        tuple[float, float]
+            Os limites inferior e superior (infinito, caso nenhum
+            marco alcance ambos os nós).
+        """
+        return self.__pair_bounds(
+            source=self.__vector(node=self.graph.index[source]),
+            target=self.__vector(node=self.graph.index[target])
+        )
+
+    def distance(self, source: Any, target: Any) -> float:
+        """Informa a distância exata, em 'saltos', entre dois nós.
+
+        Parameters
+        ----------
+        source : Any
+            Um nó da topologia.
+        target : Any
+            Outro nó da topologia.
+
+        Returns
+        -------
+        float
+            A distância, ou infinito, caso não haja caminho.
+        """
+        lower, upper = self.bounds(source=source, target=target)
+        if lower == upper:
+            return lower
+        distances: array = _bfs(
+            adjacency=self.__adjacency,
+            sources=[self.graph.index[source]]
+        )
+        d: int = distances[self.graph.index[target]]
+        return float('inf') if d == self.__unreachable(distances) else d
+
+    def __holders_of(self, resource: str) -> list[int]:
+        """Informa os índices dos nós que contêm um recurso."""
+        if self.__holders is None:
+            self.__holders = {}
+            for i, node in enumerate(self.graph.nodes):
+                for node_resource in node.resources:
+                    self.__holders.setdefault(node_resource, []).append(i)
+        return self.__holders.get(resource, [])
+
+    def __ranges_of(self, resource: str) -> tuple[list[int], list[int]]:
+        """Informa, para cada marco, a menor e a maior distância até
+        os nós que contêm um recurso (-1 caso o marco não alcance
+        nenhum deles), calculadas na primeira consulta do recurso."""
+        if (ranges := self.__resource_ranges.get(resource)) is None:
+            nearest: list[int] = []
+            farthest: list[int] = []
+            holders: list[int] = self.__holders_of(resource=resource)
+            for distances in self.distances:
+                unreachable: int = self.__unreachable(distances)
+                reachable: list[int] = [
+                    d for holder in holders
+                    if (d := distances[holder]) != unreachable
+                ]
+                nearest.append(min(reachable, default=-1))
+                farthest.append(max(reachable, default=-1))
+            ranges = self.__resource_ranges[resource] = (nearest, farthest)
+        return ranges
+
+    def nearest_bounds(self, node: Any, resource: str) -> tuple[float, float]:
+        """Informa os limites da distância de um nó até o nó mais
+        próximo que contém um recurso, em O(k).
+
+        Para o marco 'l' e os nós 'H' com o recurso, d(u, H) <=
+        d(u, l) + min d(l, H) e d(u, H) >= max(min d(l, H) - d(u, l),
+        d(u, l) - max d(l, H)); o limite superior é o mesmo de
+        comparar o nó com cada réplica, e o inferior, com várias
+        réplicas, pode ser menos justo.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem.
+        resource : str
+            O recurso buscado.
+
+        Returns
+        -------
+        tuple[float, float]
+            Os limites inferior e superior (infinito, caso nenhum
+            nó contenha o recurso).
+        """
+        if not self.__holders_of(resource=resource):
+            return float('inf'), float('inf')
+
+        source: list[int] = self.__vector(node=self.graph.index[node])
+        nearest, farthest = self.__ranges_of(resource=resource)
+        lower: float = 0
+        upper: float = float('inf')
+        for d_source, d_nearest, d_farthest in zip(source, nearest, farthest):
+            if d_source < 0:
+                continue
+            # O marco alcança o nó, mas nenhuma réplica: não há caminho.
+            if d_nearest < 0:
+                return float('inf'), float('inf')
+            lower = max(lower, d_nearest - d_source, d_source - d_farthest)
+            upper = min(upper, d_source + d_nearest)
+        return lower, upper
+
+    def nearest_distance(
+            self,
+            node: Any,
+            resource: str,
+            limit: Union[int, float] = float('inf')
+        ) -> float:
+        """Informa a distância exata de um nó até o nó mais próximo
+        que contém um recurso, isto é, o caminho mínimo possível de
+        uma busca.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem.
+        resource : str
+            O recurso buscado.
+        limit : Union[int, float], optional
+            A distância a partir da qual o valor exato é dispensável,
+            por padrão infinito.
+
+        Returns
+        -------
+        float
+            A distância, limitada a 'limit', ou infinito, caso o
+            recurso não seja alcançável.
+        """
+        lower, upper = self.nearest_bounds(node=node, resource=resource)
+        if lower >= limit:
+            return limit
+        if lower == upper:
+            return lower
+
+        # Busca em largura a partir do nó, até o primeiro nó com o
+        # recurso; não encontrá-lo antes de 'depth' fixa a distância.
+        depth: Union[int, float] = min(upper, limit)
+        holders: set[int] = set(self.__holders_of(resource=resource))
+        source: int = self.graph.index[node]
+        if source in holders:
+            return 0
+        visited: set[int] = {source}
+        frontier: list[int] = [source]
+        distance: int = 0
+        while frontier and distance + 1 < depth:
+            distance += 1
+            next_frontier: list[int] = []
+            for current in frontier:
+                for neighbor in self.__adjacency[current]:
+                    if neighbor in holders:
+                        return distance
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return depth
+
+    def stretch(self, result: Any) -> Union[float, None]:
+        """Calcula o estiramento do caminho encontrado por uma busca,
+        isto é, a razão entre a sua qntd. de 'saltos' e a do caminho
+        mínimo até o recurso.
+
+        Como as buscas informadas saltam direto para o nó do cache,
+        o estiramento delas pode ser menor do que 1.
+
+        Parameters
+        ----------
+        result : Any
+            O resultado (`SearchResult`) de uma busca.
+
+        Returns
+        -------
+        Union[float, None]
+            O estiramento, ou nada, caso o recurso não tenha sido
+            encontrado.
+        """
+        if not result.found:
+            return None
+        # Um caminho sem saltos pelo cache tem ao menos a distância
+        # mínima, logo, basta saber se ela é menor do que ele.
+        walked: bool = all(
+            self.graph.index[target] in self.__adjacency[self.graph.index[node]]
+            for node, target in zip(result.path, result.path[1:])
+        )
+        optimal: float = self.nearest_distance(
+            node=result.path[0],
+            resource=result.resource,
+            limit=result.hops if walked else float('inf')
+        )
+        return result.hops / optimal if optimal > 0 else 1.0
+
+    def invalidate_resources(self) -> None:
+        """Descarta os nós com cada recurso e as distâncias até
+        eles, após a mudança dos recursos da topologia."""
+        self.__holders = None
+        self.__resource_ranges.clear()
@@ -0,0 +1,292 @@
+"""Arquivo responsável pela estimativa da função de vizinhança
+de uma topologia (HyperANF), usada para prever o custo de uma
+busca por inundação antes de executá-la."""
+
+from array import array
+from math import log
+from math import sqrt
+from typing import Any, Union
+
+from .compact import CompactGraph
+
+# * Máscara de 64 bits.
+_MASK_64: int = (1 << 64) - 1
+
+# * A qntd. (com a margem) de mensagens até a qual a previsão é exata.
+EXACT_MESSAGES_LIMIT: int = 10_000
+
+# * A margem da previsão, em erros padrão do HyperLogLog.
+ERROR_MARGIN: float = 3.0
+
+def _splitmix64(value: int) -> int:
+    """Embaralha os bits de um inteiro (SplitMix64), servindo
+    de função de hash para os contadores HyperLogLog."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+class NeighborhoodIndex:
+    """Representa a função de vizinhança aproximada de uma topologia.
+
+    Cada nó recebe um contador HyperLogLog com 2^'log2_registers'
+    registradores de 8 bits, empacotados em um único inteiro para
+    que a união de dois contadores (máximo registrador a registrador)
+    seja feita com poucas operações de bits (SWAR). A cada passada
+    linear sobre as conexões, o contador de um nó é unido aos
+    contadores dos vizinhos, passando a estimar quantos nós estão a
+    até 'h' saltos dele (ANF/HyperANF). Um segundo contador, em que
+    cada nó é inserido uma vez por vizinho, estima a soma dos graus
+    desses nós, isto é, a qntd. de mensagens de uma inundação.
+    """
+    graph: CompactGraph
+    log2_registers: int
+    node_counts: list[array]
+    message_counts: list[array]
+
+    def __init__(
+            self,
+            network: Any,
+            log2_registers: int = 6,
+            max_h: Union[int, None] = None
+        ) -> None:
+        self.graph = CompactGraph(network=network)
+        self.log2_registers = log2_registers
+        self.node_counts = []
+        self.message_counts = []
+
+        # O bit mais alto de cada registrador, usado como 'guarda' no SWAR.
+        high_bits: int = int.from_bytes(
+            b'\x80' * (1 << log2_registers), 'little'
+        )
+        self.__inverse_powers: list[float] = [
+            2.0 ** -rank for rank in range(256)
+        ]
+
+        size: int = len(self.graph)
+        nodes: list[int] = [
+            self.__counter(keys=[i]) for i in range(size)
+        ]
+        messages: list[int] = [
+            self.__counter(
+                keys=[(i << 32) | k for k in range(self.graph.degree(node=i))]
+            )
+            for i in range(size)
+        ]
+        adjacency: list[list[int]] = self.graph.adjacency()
+
+        while True:
+            self.node_counts.append(
+                array('f', map(self.__estimate, nodes))
+            )
+            self.message_counts.append(
+                array('f', map(self.__estimate, messages))
+            )
+            if max_h is not None and len(self.node_counts) > max_h:
+                break
+
+            # Une o contador de cada nó aos contadores dos vizinhos,
+            # mantendo o maior valor de cada registrador (SWAR): como os
+            # registradores nunca usam o bit mais alto, subtrair o outro
+            # contador com esse bit ligado não propaga 'empréstimos', e o
+            # bit continua ligado apenas onde o atual é maior ou igual.
+            changed: bool = False
+            next_nodes: list[int] = list(nodes)
+            next_messages: list[int] = list(messages)
+            for i, neighbors in enumerate(adjacency):
+                node_counter: int = nodes[i]
+                message_counter: int = messages[i]
+                for neighbor in neighbors:
+                    other: int = nodes[neighbor]
+                    greater: int = \
+                        (((node_counter | high_bits) - other) & high_bits) >> 7
+                    node_counter = other ^ \
+                        ((node_counter ^ other) & (greater * 0xFF))
+                    other = messages[neighbor]
+                    greater = \
+                        (((message_counter | high_bits) - other) & high_bits) >> 7
+                    message_counter = other ^ \
+                        ((message_counter ^ other) & (greater * 0xFF))
+                if node_counter != nodes[i] or message_counter != messages[i]:
+                    changed = True
+                next_nodes[i] = node_counter
+                next_messages[i] = message_counter
+            if not changed:
+                break
+            nodes, messages = next_nodes, next_messages
+
+    def __counter(self, keys: list[int]) -> int:
+        """Cria um contador HyperLogLog com os elementos fornecidos.
+
+        Parameters
+        ----------
+        keys : list[int]
+            Os elementos a serem contados.
+
+        Returns
+        -------
+        int
+            Os registradores do contador, empacotados em um inteiro.
+        """
+        bits: int = 64 - self.log2_registers
+        registers: bytearray = bytearray(1 << self.log2_registers)
+        for key in keys:
+            value: int = _splitmix64(key)
+            register: int = value & (len(registers) - 1)
+            rank: int = bits - (value >> self.log2_registers).bit_length() + 1
+            registers[register] = max(registers[register], rank)
+        return int.from_bytes(registers, 'little')
+
+    def __estimate(self, counter: int) -> float:
+        """Estima a cardinalidade de um contador HyperLogLog.
+
+        Parameters
+        ----------
+        counter : int
+            Os registradores do contador, empacotados em um inteiro.
+
+        Returns
+        -------
+        float
+            A qntd. estimada de elementos distintos.
+        """
+        size: int = 1 << self.log2_registers
+        registers: bytes = counter.to_bytes(size, 'little')
+        alpha: float = {16: 0.673, 32: 0.697, 64: 0.709}.get(
+            size, 0.7213 / (1 + 1.079 / size)
+        )
+        estimate: float = alpha * size * size / sum(
+            map(self.__inverse_powers.__getitem__, registers)
+        )
+        # Correção para cardinalidades pequenas (contagem linear).
+        if estimate <= 2.5 * size and (zeros := registers.count(0)):
+            estimate = size * log(size / zeros)
+        return estimate
+
+    @property
+    def diameter(self) -> int:
+        """O diâmetro aproximado da topologia, isto é, a qntd. de
+        passadas até que nenhum contador mudasse (um limite inferior,
+        já que um contador pode não mudar ao receber poucos nós)."""
+        return len(self.node_counts) - 1
+
+    def reachable(self, node: Any, h: Union[int, float]) -> float:
+        """Estima quantos nós estão a até 'h' saltos de um nó.
+
+        Parameters
+        ----------
+        node : Any
+            Um nó qualquer da topologia.
+        h : Union[int, float]
+            A qntd. de saltos.
+
+        Returns
+        -------
+        float
+            A qntd. estimada de nós alcançáveis.
+        """
+        h = min(h, self.diameter)
+        return self.node_counts[int(h)][self.graph.index[node]]
+
+    def predict_messages(self, node: Any, ttl: Union[int, float]) -> float:
+        """Prevê a qntd. máxima de mensagens de uma busca por inundação.
+
+        Na inundação, cada nó visitado com TTL restante positivo,
+        isto é, a menos de 'ttl' saltos da origem, envia uma mensagem
+        para cada vizinho (exceto o anterior), logo, o custo é limitado
+        pela soma dos graus dos nós a até 'ttl - 1' saltos, que considera
+        que o recurso não é encontrado. Como o contador HyperLogLog pode
+        subestimar a soma, a estimativa recebe uma margem de
+        'ERROR_MARGIN' erros padrão (1.04 / sqrt(m)), sendo um limite
+        superior com alta probabilidade; até 'EXACT_MESSAGES_LIMIT'
+        mensagens, a soma é contada exatamente, em uma busca em largura.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem da busca.
+        ttl : Union[int, float]
+            O limitador de 'saltos' na busca.
+
+        Returns
+        -------
+        float
+            A qntd. máxima (prevista) de mensagens.
+        """
+        if ttl <= 0:
+            return 0.0
+        index: int = self.graph.index[node]
+        h: Union[int, float] = min(ttl - 1, self.diameter)
+        estimate: float = self.message_counts[int(h)][index] * (
+            1 + ERROR_MARGIN * 1.04 / sqrt(1 << self.log2_registers)
+        )
+        if estimate > EXACT_MESSAGES_LIMIT:
+            return estimate
+        return float(self.__degree_sum(index=index, h=ttl - 1))
+
+    def __degree_sum(self, index: int, h: Union[int, float]) -> int:
+        """Soma os graus dos nós a até 'h' saltos de um nó.
+
+        Parameters
+        ----------
+        index : int
+            O índice do nó.
+        h : Union[int, float]
+            A qntd. de saltos.
+
+        Returns
+        -------
+        int
+            A soma dos graus.
+        """
+        visited: set[int] = {index}
+        frontier: list[int] = [index]
+        total: int = self.graph.degree(node=index)
+        depth: int = 0
+        while frontier and depth < h:
+            depth += 1
+            next_frontier: list[int] = []
+            for current in frontier:
+                for neighbor in self.graph.neighbors(node=current):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+                        total += self.graph.degree(node=neighbor)
+            frontier = next_frontier
+        return total
+
+    def neighborhood_function(self, h: Union[int, float]) -> float:
+        """Estima a qntd. de pares de nós a até 'h' saltos.
+
+        Parameters
+        ----------
+        h : Union[int, float]
+            A qntd. de saltos.
+
+        Returns
+        -------
+        float
+            A qntd. estimada de pares (inclui os pares (v, v)).
+        """
+        return sum(self.node_counts[int(min(h, self.diameter))])
+
+    def effective_diameter(self, fraction: float = 0.9) -> int:
+        """Estima o diâmetro efetivo da topologia.
+
+        Parameters
+        ----------
+        fraction : float, optional
+            A fração dos pares alcançáveis, por padrão 0.9.
+
+        Returns
+        -------
+        int
+            A menor qntd. de saltos que alcança a fração
+            fornecida de todos os pares alcançáveis.
+        """
+        total: float = self.neighborhood_function(h=self.diameter)
+        for h in range(self.diameter + 1):
+            if self.neighborhood_function(h=h) >= fraction * total:
+                return h
+        return self.diameter
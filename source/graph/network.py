@@ -1,19 +1,38 @@
 """Arquivo responsável pela definição e 
 criação de uma topologia."""
 
+from sys import intern
+from zlib import crc32
+from random import Random
 from random import choice
-from typing import Any, Union
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Union
 
 # Buscas.
 from searchs import execute
+from searchs import AdaptiveTTL
+from searchs import SearchProfiler
+from searchs import FloodingIndex
+from searchs import reverse_flooding
+from searchs import voronoi_regions
 
 # Exceções customizadas.
+from exceptions import InvalidParam
 from exceptions import NodeIDNotFound
 from exceptions import TooManyNeighbors
 from exceptions import NotEnoughNeighbors
 from exceptions import MissingNodeResources
 from exceptions import MissingNodeNeighbors
 from exceptions import NetworkIsPartitioned
+from exceptions import NetworkIsFrozen
+
+from .alias import AliasTable
+from .delta import DeltaPlan
+from .delta import TopologyDelta
+from .delta import NODE_ID_PATTERN
+from .ordering import node_order
+from .landmarks import LandmarkIndex
+from .neighborhood import NeighborhoodIndex
 
 class Node:
     """Representa um nó em uma topologia."""
@@ -27,6 +46,12 @@ class Node:
         self.resources = set()
         self.neighbors = set()
         self.cache = {}
+        # O hash deriva do id, e não do endereço de memória, para que a
+        # ordem dos vizinhos (e as buscas com semente) seja reproduzível.
+        self.__hash = crc32(node_id.encode())
+
+    def __hash__(self) -> int:
+        return self.__hash
 
     def add_cache(self, node: 'Node', resource: str) -> None:
         """Atualiza, ou cria, o cache deste nó.
@@ -46,6 +71,10 @@ class Node:
         self.cache.setdefault(node, set())\
         .add(resource)
 
+    def clear_cache(self) -> None:
+        """Esvazia o cache deste nó."""
+        self.cache.clear()
+
     def know_resource(self, resource: str) -> bool:
         """Verifica se este nó contém alguma
         informação em seu cache sobre determinado
@@ -62,9 +91,12 @@ class Node:
             Se este nó tem alguma informação, em seu cache,
             sobre determinado recurso.
         """
+        # Uma informação só vale enquanto o nó ainda contém o recurso,
+        # logo, as removidas da topologia são ignoradas (ver
+        # `Network.apply_delta`).
         return any(
-            resource in known_resources
-            for known_resources in self.cache.values()
+            resource in known_resources and resource in node.resources
+            for node, known_resources in self.cache.items()
         )
 
     def get_node_by_resource(self, resource: str) -> Union['Node', None]:
@@ -78,27 +110,158 @@ class Node:
             O nó, caso tenha informações sobre, ou nada.
         """
         for node, known_resources in self.cache.items():
-            if resource in known_resources:
+            if resource in known_resources and resource in node.resources:
                 return node
         return None
 
 
+# * O cache lido dos nós congelados que ainda não o criaram.
+_EMPTY_CACHE: Mapping[Any, set[str]] = MappingProxyType({})
+
+class FrozenNode:
+    """Representa um nó de uma topologia congelada (ver
+    `Network.freeze`).
+
+    Sem dicionário por objeto ('__slots__'), com os vizinhos em uma
+    tupla (na mesma ordem do conjunto do `Node`, logo, as buscas com
+    semente se repetem), os recursos em um conjunto imutável
+    compartilhado pelos nós com os mesmos recursos e o cache criado
+    apenas quando usado.
+    """
+    __slots__ = ('node_id', 'resources', 'neighbors', '_cache', '_hash')
+    node_id: str
+    resources: frozenset[str]
+    neighbors: tuple['FrozenNode', ...]
+
+    def __init__(self, node_id: str, resources: frozenset[str]) -> None:
+        self.node_id = node_id
+        self.resources = resources
+        self.neighbors = ()
+        self._cache: Union[dict['FrozenNode', set[str]], None] = None
+        # O mesmo hash do `Node`, mantendo a ordem dos conjuntos de nós.
+        self._hash: int = crc32(node_id.encode())
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def cache(self) -> Mapping['FrozenNode', set[str]]:
+        """O cache do nó (ver `Node.add_cache`), apenas para leitura.
+        Ler o cache não o cria, o que só acontece em `add_cache`."""
+        return _EMPTY_CACHE if self._cache is None else self._cache
+
+    def add_cache(self, node: 'FrozenNode', resource: str) -> None:
+        """Atualiza, ou cria, o cache deste nó (ver `Node.add_cache`).
+
+        Parameters
+        ----------
+        node : FrozenNode
+            O nó que contém determinado recurso.
+        resource : str
+            O recurso que determinado nó contém.
+        """
+        if self._cache is None:
+            self._cache = {}
+        self._cache.setdefault(node, set()).add(resource)
+
+    def clear_cache(self) -> None:
+        """Esvazia o cache deste nó, liberando-o."""
+        self._cache = None
+
+    def know_resource(self, resource: str) -> bool:
+        """Verifica se este nó contém alguma informação em seu
+        cache sobre determinado recurso (ver `Node.know_resource`)."""
+        return self._cache is not None and any(
+            resource in known_resources and resource in node.resources
+            for node, known_resources in self._cache.items()
+        )
+
+    def get_node_by_resource(self, resource: str) -> Union['FrozenNode', None]:
+        """Informa qual nó contém determinado recurso, caso este nó
+        tenha alguma informação sobre o recurso (ver
+        `Node.get_node_by_resource`)."""
+        if self._cache is not None:
+            for node, known_resources in self._cache.items():
+                if resource in known_resources and resource in node.resources:
+                    return node
+        return None
+
+
+# * Os pesos dos vizinhos nas buscas por passeio aleatório enviesado.
+WALK_WEIGHTS: dict[str, Callable[['Network', Node], float]] = {
+    'uniform': lambda network, node: 1.0,
+    'degree': lambda network, node: len(node.neighbors),
+    'success': lambda network, node: 1 + network.success_counts.get(node, 0),
+    'mixed': lambda network, node: \
+        network.walk_mix * len(node.neighbors) +\
+        (1 - network.walk_mix) * (1 + network.success_counts.get(node, 0)),
+}
+
+# * A qntd. de regiões do TTL adaptativo da topologia (ver `ttl_region`).
+TTL_REGIONS: int = 16
+
+# * Os pesos que dependem da qntd. de buscas com sucesso.
+SUCCESS_WALK_WEIGHTS: set[str] = {
+    'success',
+    'mixed',
+}
+
 class Network:
     """Representa uma topologia de um rede P2P."""
     nodes: set[Node]
+    nodes_by_id: dict[str, Node]
     num_nodes: int
     min_neighbors: int
     max_neighbors: int
+    success_counts: dict[Node, int]
+    walk_mix: float
+    neighborhood_index: Union[NeighborhoodIndex, None]
+    landmark_index: Union[LandmarkIndex, None]
+    ttl_controller: AdaptiveTTL
+    profiler: Union[SearchProfiler, None]
+    frozen: bool
 
     def __init__(self, data_info: Any) -> None:
+        # Os nós, as conexões e os recursos podem ser alterados.
+        self.frozen = False
+
         # Atribui os valores lidos do arquivo de entrada.
         self.num_nodes = data_info['num_nodes']
         self.min_neighbors = data_info['min_neighbors']
         self.max_neighbors = data_info['max_neighbors']
 
-        # Cria os nós (baseia-se na qntd. limite do arquivo de entrada).
+        # Cria os nós (baseia-se na qntd. limite do arquivo de entrada),
+        # na ordem salva pela topologia, caso exista (ver `reorder`).
         self.nodes = set()
-        self.__add_all_nodes()
+        self.nodes_by_id = {}
+        self.__add_all_nodes(order=data_info.get('order'))
+
+        # Tabelas de sorteio dos passeios aleatórios enviesados, criadas
+        # sob demanda e invalidadas quando os pesos dos vizinhos mudam.
+        self.success_counts = {}
+        self.walk_mix = 0.5
+        self.__walk_tables: dict[str, dict[Node, AliasTable]] = {}
+        self.__stale_walk_tables: dict[str, set[Node]] = {}
+        # Os vizinhos de cada nó em uma tupla, percorrida pelos passeios
+        # aleatórios, criada sob demanda e descartada quando os vizinhos
+        # mudam (ver `neighbor_sequence`).
+        self.__neighbor_tuples: dict[Node, tuple[Node, ...]] = {}
+        # Os conjuntos de recursos compartilhados pelos nós congelados
+        # com os mesmos recursos (ver `freeze`).
+        self.__resource_sets: dict[frozenset[str], frozenset[str]] = {}
+
+        # Índice de vizinhança, criado sob demanda (ver `neighborhood`).
+        self.neighborhood_index = None
+        # Índice de distâncias por marcos, criado sob demanda (ver `landmarks`).
+        self.landmark_index = None
+
+        # Histórico das buscas, usado na escolha adaptativa do TTL, por
+        # região do nó de origem, com as regiões criadas sob demanda.
+        self.__ttl_regions: Union[dict[Node, int], None] = None
+        self.ttl_controller = AdaptiveTTL(region_of=self.ttl_region)
+
+        # A medição da memória das buscas, opcional (ver `run_search`).
+        self.profiler = None
 
         # Adiciona os recursos.
         data_resources: Any = data_info['resources']
@@ -116,18 +279,38 @@ class Network:
                 neighbors=data_neighbors[node_id]
             )
 
-    def __add_all_nodes(self) -> None:
+    def __add_all_nodes(self, order: Union[list[str], None] = None) -> None:
         """Adiciona todos os nós necessários a topologia.
 
         Itera sobre a quantidade total de nós do arquivo
         de entrada, adicionando um por um à topologia.
+
+        Parameters
+        ----------
+        order : Union[list[str], None], optional
+            Os ids dos nós, na ordem em que serão adicionados, por
+            padrão nada ('n1'...'nN').
+
+        Raises
+        ------
+        InvalidParam
+            Caso a ordem não contenha, uma única vez, cada nó.
         """
-        for node_id in range(1, self.num_nodes + 1):
-            self.nodes.add(
-                Node(
-                    node_id=f'n{node_id}'
-                )
+        if order is None:
+            for node_id in range(1, self.num_nodes + 1):
+                self.add_node(node_id=node_id)
+            return
+
+        # Lança uma exceção se a ordem não contiver, uma única vez, cada
+        # nó (após `apply_delta`, os ids não são, necessariamente, 'n1'...'nN').
+        if len(order) != self.num_nodes or len(set(order)) != len(order) or \
+                not all(map(NODE_ID_PATTERN.fullmatch, order)):
+            raise InvalidParam(
+                'A ordem dos nós do arquivo de entrada não contém,' +\
+                f' uma única vez, cada um dos {self.num_nodes} nós.'
             )
+        for node_id in order:
+            self.add_node(node_id=int(node_id[1:]))
 
     def is_partitioned(self) -> bool:
         """Verifica se a topologia atual está particionada.
@@ -212,13 +395,327 @@ class Network:
                     ' foi notado a existência de particionamento em algum nó.'
                 )
 
-    def add_node(self, node_id: int) -> None:
-        """Adiciona um único nó à topologia."""
-        self.nodes.add(
-            Node(
-                node_id=f'n{node_id}'
+    def __check_mutable(self) -> None:
+        """Lança uma exceção caso a topologia esteja congelada.
+
+        Raises
+        ------
+        NetworkIsFrozen
+            Caso a topologia esteja congelada.
+        """
+        if self.frozen:
+            raise NetworkIsFrozen(
+                'A topologia está congelada, use `thaw` antes de alterá-la.'
             )
-        )
+
+    def freeze(self) -> None:
+        """Congela a topologia (após `check_network`), substituindo os
+        nós por `FrozenNode`, mais compactos e rápidos de percorrer.
+
+        Os caches e as buscas com sucesso são mantidos, os índices e
+        as tabelas de sorteio são recriados sob demanda e, até `thaw`,
+        os nós, as conexões e os recursos só podem ser alterados por
+        `apply_delta`. Os nós antigos deixam de fazer parte da
+        topologia, logo, devem ser obtidos novamente (ex.:
+        `find_node_by_id`).
+        """
+        if self.frozen:
+            return
+        mapping: dict[Node, FrozenNode] = {}
+        for node_id, node in self.nodes_by_id.items():
+            mapping[node] = FrozenNode(
+                node_id=intern(node_id),
+                resources=self.__shared_resources(resources=node.resources)
+            )
+        for node, frozen_node in mapping.items():
+            frozen_node.neighbors = tuple(
+                mapping[neighbor] for neighbor in node.neighbors
+            )
+        self.__replace_nodes(mapping=mapping)
+        self.frozen = True
+
+    def __shared_resources(self, resources: Any) -> frozenset[str]:
+        """Informa o conjunto imutável de recursos compartilhado
+        pelos nós congelados com os mesmos recursos, com os ids
+        dos recursos internados."""
+        shared: frozenset[str] = frozenset(map(intern, resources))
+        return self.__resource_sets.setdefault(shared, shared)
+
+    def thaw(self) -> None:
+        """Descongela a topologia (ver `freeze`), voltando a usar
+        `Node`, que podem ser alterados."""
+        if not self.frozen:
+            return
+        mapping: dict[FrozenNode, Node] = {}
+        for node_id, frozen_node in self.nodes_by_id.items():
+            node: Node = Node(node_id=node_id)
+            node.resources = set(frozen_node.resources)
+            mapping[frozen_node] = node
+        for frozen_node, node in mapping.items():
+            node.neighbors = {
+                mapping[neighbor] for neighbor in frozen_node.neighbors
+            }
+        self.__replace_nodes(mapping=mapping)
+        self.__resource_sets = {}
+        self.frozen = False
+
+    def reorder(self, method: str = 'rcm') -> None:
+        """Reordena os nós da topologia (ver `node_order`), para que
+        os vizinhos fiquem próximos na memória.
+
+        Os nós são recriados na nova ordem, logo, os objetos (e os
+        seus conjuntos) dos vizinhos são alocados próximos, e os
+        índices (ver `CompactGraph`) numeram os nós nessa ordem. Os
+        ids dos nós não mudam, servindo de mapeamento para a entrada e
+        a saída, e a ordem é mantida por `freeze`, `thaw` e pelas
+        topologias salvas (ver `to_data_info`). Os caches e as buscas
+        com sucesso são mantidos e, como em `freeze`, os nós antigos
+        devem ser obtidos novamente. Em topologias congeladas, a ordem
+        de visita dos vizinhos de cada nó é mantida; nas demais, assim
+        como em `thaw`, os conjuntos de vizinhos são recriados e, com
+        colisões de hash, essa ordem (e, logo, as mensagens das buscas)
+        pode mudar.
+
+        Parameters
+        ----------
+        method : str, optional
+            A ordem (ver `NODE_ORDERS`), por padrão 'rcm'.
+
+        Raises
+        ------
+        InvalidParam
+            Caso a ordem seja inválida.
+        """
+        mapping: dict[Any, Any] = {}
+        for node_id in node_order(network=self, method=method):
+            node: Any = self.nodes_by_id[node_id]
+            if self.frozen:
+                mapping[node] = FrozenNode(
+                    node_id=node.node_id,
+                    resources=node.resources
+                )
+            else:
+                mapping[node] = Node(node_id=node.node_id)
+                mapping[node].resources = set(node.resources)
+        for node, new_node in mapping.items():
+            new_node.neighbors = tuple(
+                mapping[neighbor] for neighbor in node.neighbors
+            ) if self.frozen else {
+                mapping[neighbor] for neighbor in node.neighbors
+            }
+        self.__replace_nodes(mapping=mapping)
+
+    def to_data_info(self) -> dict[str, Any]:
+        """Informa a topologia no formato do arquivo de entrada,
+        incluindo a ordem dos nós, caso tenham sido reordenados.
+
+        Returns
+        -------
+        dict[str, Any]
+            A topologia, no formato do arquivo de entrada.
+        """
+        position: dict[str, int] = {
+            node_id: i for i, node_id in enumerate(self.nodes_by_id)
+        }
+        data_info: dict[str, Any] = {
+            'num_nodes': self.num_nodes,
+            'min_neighbors': self.min_neighbors,
+            'max_neighbors': self.max_neighbors,
+            'resources': {
+                node_id: sorted(node.resources)
+                for node_id, node in self.nodes_by_id.items()
+                if node.resources
+            },
+            # Cada conexão aparece uma única vez, no nó que vem antes.
+            'edges': {
+                node_id: sorted(
+                    neighbor.node_id for neighbor in node.neighbors
+                    if position[neighbor.node_id] > position[node_id]
+                )
+                for node_id, node in self.nodes_by_id.items()
+            },
+        }
+        if any(
+                node_id != f'n{i}'
+                for i, node_id in enumerate(self.nodes_by_id, start=1)
+            ):
+            data_info['order'] = list(self.nodes_by_id)
+        return data_info
+
+    def apply_delta(self, delta: Any, check: bool = True) -> int:
+        """Aplica alterações incrementais (nós, conexões e recursos
+        adicionados e removidos) à topologia.
+
+        As alterações são validadas, e a topologia checada (apenas
+        nos nós afetados, ver `DeltaPlan.check`), antes de qualquer
+        mudança, logo, se alguma exceção for lançada, a topologia
+        continua inalterada. O custo é proporcional ao tamanho das
+        alterações: apenas os vizinhos e os recursos dos nós afetados
+        são alterados (em topologias congeladas, os nós afetados
+        recebem novas tuplas e conjuntos), as tabelas de sorteio
+        afetadas são invalidadas e os índices, recriados sob demanda.
+        Os caches que apontam para nós removidos, ou para recursos
+        removidos, deixam de valer (ver `Node.know_resource`), e os
+        nós adicionados vão para o fim da ordem dos nós.
+
+        Parameters
+        ----------
+        delta : Any
+            As alterações (`TopologyDelta`, ou o conteúdo lido por
+            `read_topology_delta`).
+        check : bool, optional
+            Se os limites de vizinhos e a conectividade são checados,
+            por padrão sim.
+
+        Returns
+        -------
+        int
+            A qntd. de alterações aplicadas.
+
+        Raises
+        ------
+        NodeIDNotFound
+            Caso algum nó alterado não exista na topologia.
+        InvalidTopologyDelta
+            Caso alguma alteração não possa ser aplicada.
+        MissingNodeResources
+            Caso nenhum recurso seja adicionado a algum nó.
+        MissingNodeNeighbors
+            Caso algum nó fique sem vizinhos.
+        NotEnoughNeighbors
+            Caso algum nó fique sem vizinhos o suficiente.
+        TooManyNeighbors
+            Caso algum nó fique com muitos vizinhos.
+        NetworkIsPartitioned
+            Caso a topologia fique particionada.
+        """
+        if not isinstance(delta, TopologyDelta):
+            delta = TopologyDelta.from_dict(data=delta)
+        plan: DeltaPlan = DeltaPlan(network=self, delta=delta)
+        if check:
+            plan.check()
+
+        # Daqui em diante, nenhuma exceção é lançada.
+        for node_id in plan.added_nodes:
+            node: Any = FrozenNode(
+                node_id=intern(node_id),
+                resources=self.__shared_resources(resources=())
+            ) if self.frozen else Node(node_id=node_id)
+            self.nodes.add(node)
+            self.nodes_by_id[node_id] = node
+
+        removed: dict[str, Any] = {}
+        for node_id in plan.removed_nodes:
+            node = removed[node_id] = self.nodes_by_id.pop(node_id)
+            self.nodes.discard(node)
+            self.success_counts.pop(node, None)
+            self.__neighbor_tuples.pop(node, None)
+            for mode, tables in self.__walk_tables.items():
+                tables.pop(node, None)
+                self.__stale_walk_tables.get(mode, set()).discard(node)
+
+        affected: list[Any] = []
+        for node_id in plan.removed_neighbors.keys() | plan.added_neighbors.keys():
+            node = self.nodes_by_id[node_id]
+            lost: set[str] = plan.removed_neighbors.get(node_id, set())
+            # Em ordem, para que as buscas com semente se repitam.
+            gained: list[Any] = [
+                self.nodes_by_id[neighbor_id]
+                for neighbor_id in sorted(plan.added_neighbors.get(node_id, ()))
+            ]
+            if self.frozen:
+                node.neighbors = tuple(
+                    neighbor for neighbor in node.neighbors
+                    if neighbor.node_id not in lost
+                ) + tuple(gained)
+            else:
+                node.neighbors.difference_update(
+                    removed.get(neighbor_id) or self.nodes_by_id[neighbor_id]
+                    for neighbor_id in lost
+                )
+                node.neighbors.update(gained)
+                self.__neighbor_tuples.pop(node, None)
+            affected.append(node)
+
+        # Os nós removidos deixam de conter recursos, invalidando os
+        # caches que apontam para eles.
+        for node in removed.values():
+            node.neighbors = () if self.frozen else set()
+            node.resources = self.__shared_resources(resources=()) \
+                if self.frozen else set()
+            node.clear_cache()
+
+        for node_id, resources in plan.removed_resources.items():
+            node = self.nodes_by_id[node_id]
+            if self.frozen:
+                node.resources = self.__shared_resources(
+                    resources=node.resources - resources
+                )
+            else:
+                node.resources.difference_update(resources)
+        for node_id, resources in plan.added_resources.items():
+            node = self.nodes_by_id[node_id]
+            if self.frozen:
+                node.resources = self.__shared_resources(
+                    resources=node.resources | resources
+                )
+            else:
+                node.resources.update(resources)
+
+        self.num_nodes += len(plan.added_nodes) - len(plan.removed_nodes)
+        if removed or affected:
+            self.__ttl_regions = None
+            self.neighborhood_index = None
+            self.landmark_index = None
+            self.__invalidate_walk_tables(
+                nodes=affected,
+                modes=WALK_WEIGHTS.keys()
+            )
+        elif self.landmark_index is not None and \
+                (plan.removed_resources or plan.added_resources):
+            self.landmark_index.invalidate_resources()
+        return len(delta)
+
+    def __replace_nodes(self, mapping: dict[Any, Any]) -> None:
+        """Substitui os nós da topologia, mantendo os caches e as
+        buscas com sucesso e descartando os índices.
+
+        Parameters
+        ----------
+        mapping : dict[Any, Any]
+            O novo objeto de cada nó, na nova ordem dos nós.
+        """
+        for old_node, new_node in mapping.items():
+            # Não cria os caches (vazios) dos nós congelados.
+            for holder, resources in old_node.cache.items():
+                for resource in resources:
+                    new_node.add_cache(node=mapping[holder], resource=resource)
+        self.nodes = set(mapping.values())
+        self.nodes_by_id = {
+            new_node.node_id: new_node for new_node in mapping.values()
+        }
+        self.success_counts = {
+            mapping[node]: count for node, count in self.success_counts.items()
+        }
+        self.__walk_tables = {}
+        self.__stale_walk_tables = {}
+        self.__neighbor_tuples = {}
+        self.__ttl_regions = None
+        self.neighborhood_index = None
+        self.landmark_index = None
+
+    def add_node(self, node_id: int) -> None:
+        """Adiciona um único nó à topologia.
+
+        Raises
+        ------
+        NetworkIsFrozen
+            Caso a topologia esteja congelada.
+        """
+        self.__check_mutable()
+        node: Node = Node(node_id=f'n{node_id}')
+        self.nodes.add(node)
+        self.nodes_by_id[node.node_id] = node
 
     def add_edge(self, node_id: str, neighbors: set[str]) -> None:
         """Adiciona um ou mais vizinhos a um nó.
@@ -242,7 +739,10 @@ class Network:
             Caso o nó não seja encontrado pelo id fornecido na topologia,
             conta tanto para o nó no qual será adicionado um ou mais vizinhos
             como para os próprios vizinhos.
+        NetworkIsFrozen
+            Caso a topologia esteja congelada.
         """
+        self.__check_mutable()
         if (node := self.find_node_by_id(node_id=node_id)) is not None:
             # Itera sobre os vizinhos fornecidos, adicionando
             # conexão bidirecional.
@@ -250,6 +750,16 @@ class Network:
                 if neighbor := self.find_node_by_id(node_id=neighbor_id):
                     node.neighbors.add(neighbor)
                     neighbor.neighbors.add(node)
+                    # O grau de ambos mudou.
+                    self.__neighbor_tuples.pop(node, None)
+                    self.__neighbor_tuples.pop(neighbor, None)
+                    self.__ttl_regions = None
+                    self.neighborhood_index = None
+                    self.landmark_index = None
+                    self.__invalidate_walk_tables(
+                        nodes=(node, neighbor),
+                        modes=WALK_WEIGHTS.keys()
+                    )
                 else:
                     # Lança uma exceção se o nó vizinho ao nó atual
                     # não for encontrado, pelo id fornecido, na topologia.
@@ -284,7 +794,10 @@ class Network:
             Se nenhum recurso for passado para o nó.
         NodeIDNotFound
             Caso o nó não seja encontrado pelo id fornecido na topologia.
+        NetworkIsFrozen
+            Caso a topologia esteja congelada.
         """
+        self.__check_mutable()
         if (node := self.find_node_by_id(node_id=node_id)) is not None:
             # Lança uma exceção se não houver recursos para o nó atual.
             if len(resources) == 0:
@@ -296,6 +809,8 @@ class Network:
             # Adiciona os recursos ao nó.
             for resource in resources:
                 node.resources.add(resource)
+            if self.landmark_index is not None:
+                self.landmark_index.invalidate_resources()
         else:
             # Lança uma exceção se o nó não for encontrado, pelo id fornecido,
             # na topologia.
@@ -322,9 +837,8 @@ class Network:
         NodeIDNotFound
             Caso o nó não seja encontrado pelo id fornecido.
         """
-        for node in self.nodes:
-            if node.node_id == node_id:
-                return node
+        if (node := self.nodes_by_id.get(node_id)) is not None:
+            return node
 
         # Lança uma exceção se o nó não for encontrado, pelo id fornecido,
         # na topologia.
@@ -333,11 +847,217 @@ class Network:
             ' não foi encontrado na topologia.'
         )
 
+    def __invalidate_walk_tables(
+            self,
+            nodes: Any,
+            modes: Any
+        ) -> None:
+        """Invalida as tabelas de sorteio afetadas pela mudança
+        do peso de alguns nós.
+
+        A tabela de um nó é afetada quando seus vizinhos mudam ou
+        quando o peso de algum vizinho muda, logo, são invalidadas
+        as tabelas dos próprios nós e de seus vizinhos, e apenas
+        aquelas que já foram criadas.
+
+        Parameters
+        ----------
+        nodes : Any
+            Os nós que tiveram o seu peso alterado.
+        modes : Any
+            Os pesos afetados (ver `WALK_WEIGHTS`).
+        """
+        for mode in modes:
+            if not (tables := self.__walk_tables.get(mode)):
+                continue
+            stale: set[Node] = self.__stale_walk_tables.setdefault(mode, set())
+            for node in nodes:
+                if node in tables:
+                    stale.add(node)
+                stale.update(
+                    neighbor for neighbor in node.neighbors
+                    if neighbor in tables
+                )
+
+    def neighbor_sequence(self, node: Node) -> tuple[Node, ...]:
+        """Informa os vizinhos de um nó em uma tupla, na mesma ordem
+        do conjunto, sem copiá-los a cada visita.
+
+        Nas topologias congeladas, a tupla é a do próprio nó; nas
+        demais, é criada na primeira visita e mantida até que os
+        vizinhos do nó mudem (ver `add_edge` e `apply_delta`).
+
+        Parameters
+        ----------
+        node : Node
+            Um nó da topologia.
+
+        Returns
+        -------
+        tuple[Node, ...]
+            Os vizinhos do nó.
+        """
+        if self.frozen:
+            return node.neighbors
+        if (neighbors := self.__neighbor_tuples.get(node)) is None:
+            neighbors = self.__neighbor_tuples[node] = tuple(node.neighbors)
+        return neighbors
+
+    def walk_table(self, node: Node, mode: str) -> AliasTable:
+        """Informa a tabela de sorteio dos vizinhos de um nó,
+        criando-a, caso não exista ou esteja desatualizada.
+
+        Parameters
+        ----------
+        node : Node
+            O nó atual do passeio.
+        mode : str
+            O peso dos vizinhos (ver `WALK_WEIGHTS`).
+
+        Returns
+        -------
+        AliasTable
+            A tabela de sorteio, em O(1), do próximo 'salto'.
+
+        Raises
+        ------
+        InvalidParam
+            Caso o peso seja inválido.
+        """
+        # Lança uma exceção ao tentar um peso inválido.
+        if mode not in WALK_WEIGHTS:
+            raise InvalidParam(
+                f'O peso \'{mode}\' fornecido para o passeio é inválido.'
+            )
+
+        tables: dict[Node, AliasTable] = self.__walk_tables.setdefault(
+            mode, {}
+        )
+        stale: set[Node] = self.__stale_walk_tables.setdefault(mode, set())
+        if node in stale:
+            stale.discard(node)
+            tables.pop(node, None)
+
+        if (table := tables.get(node)) is None:
+            weight: Callable[['Network', Node], float] = WALK_WEIGHTS[mode]
+            neighbors: tuple[Node, ...] = tuple(node.neighbors)
+            table = tables[node] = AliasTable(
+                items=neighbors,
+                weights=[weight(self, neighbor) for neighbor in neighbors]
+            )
+        return table
+
+    def record_success(self, path: list[Node]) -> None:
+        """Contabiliza uma busca com sucesso para os nós
+        do caminho, exceto o nó de origem.
+
+        Parameters
+        ----------
+        path : list[Node]
+            O caminho da origem até o nó com o recurso.
+        """
+        for node in path[1:]:
+            self.success_counts[node] = self.success_counts.get(node, 0) + 1
+        self.__invalidate_walk_tables(
+            nodes=path[1:],
+            modes=SUCCESS_WALK_WEIGHTS
+        )
+
+    def ttl_region(self, node: Node) -> int:
+        """Informa a região de um nó, usada pelo TTL adaptativo da
+        topologia (ver `AdaptiveTTL`).
+
+        As regiões (ver `voronoi_regions`) têm como centros
+        'TTL_REGIONS' nós sorteados, sempre os mesmos para os mesmos
+        ids, e são criadas na primeira busca com o TTL 'auto' e
+        recriadas após a mudança das conexões.
+
+        Parameters
+        ----------
+        node : Node
+            Um nó da topologia.
+
+        Returns
+        -------
+        int
+            A região do nó (-1 nos nós não alcançáveis pelos centros).
+        """
+        if self.__ttl_regions is None:
+            node_ids: list[str] = sorted(self.nodes_by_id)
+            self.__ttl_regions = voronoi_regions(
+                nodes=self.nodes,
+                centers=[
+                    self.nodes_by_id[node_id] for node_id in Random(0).sample(
+                        node_ids, min(TTL_REGIONS, len(node_ids))
+                    )
+                ]
+            )
+        return self.__ttl_regions.get(node, -1)
+
+    def reset_success_counts(self) -> None:
+        """Esquece as buscas com sucesso (ver `record_success`),
+        descartando as tabelas de sorteio que dependem delas."""
+        self.success_counts = {}
+        for mode in SUCCESS_WALK_WEIGHTS:
+            self.__walk_tables.pop(mode, None)
+            self.__stale_walk_tables.pop(mode, None)
+
+    def neighborhood(self) -> NeighborhoodIndex:
+        """Informa o índice de vizinhança da topologia, criando-o,
+        caso não exista ou as conexões tenham mudado.
+
+        Returns
+        -------
+        NeighborhoodIndex
+            A estimativa de quantos nós (e mensagens) estão a até
+            'h' saltos de cada nó.
+        """
+        if self.neighborhood_index is None:
+            self.neighborhood_index = NeighborhoodIndex(network=self)
+        return self.neighborhood_index
+
+    def landmarks(self) -> LandmarkIndex:
+        """Informa o índice de distâncias por marcos da topologia,
+        criando-o, caso não exista ou as conexões tenham mudado.
+
+        Enquanto o índice existir, as buscas informam o estiramento
+        do caminho encontrado em relação ao caminho mínimo.
+
+        Returns
+        -------
+        LandmarkIndex
+            As distâncias de todos os nós até os marcos.
+        """
+        if self.landmark_index is None:
+            self.landmark_index = LandmarkIndex(network=self)
+        return self.landmark_index
+
+    def flooding_index(self, resource: str) -> FloodingIndex:
+        """Responde, de uma só vez, a busca por inundação
+        de um recurso partindo de todos os nós da topologia.
+
+        Parameters
+        ----------
+        resource : str
+            O recurso a ser buscado na topologia.
+
+        Returns
+        -------
+        FloodingIndex
+            As distâncias e os próximos 'saltos' de cada nó até
+            o nó mais próximo que contém o recurso.
+        """
+        return reverse_flooding(nodes=self.nodes, resource=resource)
+
     def run_search(self) -> None:
         """Executa algum algoritmo de busca na topologia atual."""
         print('Algoritmos de busca disponíveis:' +\
               '\n\t1- \'flooding\', \'informed_flooding\'' +\
               '\n\t2- \'random_walk\', \'informed_random_walk\'' +\
+              '\n\t3- \'multi_flooding\', \'multi_informed_flooding\'' +\
+              ' (recursos separados por vírgula)' +\
+              '\n\t4- \'degree_random_walk\', \'success_random_walk\',' +\
+              ' \'mixed_random_walk\'' +\
               '\n')
         # O algoritmo de busca a ser usado.
         algorithm: str = input('[ALGORITMO?] Informe o NOME algoritmo: ')
@@ -348,5 +1068,27 @@ class Network:
         # O recurso a ser buscado.
         resource: str = input('[RECURSO?] Informe o RECURSO a ser buscado: ')
         # O TTL.
-        ttl: str = input('(OPCIONAL) Informe o Time To Live (TTL): ')
-        execute(algorithm=algorithm, node=node, resource=resource, ttl=ttl)
+        ttl: str = input(
+            '(OPCIONAL) Informe o Time To Live (TTL, ou \'auto\'): '
+        )
+        # A semente (apenas nos passeios aleatórios).
+        seed: str = input(
+            '(OPCIONAL) Informe a SEMENTE (apenas passeios aleatórios): '
+        )
+        # O orçamento de mensagens.
+        budget: str = input(
+            '(OPCIONAL) Informe o ORÇAMENTO de mensagens da busca: '
+        )
+        execute(
+            algorithm=algorithm,
+            node=node,
+            resource=resource,
+            ttl=ttl,
+            network=self,
+            seed=seed,
+            budget=budget,
+            profiler=self.profiler
+        )
+        # Exibe a memória acumulada por algoritmo e os locais de alocação.
+        if self.profiler is not None:
+            print(self.profiler.report())
@@ -0,0 +1,138 @@
+"""Arquivo responsável pelas ordens dos nós que aproximam, na
+memória, os nós vizinhos de uma topologia."""
+
+from typing import Any
+
+# Exceções.
+from exceptions import InvalidParam
+
+from .compact import CompactGraph
+
+# * As ordens disponíveis para os nós (ver `node_order`).
+NODE_ORDERS: list[str] = [
+    'bfs',
+    'rcm',
+    'degree',
+]
+
+def _breadth_first(
+        adjacency: list[list[int]],
+        degrees: list[int],
+        by_degree: bool
+    ) -> list[int]:
+    """Ordena os nós pela busca em largura, componente a componente.
+
+    Parameters
+    ----------
+    adjacency : list[list[int]]
+        Os índices dos vizinhos de cada nó.
+    degrees : list[int]
+        O grau de cada nó.
+    by_degree : bool
+        Se os vizinhos são visitados em ordem crescente de grau, e
+        cada componente parte do nó de menor grau (Cuthill-McKee), ou
+        na ordem da topologia, partindo do nó de maior grau.
+
+    Returns
+    -------
+    list[int]
+        Os índices dos nós, na ordem de visita.
+    """
+    visited: bytearray = bytearray(len(adjacency))
+    order: list[int] = []
+    starts: list[int] = sorted(
+        range(len(adjacency)),
+        key=degrees.__getitem__,
+        reverse=not by_degree
+    )
+    for start in starts:
+        if visited[start]:
+            continue
+        visited[start] = 1
+        # A própria ordem serve de fila.
+        head: int = len(order)
+        order.append(start)
+        while head < len(order):
+            neighbors: list[int] = [
+                neighbor for neighbor in adjacency[order[head]]
+                if not visited[neighbor]
+            ]
+            head += 1
+            if by_degree:
+                neighbors.sort(key=degrees.__getitem__)
+            for neighbor in neighbors:
+                visited[neighbor] = 1
+            order.extend(neighbors)
+    return order
+
+def node_order(network: Any, method: str = 'rcm') -> list[str]:
+    """Informa uma ordem dos nós em que os vizinhos ficam próximos.
+
+    'bfs' ordena pela busca em largura a partir dos nós de maior
+    grau, 'rcm' pelo Reverse Cuthill-McKee (busca em largura a partir
+    dos nós de menor grau, visitando os vizinhos em ordem crescente de
+    grau, invertida ao fim), que reduz a largura de banda da matriz de
+    adjacência, e 'degree' pelo grau decrescente, agrupando os nós
+    mais visitados pelas buscas.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    method : str, optional
+        A ordem (ver `NODE_ORDERS`), por padrão 'rcm'.
+
+    Returns
+    -------
+    list[str]
+        Os ids dos nós, na nova ordem.
+
+    Raises
+    ------
+    InvalidParam
+        Caso a ordem seja inválida.
+    """
+    # Lança uma exceção ao tentar uma ordem inválida.
+    if method not in NODE_ORDERS:
+        raise InvalidParam(
+            f'A ordem \'{method}\' fornecida para os nós é inválida.'
+        )
+
+    graph: CompactGraph = CompactGraph(network=network)
+    adjacency: list[list[int]] = graph.adjacency()
+    degrees: list[int] = [len(neighbors) for neighbors in adjacency]
+    if method == 'degree':
+        order: list[int] = sorted(
+            range(len(graph)),
+            key=degrees.__getitem__,
+            reverse=True
+        )
+    else:
+        order = _breadth_first(
+            adjacency=adjacency,
+            degrees=degrees,
+            by_degree=method == 'rcm'
+        )
+        if method == 'rcm':
+            order.reverse()
+    return [graph.nodes[i].node_id for i in order]
+
+def edge_span(network: Any) -> float:
+    """Informa a distância média, na ordem dos nós, entre os dois
+    nós de cada conexão, medindo a localidade da ordem atual.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+
+    Returns
+    -------
+    float
+        A distância média entre os nós conectados.
+    """
+    graph: CompactGraph = CompactGraph(network=network)
+    total: int = 0
+    for node, neighbors in enumerate(graph.adjacency()):
+        total += sum(abs(node - neighbor) for neighbor in neighbors)
+    return total / max(len(graph.targets), 1)
@@ -0,0 +1,27 @@
+"""Arquivo responsável pela gravação de topologias no formato
+do arquivo de entrada."""
+
+import json
+
+from typing import Any
+
+def save_topology(network: Any, file_path: str) -> int:
+    """Salva a topologia em um arquivo .json, no formato do arquivo
+    de entrada (ver `Network.to_data_info`), incluindo a ordem dos
+    nós, caso tenham sido reordenados.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    file_path : str
+        O caminho do arquivo a ser salvo.
+
+    Returns
+    -------
+    int
+        A qntd. de nós salvos.
+    """
+    with open(file=file_path, mode='w', encoding='utf-8') as file:
+        json.dump(obj=network.to_data_info(), fp=file)
+    return network.num_nodes
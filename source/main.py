@@ -1,9 +1,14 @@
 """Arquivo principal."""
 
-from typing import Any
+from sys import argv
+from os.path import isfile
+from typing import Any, Union
 
 from graph import Network
+from graph import load_caches
+from searchs import SearchProfiler
 from reader import read_json_file
+from exceptions import TopologyMismatch
 
 def wait_for_key_press(key: str) -> None:
     """Para temporariamente a execução do programa,
@@ -34,11 +39,39 @@ def run(network: Network) -> None:
         print('\nPressione [ENTER] para dar continuidade ao programa.')
         wait_for_key_press(key='')
 
-def main(file_path: str) -> None:
-    """Função principal."""
+def main(
+        file_path: str,
+        cache_path: Union[str, None] = None,
+        profile: bool = False
+    ) -> None:
+    """Função principal.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo de entrada.
+    cache_path : Union[str, None], optional
+        O caminho dos caches salvos (ver `warm_caches.py`), que,
+        se existir, é carregado antes da primeira busca, por
+        padrão nada.
+    profile : bool, optional
+        Se a memória usada por cada busca é medida e exibida
+        (ver `SearchProfiler`), por padrão não.
+    """
     data_read: Any = read_json_file(file_path=file_path)
     network: Network = Network(data_info=data_read)
     network.check_network()
+    if profile:
+        network.profiler = SearchProfiler()
+
+    # Carrega os caches salvos, iniciando as buscas informadas aquecidas.
+    if cache_path is not None and isfile(path=cache_path):
+        try:
+            load_caches(network=network, file_path=cache_path)
+        except TopologyMismatch as excp:
+            print(
+                f'\t`--> [!] [{type(excp).__name__}] {excp.args[0]}'
+            )
 
     try:
         # Executa o programa.
@@ -56,4 +89,8 @@ def main(file_path: str) -> None:
     run(network=network)
 
 if __name__ == '__main__':
-    main(file_path='source/input.json')
+    main(
+        file_path='source/input.json',
+        cache_path='source/caches.json',
+        profile='--profile' in argv[1:]
+    )
@@ -2,10 +2,14 @@
 arquivos de entrada."""
 
 from .reader import read_json_file
+from .reader import read_query_trace
+from .reader import read_topology_delta
 from .validator import validate_options
 
 # Indica o que está disponível para uso no pacote.
 __all__: list[str] = [
     'read_json_file',
+    'read_query_trace',
+    'read_topology_delta',
     'validate_options',
 ]
@@ -62,3 +62,98 @@ def read_json_file(file_path: str = "") -> Any:
 
         file.close()
     return data
+
+def read_query_trace(file_path: str = "") -> list[tuple[str, str]]:
+    """Faz a leitura de um arquivo .json com uma carga de buscas.
+
+    O arquivo deve conter uma lista de pares, cada um composto
+    pelo id do nó de origem e pelo recurso a ser buscado, por
+    exemplo: [["n1", "r14"], ["n5", "r2"]].
+
+    Parameters
+    ----------
+    file_path : str, optional
+        O caminho do arquivo da carga de buscas, por padrão ""
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        As buscas, na ordem em que aparecem no arquivo.
+
+    Raises
+    ------
+    MissingInputFile
+        Se o arquivo não for encontrado no caminho fornecido.
+    NonJSONFileFound
+        Se o arquivo não for .json.
+    """
+    # Lança uma exceção se o arquivo não existir.
+    if not isfile(path=file_path):
+        raise MissingInputFile(
+            'O arquivo da carga de buscas não foi encontrado' +\
+            f' no diretório {file_path}'
+        )
+
+    # Lança uma exceção se o arquivo não for .json.
+    if not file_path.endswith('.json'):
+        raise NonJSONFileFound(
+            f'O arquivo da carga de buscas {file_path}' +\
+            ' encontrado não é .json'
+        )
+
+    with open(file=file_path, mode='r', encoding='utf-8') as file:
+        data: Any = json.load(fp=file)
+    return [(node_id, resource) for node_id, resource in data]
+
+def read_topology_delta(file_path: str = "") -> Any:
+    """Faz a leitura de um arquivo .json com as alterações de uma
+    topologia (ver `TopologyDelta`).
+
+    O arquivo pode conter os nós adicionados e removidos (listas de
+    ids), as conexões adicionadas e removidas (listas de pares de ids)
+    e os recursos adicionados e removidos (por id do nó), por exemplo:
+    {"add_nodes": ["n11"], "add_edges": [["n11", "n3"]],
+    "remove_resources": {"n5": ["r2"]}}.
+
+    Parameters
+    ----------
+    file_path : str, optional
+        O caminho do arquivo das alterações, por padrão ""
+
+    Returns
+    -------
+    Any
+        Um dicionário contendo as alterações lidas do arquivo.
+
+    Raises
+    ------
+    MissingInputFile
+        Se o arquivo não for encontrado no caminho fornecido.
+    NonJSONFileFound
+        Se o arquivo não for .json.
+    InvalidOptionInInputFile
+        Caso haja algum campo inválido no arquivo.
+    """
+    # Lança uma exceção se o arquivo não existir.
+    if not isfile(path=file_path):
+        raise MissingInputFile(
+            'O arquivo das alterações da topologia não foi encontrado' +\
+            f' no diretório {file_path}'
+        )
+
+    # Lança uma exceção se o arquivo não for .json.
+    if not file_path.endswith('.json'):
+        raise NonJSONFileFound(
+            f'O arquivo das alterações da topologia {file_path}' +\
+            ' encontrado não é .json'
+        )
+
+    # Lazy Import.
+    # pylint: disable=import-outside-toplevel
+    from . import validate_options
+
+    with open(file=file_path, mode='r', encoding='utf-8') as file:
+        data: Any = json.load(fp=file)
+    # Valida os campos do arquivo lido.
+    validate_options(options=data.keys(), delta=True)
+    return data
@@ -13,9 +13,20 @@ _VALID_FIELDS: list[str] = [
     'max_neighbors',
     'resources',
     'edges',
+    'order',
 ]
 
-def validate_options(options: Any) -> bool:
+# * Os campos que serão aceitos no .json das alterações da topologia.
+_VALID_DELTA_FIELDS: list[str] = [
+    'add_nodes',
+    'remove_nodes',
+    'add_edges',
+    'remove_edges',
+    'add_resources',
+    'remove_resources',
+]
+
+def validate_options(options: Any, delta: bool = False) -> bool:
     """Valida os campos/opções dos arquivos de entrada.
 
     Pega a diferença entre os campos/opções válidas e os
@@ -27,6 +38,9 @@ def validate_options(options: Any) -> bool:
     ----------
     options : Any
         Os campos/opções do arquivo de entrada.
+    delta : bool, optional
+        Se o arquivo contém as alterações de uma topologia (ver
+        `read_topology_delta`), por padrão não.
 
     Returns
     -------
@@ -38,8 +52,9 @@ def validate_options(options: Any) -> bool:
     InvalidOptionInInputFile
         Caso haja algum campo/opção inválida no arquivo de entrada.
     """
-    # Extrai os valores distintos entre 'keys' e '_VALID_FIELDS'.
-    options_diff: set[Any] = set(options) - set(_VALID_FIELDS)
+    valid_fields: list[str] = _VALID_DELTA_FIELDS if delta else _VALID_FIELDS
+    # Extrai os valores distintos entre 'keys' e os campos válidos.
+    options_diff: set[Any] = set(options) - set(valid_fields)
 
     # Lança uma exceção caso haja uma opção inválida no arquivo de entrada.
     if len(options_diff) > 0:
@@ -47,6 +62,6 @@ def validate_options(options: Any) -> bool:
             'Os seguintes campos do arquivo de entrada: ' +\
             ', '.join(opt for opt in options_diff) +\
             '\nnão pertencem aos seguintes campos aceitos: ' +\
-            ', '.join(opt for opt in _VALID_FIELDS)
+            ', '.join(opt for opt in valid_fields)
         )
     return True
@@ -0,0 +1,23 @@
+"""Pacote responsável pela replicação dos recursos
+de uma topologia."""
+
+from .strategies import REPLICATION_STRATEGIES
+from .strategies import allocate_replicas
+from .strategies import expected_search_size
+from .placement import ReplicationReport
+from .placement import place_replicas
+from .placement import query_popularity
+from .placement import current_allocation
+from .placement import compare_replication
+
+# Indica o que está disponível para uso no pacote.
+__all__: list[str] = [
+    'REPLICATION_STRATEGIES',
+    'allocate_replicas',
+    'expected_search_size',
+    'ReplicationReport',
+    'place_replicas',
+    'query_popularity',
+    'current_allocation',
+    'compare_replication',
+]
@@ -0,0 +1,311 @@
+"""Arquivo responsável pelo posicionamento das réplicas dos
+recursos em uma topologia e pela avaliação do seu impacto."""
+
+from random import Random
+from collections import Counter
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidParam
+from exceptions import NetworkIsFrozen
+
+# Cargas de buscas.
+from searchs import WorkloadSummary
+from searchs import run_workload
+
+from .strategies import allocate_replicas
+from .strategies import expected_search_size
+
+# * Os modos de posicionamento disponíveis para uso.
+PLACEMENT_MODES: list[str] = [
+    'redistribute',
+    'add',
+]
+
+def current_allocation(network: Any) -> dict[str, int]:
+    """Conta quantas réplicas cada recurso tem na topologia, em
+    uma passagem pelos recursos de todos os nós.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+
+    Returns
+    -------
+    dict[str, int]
+        A qntd. de réplicas de cada recurso.
+    """
+    return Counter(
+        resource for node in network.nodes for resource in node.resources
+    )
+
+def query_popularity(
+        network: Any,
+        queries: list[tuple[str, str]]
+    ) -> dict[str, float]:
+    """Calcula a popularidade de cada recurso da topologia
+    a partir de uma carga de buscas.
+
+    Os recursos buscados que não existem na topologia são
+    ignorados, pois não há o que replicar.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    queries : list[tuple[str, str]]
+        As buscas, cada uma composta pelo id do nó de origem
+        e pelo recurso a ser buscado.
+
+    Returns
+    -------
+    dict[str, float]
+        A qntd. de buscas de cada recurso da topologia.
+    """
+    popularity: dict[str, float] = dict.fromkeys(
+        current_allocation(network=network), 0.0
+    )
+    for _, resource in queries:
+        if resource in popularity:
+            popularity[resource] += 1
+    return popularity
+
+def place_replicas(
+        network: Any,
+        allocation: dict[str, int],
+        mode: str = 'redistribute',
+        seed: Union[int, None] = None
+    ) -> int:
+    """Posiciona as réplicas dos recursos, aleatoriamente,
+    nos nós da topologia.
+
+    No modo 'redistribute' todas as réplicas atuais são removidas
+    e cada recurso recebe exatamente a sua qntd. de réplicas; no
+    modo 'add' as réplicas atuais são mantidas e apenas as que
+    faltam são adicionadas. Os recursos atuais são removidos (ou,
+    no modo 'add', indexados) em uma única passagem pelos nós e,
+    então, os nós de cada recurso são sorteados, sem reposição, por
+    índice, custando O(réplicas) ao invés de percorrer os nós da
+    topologia para cada recurso.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia.
+    allocation : dict[str, int]
+        A qntd. de réplicas de cada recurso.
+    mode : str, optional
+        O modo de posicionamento, por padrão 'redistribute'.
+    seed : Union[int, None], optional
+        A semente do sorteio dos nós, por padrão nada.
+
+    Returns
+    -------
+    int
+        A qntd. de réplicas adicionadas.
+
+    Raises
+    ------
+    InvalidParam
+        Caso o modo de posicionamento seja inválido.
+    NetworkIsFrozen
+        Caso a topologia esteja congelada (ver `Network.freeze`).
+    """
+    # Lança uma exceção ao tentar um modo de posicionamento inválido.
+    if mode not in PLACEMENT_MODES:
+        raise InvalidParam(
+            f'O modo de posicionamento \'{mode}\' fornecido é inválido.'
+        )
+    # Lança uma exceção ao tentar alterar os recursos de uma topologia congelada.
+    if network.frozen:
+        raise NetworkIsFrozen(
+            'A topologia está congelada, use `thaw` antes de alterá-la.'
+        )
+
+    rng: Random = Random(seed)
+    nodes: list[Any] = list(network.nodes_by_id.values())
+
+    # Os nós que já contém cada recurso.
+    holders: dict[str, set[int]] = {}
+    for index, node in enumerate(nodes):
+        if mode == 'redistribute':
+            node.resources.clear()
+            continue
+        for resource in node.resources:
+            holders.setdefault(resource, set()).add(index)
+
+    added_replicas: int = 0
+    for resource, replicas in allocation.items():
+        current_holders: set[int] = holders.get(resource, set())
+        missing: int = min(replicas, len(nodes)) - len(current_holders)
+        if missing <= 0:
+            continue
+
+        # Sorteia nós o suficiente para ignorar os que já têm o recurso.
+        candidates: list[int] = rng.sample(
+            range(len(nodes)),
+            missing + len(current_holders)
+        )
+        new_holders: list[int] = [
+            index for index in candidates if index not in current_holders
+        ]
+        for index in new_holders[:missing]:
+            nodes[index].resources.add(resource)
+        added_replicas += missing
+
+    if network.landmark_index is not None:
+        network.landmark_index.invalidate_resources()
+    return added_replicas
+
+
+class ReplicationReport:
+    """Representa o impacto de uma estratégia de replicação
+    sobre uma carga de buscas."""
+    strategy: str
+    budget: int
+    expected_before: float
+    expected_after: float
+    before: WorkloadSummary
+    after: WorkloadSummary
+
+    def __init__(
+            self,
+            strategy: str,
+            budget: int,
+            expected_before: float,
+            expected_after: float,
+            before: WorkloadSummary,
+            after: WorkloadSummary
+        ) -> None:
+        self.strategy = strategy
+        self.budget = budget
+        self.expected_before = expected_before
+        self.expected_after = expected_after
+        self.before = before
+        self.after = after
+
+    def report(self) -> str:
+        """Descreve o impacto da replicação.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return f'\n[Replicação \'{self.strategy}\'] ' +\
+            f'Orçamento de {self.budget} réplicas' +\
+            '\n\t`--> Tamanho esperado da busca: ' +\
+            f'{self.expected_before:.2f} -> {self.expected_after:.2f}' +\
+            '\n\t`--> Média de mensagens trocadas: ' +\
+            f'{self.before.mean_messages:.2f}' +\
+            f' -> {self.after.mean_messages:.2f}' +\
+            '\n\t`--> Média de saltos: ' +\
+            f'{self.before.mean_hops:.2f} -> {self.after.mean_hops:.2f}' +\
+            '\n\t`--> Taxa de sucesso: ' +\
+            f'{self.before.success_rate:.2%} -> {self.after.success_rate:.2%}'
+
+
+def _forget_searches(network: Any) -> None:
+    """Esvazia os caches dos nós e as buscas com sucesso da
+    topologia, aprendidos pelas buscas anteriores."""
+    for node in network.nodes:
+        node.clear_cache()
+    network.reset_success_counts()
+
+def compare_replication(
+        network: Any,
+        queries: list[tuple[str, str]],
+        strategy: str,
+        budget: int,
+        algorithm: str = 'flooding',
+        ttl: Union[int, float] = float('inf'),
+        mode: str = 'redistribute',
+        seed: Union[int, None] = None
+    ) -> ReplicationReport:
+    """Replica os recursos da topologia e mede o impacto sobre
+    uma carga de buscas.
+
+    A carga é executada antes e depois da replicação, com a mesma
+    semente e sempre a partir de caches e buscas com sucesso vazios,
+    para que as buscas informadas e os passeios enviesados não se
+    beneficiem da execução anterior e a diferença não inclua o ruído
+    dos sorteios.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia, que terá seus recursos replicados.
+    queries : list[tuple[str, str]]
+        A carga de buscas, que também define a popularidade.
+    strategy : str
+        O nome da estratégia de replicação.
+    budget : int
+        A qntd. total de réplicas a serem distribuídas.
+    algorithm : str, optional
+        O algoritmo de busca da carga, por padrão 'flooding'.
+    ttl : Union[int, float], optional
+        O limitador de 'saltos' das buscas, por padrão infinito.
+    mode : str, optional
+        O modo de posicionamento, por padrão 'redistribute'.
+    seed : Union[int, None], optional
+        A semente do sorteio dos nós e das buscas, por padrão nada.
+
+    Returns
+    -------
+    ReplicationReport
+        O impacto da replicação sobre a carga.
+    """
+    popularity: dict[str, float] = query_popularity(
+        network=network,
+        queries=queries
+    )
+    allocation: dict[str, int] = allocate_replicas(
+        strategy=strategy,
+        popularity=popularity,
+        budget=budget,
+        max_replicas=len(network.nodes)
+    )
+    expected_before: float = expected_search_size(
+        allocation=current_allocation(network=network),
+        popularity=popularity,
+        num_nodes=len(network.nodes)
+    )
+
+    _forget_searches(network=network)
+    before: WorkloadSummary = run_workload(
+        network=network,
+        algorithm=algorithm,
+        queries=queries,
+        ttl=ttl,
+        seed=seed
+    )
+
+    place_replicas(
+        network=network,
+        allocation=allocation,
+        mode=mode,
+        seed=seed
+    )
+
+    _forget_searches(network=network)
+    after: WorkloadSummary = run_workload(
+        network=network,
+        algorithm=algorithm,
+        queries=queries,
+        ttl=ttl,
+        seed=seed
+    )
+
+    return ReplicationReport(
+        strategy=strategy,
+        budget=budget,
+        expected_before=expected_before,
+        expected_after=expected_search_size(
+            allocation=current_allocation(network=network),
+            popularity=popularity,
+            num_nodes=len(network.nodes)
+        ),
+        before=before,
+        after=after
+    )
@@ -0,0 +1,176 @@
+"""Arquivo responsável pelas estratégias de replicação, que
+definem quantas réplicas cada recurso deve ter, dado um
+orçamento total de armazenamento."""
+
+from heapq import nlargest
+from math import floor, sqrt
+from typing import Callable
+
+# Exceções.
+from exceptions import InvalidParam
+
+# * Estratégias de replicação disponíveis para uso, associando
+# * a popularidade de um recurso ao seu peso na distribuição.
+REPLICATION_STRATEGIES: dict[str, Callable[[float], float]] = {
+    'uniform': lambda popularity: 1.0,
+    'proportional': lambda popularity: popularity,
+    'square_root': sqrt,
+}
+
+def allocate_replicas(
+        strategy: str,
+        popularity: dict[str, float],
+        budget: int,
+        max_replicas: int
+    ) -> dict[str, int]:
+    """Calcula a qntd. de réplicas de cada recurso.
+
+    Distribui o orçamento 'budget' entre os recursos de acordo
+    com o peso dado pela estratégia, garantindo ao menos uma
+    réplica por recurso e no máximo 'max_replicas' (uma por nó).
+    A cada rodada, os recursos que ultrapassam um dos limites (o de
+    maior excesso total) são fixados nele e o restante do orçamento
+    é redistribuído entre os demais, até que todos respeitem os
+    limites; as frações são arredondadas pelo método dos maiores
+    restos, logo, o total é sempre o orçamento (limitado a
+    'max_replicas' por recurso), custando O(R) por rodada (no pior
+    caso, R rodadas) e O(R log R) no arredondamento, para R recursos.
+
+    Parameters
+    ----------
+    strategy : str
+        O nome da estratégia de replicação.
+    popularity : dict[str, float]
+        A popularidade (qntd. de buscas) de cada recurso.
+    budget : int
+        A qntd. total de réplicas a serem distribuídas.
+    max_replicas : int
+        A qntd. máxima de réplicas de um recurso.
+
+    Returns
+    -------
+    dict[str, int]
+        A qntd. de réplicas de cada recurso.
+
+    Raises
+    ------
+    InvalidParam
+        Caso a estratégia seja inválida ou o orçamento não seja
+        suficiente para uma réplica por recurso.
+    """
+    # Lança uma exceção ao tentar uma estratégia inválida.
+    if strategy not in REPLICATION_STRATEGIES:
+        raise InvalidParam(
+            f'A estratégia de replicação \'{strategy}\' fornecida é inválida.'
+        )
+
+    # Lança uma exceção se o orçamento não cobrir uma réplica por recurso.
+    if budget < len(popularity):
+        raise InvalidParam(
+            f'O orçamento de {budget} réplicas não é suficiente' +\
+            f' para os {len(popularity)} recursos.'
+        )
+    budget = min(budget, len(popularity) * max_replicas)
+
+    weight: Callable[[float], float] = REPLICATION_STRATEGIES[strategy]
+    weights: dict[str, float] = {
+        resource: weight(queries) for resource, queries in popularity.items()
+    }
+    # Sem nenhuma busca, a distribuição é uniforme.
+    if not any(weights.values()):
+        weights = dict.fromkeys(weights, 1.0)
+
+    # Fixa, a cada rodada, os recursos que ultrapassam apenas um dos
+    # limites (o de maior excesso total, que também vale para a solução
+    # final) e redistribui o restante entre os demais.
+    fixed: dict[str, int] = {}
+    free: dict[str, float] = weights
+    remaining_budget: int = budget
+    shares: dict[str, float] = {}
+    while free:
+        total_weight: float = sum(free.values())
+        shares = {
+            resource: remaining_budget * value / total_weight
+            if total_weight else remaining_budget / len(free)
+            for resource, value in free.items()
+        }
+        excess: float = sum(
+            share - max_replicas for share in shares.values()
+            if share > max_replicas
+        )
+        deficit: float = sum(1 - share for share in shares.values() if share < 1)
+        if not excess and not deficit:
+            break
+        bound: int = max_replicas if excess > deficit else 1
+        clamped: list[str] = [
+            resource for resource, share in shares.items()
+            if (share > max_replicas if bound == max_replicas else share < 1)
+        ]
+        fixed.update(dict.fromkeys(clamped, bound))
+        remaining_budget -= bound * len(clamped)
+        for resource in clamped:
+            del free[resource]
+            del shares[resource]
+
+    # Arredonda as frações pelo método dos maiores restos.
+    allocation: dict[str, int] = {
+        resource: min(floor(share), max_replicas)
+        for resource, share in shares.items()
+    }
+    allocation.update(fixed)
+    leftover: int = budget - sum(allocation.values())
+    for resource in nlargest(
+            leftover,
+            shares,
+            key=lambda resource: shares[resource] - allocation[resource]
+        ):
+        if allocation[resource] < max_replicas:
+            allocation[resource] += 1
+            leftover -= 1
+
+    # Erros de arredondamento: o restante vai para os recursos abaixo
+    # do máximo.
+    for resource in allocation:
+        if leftover <= 0:
+            break
+        extra: int = min(leftover, max_replicas - allocation[resource])
+        allocation[resource] += extra
+        leftover -= extra
+
+    assert sum(allocation.values()) == budget
+    return allocation
+
+def expected_search_size(
+        allocation: dict[str, int],
+        popularity: dict[str, float],
+        num_nodes: int
+    ) -> float:
+    """Calcula a qntd. esperada de nós sondados por busca.
+
+    Com as réplicas posicionadas aleatoriamente, uma busca cega
+    por um recurso com 'r' réplicas sonda, em média, 'N / r' nós,
+    logo, o tamanho esperado de uma busca é a média, ponderada
+    pela popularidade, de 'N / r'.
+
+    Parameters
+    ----------
+    allocation : dict[str, int]
+        A qntd. de réplicas de cada recurso.
+    popularity : dict[str, float]
+        A popularidade (qntd. de buscas) de cada recurso.
+    num_nodes : int
+        A qntd. de nós da topologia.
+
+    Returns
+    -------
+    float
+        A qntd. esperada de nós sondados por busca.
+    """
+    total_queries: float = sum(popularity.values())
+    if not total_queries:
+        return 0.0
+    return sum(
+        queries * num_nodes / allocation[resource]
+        for resource, queries in popularity.items()
+        if allocation.get(resource)
+    ) / total_queries
@@ -3,8 +3,40 @@ por recursos em uma topologia."""
 
 # Responsável pela execução das buscas.
 from .execute import execute
+# Registros de resultado das buscas.
+from .result import SearchResult, MultiSearchResult
+# Responsável pela busca por inundação reversa (em lote).
+from .reverse_flooding import FloodingIndex, reverse_flooding
+# Responsável pela execução de cargas de buscas.
+from .workload import WorkloadSummary, run_workload
+# Responsável pela escolha adaptativa do TTL.
+from .adaptive_ttl import AdaptiveTTL, voronoi_regions
+# Responsável pelo rastreamento das buscas.
+from .tracing import Tracer, TraceRecorder, install_tracer
+from .tracing import read_trace, export_chrome_trace
+# Responsável pela medição da memória das buscas.
+from .profiling import QueryProfile, AlgorithmProfile, SearchProfiler
+# Responsável pelos pontos de retomada das cargas de buscas.
+from .checkpoint import WorkloadCheckpoint
 
 # Indica o que está disponível para uso no pacote.
 __all__: list[str] = [
     'execute',
+    'SearchResult',
+    'MultiSearchResult',
+    'FloodingIndex',
+    'reverse_flooding',
+    'WorkloadSummary',
+    'run_workload',
+    'AdaptiveTTL',
+    'voronoi_regions',
+    'Tracer',
+    'TraceRecorder',
+    'install_tracer',
+    'read_trace',
+    'export_chrome_trace',
+    'QueryProfile',
+    'AlgorithmProfile',
+    'SearchProfiler',
+    'WorkloadCheckpoint',
 ]
@@ -0,0 +1,184 @@
+"""Arquivo responsável pela escolha adaptativa do TTL das buscas,
+aprendida a partir do histórico de resultados."""
+
+from collections import deque
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+from .result import SearchResult
+
+class AdaptiveTTL:
+    """Representa o controlador adaptativo do TTL.
+
+    Mantém, por algoritmo, recurso e região do nó de origem (e,
+    como alternativa para os recursos pouco buscados, por algoritmo
+    e região, para todos os recursos), um histograma da qntd. de
+    'saltos' até o recurso, com decaimento exponencial (as
+    observações antigas perdem peso a cada nova observação,
+    acompanhando mudanças na topologia). Buscas sem sucesso são
+    registradas como 'mais de TTL saltos', fazendo o TTL escolhido
+    crescer para os recursos raros. A memória é limitada a
+    'capacity' histogramas, descartando os usados há mais tempo.
+    """
+    target: float
+    max_ttl: int
+    decay: float
+    capacity: int
+    min_samples: float
+    region_of: Union[Callable[[Any], Hashable], None]
+
+    def __init__(
+            self,
+            target: float = 0.9,
+            max_ttl: int = 16,
+            decay: float = 0.95,
+            capacity: int = 10_000,
+            min_samples: float = 2.5,
+            region_of: Union[Callable[[Any], Hashable], None] = None
+        ) -> None:
+        # Lança uma exceção caso algum parâmetro seja inválido.
+        if not 0 < target <= 1 or not 0 < decay <= 1 or \
+            max_ttl < 0 or capacity < 1:
+            raise InvalidParam(
+                'A probabilidade alvo e o decaimento devem estar em (0, 1],' +\
+                ' o TTL máximo não pode ser negativo e a capacidade' +\
+                ' deve ser positiva.'
+            )
+
+        self.target = target
+        self.max_ttl = max_ttl
+        self.decay = decay
+        self.capacity = capacity
+        self.min_samples = min_samples
+        self.region_of = region_of
+        # * Histogramas: a posição 'h' guarda o peso das buscas que
+        # * precisaram de 'h' saltos; a última, o das que precisaram de
+        # * mais de 'max_ttl' saltos.
+        self.__histograms: OrderedDict[tuple, list[float]] = OrderedDict()
+
+    def __keys(self, algorithm: str, node: Any, resource: str) -> list[tuple]:
+        """Informa as chaves dos histogramas de uma busca, da mais
+        específica (o recurso na região da origem) para a mais geral
+        (todos os recursos, em qualquer região), usadas enquanto as
+        mais específicas não têm observações suficientes."""
+        keys: list[tuple] = [(algorithm, resource, None), (algorithm, None, None)]
+        if self.region_of is not None:
+            region: Hashable = self.region_of(node)
+            keys.insert(0, (algorithm, resource, region))
+            keys.insert(2, (algorithm, None, region))
+        return keys
+
+    def select(self, algorithm: str, node: Any, resource: str) -> int:
+        """Escolhe o menor TTL que, pelo histórico, encontra o
+        recurso com a probabilidade alvo.
+
+        Parameters
+        ----------
+        algorithm : str
+            O nome do algoritmo de busca.
+        node : Any
+            O nó de origem da busca.
+        resource : str
+            O recurso a ser buscado.
+
+        Returns
+        -------
+        int
+            O TTL escolhido, ou o TTL máximo, caso não haja
+            histórico suficiente.
+        """
+        for key in self.__keys(algorithm=algorithm, node=node, resource=resource):
+            histogram: Union[list[float], None] = self.__histograms.get(key)
+            if histogram is None or sum(histogram) < self.min_samples:
+                continue
+
+            self.__histograms.move_to_end(key)
+            required: float = self.target * sum(histogram)
+            accumulated: float = 0.0
+            for hops, weight in enumerate(histogram[:-1]):
+                accumulated += weight
+                if accumulated >= required:
+                    return hops
+            return self.max_ttl
+        return self.max_ttl
+
+    def observe(
+            self,
+            node: Any,
+            ttl: Union[int, float],
+            result: SearchResult
+        ) -> None:
+        """Registra o resultado de uma busca no histórico.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem da busca.
+        ttl : Union[int, float]
+            O TTL usado na busca.
+        result : SearchResult
+            O resultado da busca.
+        """
+        # Sem sucesso, sabe-se apenas que o recurso está a mais de TTL saltos.
+        hops: Union[int, float] = result.hops if result.found else ttl + 1
+        bucket: int = int(min(hops, self.max_ttl + 1))
+
+        for key in self.__keys(
+                algorithm=result.algorithm,
+                node=node,
+                resource=result.resource
+            ):
+            histogram: list[float] = self.__histograms.setdefault(
+                key, [0.0] * (self.max_ttl + 2)
+            )
+            for index, weight in enumerate(histogram):
+                histogram[index] = weight * self.decay
+            histogram[bucket] += 1.0
+            self.__histograms.move_to_end(key)
+
+        # Descarta os históricos usados há mais tempo.
+        while len(self.__histograms) > self.capacity:
+            self.__histograms.popitem(last=False)
+
+
+def voronoi_regions(
+        nodes: Iterable[Any],
+        centers: Iterable[Any]
+    ) -> dict[Any, int]:
+    """Divide a topologia em regiões, associando cada nó ao
+    centro mais próximo, com uma única busca em largura a partir
+    de todos os centros (O(N + E)).
+
+    Parameters
+    ----------
+    nodes : Iterable[Any]
+        Os nós da topologia.
+    centers : Iterable[Any]
+        Os nós centrais de cada região.
+
+    Returns
+    -------
+    dict[Any, int]
+        A região (o índice do centro) de cada nó alcançável.
+    """
+    regions: dict[Any, int] = {}
+    queue: deque[Any] = deque()
+    for region, center in enumerate(centers):
+        if center not in regions:
+            regions[center] = region
+            queue.append(center)
+
+    while queue:
+        current_node = queue.popleft()
+        for neighbor in current_node.neighbors:
+            if neighbor not in regions:
+                regions[neighbor] = regions[current_node]
+                queue.append(neighbor)
+
+    # Os nós não alcançáveis formam uma região à parte.
+    for node in nodes:
+        regions.setdefault(node, -1)
+    return regions
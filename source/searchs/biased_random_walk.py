@@ -0,0 +1,266 @@
+"""Arquivo responsável pelas buscas por passeio aleatório
+enviesado, seja pelo grau dos vizinhos, seja pela qntd. de
+buscas com sucesso que passaram por eles."""
+
+from random import Random
+from typing import Any, Union
+
+from .result import SearchResult
+from .rng import make_seed
+from .tracing import Tracer
+from .tracing import current_tracer
+
+# * Limite de passos de um passeio sem TTL, por nó da topologia.
+MAX_WALK_STEPS_FACTOR: int = 10
+# * Qntd. de novos sorteios ao sortear um nó já visitado.
+REVISIT_RETRIES: int = 2
+
+def biased_random_walk(
+        algorithm: str,
+        mode: str,
+        informed: bool,
+        node: Any,
+        resource: str,
+        ttl: int,
+        network: Any,
+        seed: Union[int, None] = None
+    ) -> SearchResult:
+    """Aplica o algoritmo de busca por passeio aleatório enviesado.
+
+    Um único andarilho parte do nó de origem 'node' e, a cada
+    passo (uma mensagem), sorteia o próximo nó dentre os vizinhos
+    do nó atual, proporcionalmente ao peso 'mode', usando as
+    tabelas de alias da topologia (O(1) por passo). Ao sortear um
+    nó já visitado, o sorteio é refeito até 'REVISIT_RETRIES' vezes,
+    evitando que o andarilho fique preso aos nós de maior peso. O
+    passeio termina quando o recurso é encontrado ou o TTL se
+    esgota; sem TTL, é limitado a 'MAX_WALK_STEPS_FACTOR' passos
+    por nó.
+
+    Parameters
+    ----------
+    algorithm : str
+        O nome do algoritmo, registrado no resultado.
+    mode : str
+        O peso dos vizinhos (ver `graph.network.WALK_WEIGHTS`).
+    informed : bool
+        Se o passeio usa e atualiza o cache dos nós.
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resource : str
+        O recurso a ser buscado na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+    network : Any
+        A topologia, que mantém as tabelas de sorteio.
+    seed : Union[int, None], optional
+        A semente da busca, que, se repetida, repete exatamente
+        o mesmo passeio, por padrão uma nova semente.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
+    """
+    seed = make_seed(seed=seed)
+    random = Random(seed).random
+    max_steps: float = min(ttl, MAX_WALK_STEPS_FACTOR * len(network.nodes))
+    # Qntd. de mensagens trocadas entre os nós.
+    messages_count: int = 0
+    # O caminho percorrido (o andarilho pode revisitar nós).
+    path: list[Any] = [node]
+    visited_nodes: set[Any] = {node}
+    current_node: Any = node
+    # O rastreador, se instalado (ver `tracing.install_tracer`).
+    tracer: Union[Tracer, None] = current_tracer()
+    if tracer is not None:
+        tracer.on_start(
+            algorithm=algorithm,
+            node=node,
+            resource=resource,
+            ttl=ttl
+        )
+        tracer.on_enqueue(node=node, ttl=ttl)
+        tracer.on_visit(node=node, ttl=ttl)
+
+    while resource not in current_node.resources and \
+        messages_count < max_steps and current_node.neighbors:
+        previous_node: Any = current_node
+        # Vai direto para o nó que tem o recurso.
+        if informed and current_node.know_resource(resource=resource):
+            current_node = current_node.get_node_by_resource(
+                resource=resource
+            )
+            if tracer is not None:
+                tracer.on_cache_hit(
+                    node=previous_node,
+                    resource=resource,
+                    target=current_node
+                )
+        # Caso contrário, sorteia o próximo vizinho.
+        else:
+            table: Any = network.walk_table(node=current_node, mode=mode)
+            next_node: Any = table.sample(uniform=random())
+            for _ in range(REVISIT_RETRIES):
+                if next_node not in visited_nodes:
+                    break
+                next_node = table.sample(uniform=random())
+            current_node = next_node
+        messages_count += 1
+        path.append(current_node)
+        visited_nodes.add(current_node)
+        if tracer is not None:
+            remaining: float = ttl - messages_count
+            tracer.on_message(sender=previous_node, receiver=current_node)
+            tracer.on_enqueue(node=current_node, ttl=remaining)
+            tracer.on_visit(node=current_node, ttl=remaining)
+
+    result: SearchResult = SearchResult(
+        algorithm=algorithm,
+        resource=resource,
+        messages_count=messages_count,
+        involved_nodes=len(visited_nodes),
+        seed=seed
+    )
+
+    # Recurso foi encontrado!
+    if resource in current_node.resources:
+        result.node = current_node
+        result.path = path
+        network.record_success(path=path)
+        if tracer is not None:
+            tracer.on_found(node=current_node, resource=resource, path=path)
+        if informed:
+            # Atualiza o cache dos nós da origem até o nó com o recurso.
+            for node_path in path:
+                node_path.add_cache(node=current_node, resource=resource)
+    if tracer is not None:
+        tracer.on_structures(
+            frontier=0,
+            visited=len(visited_nodes),
+            paths=len(path)
+        )
+        tracer.on_end(result=result)
+    return result
+
+def degree_random_walk(
+        node: Any,
+        resource: str,
+        ttl: int,
+        network: Any,
+        seed: Union[int, None] = None
+    ) -> SearchResult:
+    """Aplica o algoritmo de busca por passeio aleatório enviesado
+    pelo grau dos vizinhos, favorecendo os nós mais conectados.
+
+    Parameters
+    ----------
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resource : str
+        O recurso a ser buscado na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+    network : Any
+        A topologia, que mantém as tabelas de sorteio.
+    seed : Union[int, None], optional
+        A semente da busca, que, se repetida, repete exatamente
+        o mesmo passeio, por padrão uma nova semente.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
+    """
+    return biased_random_walk(
+        algorithm='degree_random_walk',
+        mode='degree',
+        informed=False,
+        node=node,
+        resource=resource,
+        ttl=ttl,
+        network=network,
+        seed=seed
+    )
+
+def success_random_walk(
+        node: Any,
+        resource: str,
+        ttl: int,
+        network: Any,
+        seed: Union[int, None] = None
+    ) -> SearchResult:
+    """Aplica o algoritmo de busca por passeio aleatório guiado
+    pelo cache, favorecendo os vizinhos que já participaram de
+    buscas com sucesso.
+
+    Parameters
+    ----------
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resource : str
+        O recurso a ser buscado na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+    network : Any
+        A topologia, que mantém as tabelas de sorteio.
+    seed : Union[int, None], optional
+        A semente da busca, que, se repetida, repete exatamente
+        o mesmo passeio, por padrão uma nova semente.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
+    """
+    return biased_random_walk(
+        algorithm='success_random_walk',
+        mode='success',
+        informed=True,
+        node=node,
+        resource=resource,
+        ttl=ttl,
+        network=network,
+        seed=seed
+    )
+
+def mixed_random_walk(
+        node: Any,
+        resource: str,
+        ttl: int,
+        network: Any,
+        seed: Union[int, None] = None
+    ) -> SearchResult:
+    """Aplica o algoritmo de busca por passeio aleatório guiado
+    pelo cache, com os vizinhos ponderados pela combinação do
+    grau e da qntd. de buscas com sucesso (ver `Network.walk_mix`).
+
+    Parameters
+    ----------
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resource : str
+        O recurso a ser buscado na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+    network : Any
+        A topologia, que mantém as tabelas de sorteio.
+    seed : Union[int, None], optional
+        A semente da busca, que, se repetida, repete exatamente
+        o mesmo passeio, por padrão uma nova semente.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
+    """
+    return biased_random_walk(
+        algorithm='mixed_random_walk',
+        mode='mixed',
+        informed=True,
+        node=node,
+        resource=resource,
+        ttl=ttl,
+        network=network,
+        seed=seed
+    )
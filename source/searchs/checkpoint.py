@@ -0,0 +1,308 @@
+"""Arquivo responsável pelos pontos de retomada (checkpoints) das
+cargas de buscas longas, gravados de forma incremental."""
+
+import os
+import json
+
+from hashlib import sha256
+from random import Random
+from typing import Any, IO, Union
+
+# Exceções.
+from exceptions import InvalidParam
+from exceptions import TopologyMismatch
+
+from .result import SearchResult
+from .execute import CACHING_SEARCH_ALGORITHMS
+from .execute import NETWORK_SEARCH_ALGORITHMS
+
+# * A versão do formato do arquivo dos pontos de retomada.
+CHECKPOINT_VERSION: int = 1
+
+# * As métricas agregadas (ver `WorkloadSummary`) salvas a cada ponto.
+_SUMMARY_FIELDS: list[str] = [
+    'queries',
+    'found',
+    'messages_count',
+    'messages_squares',
+    'hops_count',
+    'hops_squares',
+    'stretch_count',
+    'stretch_sum',
+]
+
+class WorkloadCheckpoint:
+    """Representa os pontos de retomada de uma carga de buscas (ver
+    `run_workload`).
+
+    O arquivo é um registro (JSONL) apenas com adições: a primeira
+    linha identifica a carga e a topologia e, a cada 'interval' buscas,
+    uma nova linha guarda a posição na carga, o estado do gerador de
+    números aleatórios, as métricas agregadas e o caminho encontrado
+    por cada busca desde o ponto anterior. Os caminhos bastam para
+    refazer, na retomada, o que as buscas alteraram (os caches dos
+    nós, as buscas com sucesso e o histórico do TTL adaptativo), logo,
+    cada ponto custa proporcionalmente às buscas do intervalo, e não
+    ao tamanho dos caches. Uma linha incompleta (ex.: o processo parou
+    durante a gravação) é descartada na retomada.
+
+    A retomada deve partir da mesma topologia, no mesmo estado do
+    início da carga (ex.: com os mesmos caches carregados), e executa
+    apenas as buscas após o último ponto, com resultados idênticos aos
+    de uma execução sem interrupções.
+    """
+    file_path: str
+    interval: int
+    resume: bool
+    restored_queries: int
+    checkpoints_count: int
+
+    def __init__(
+            self,
+            file_path: str,
+            interval: int = 1000,
+            resume: bool = False
+        ) -> None:
+        # Lança uma exceção caso o intervalo seja inválido.
+        if interval < 1:
+            raise InvalidParam(
+                'O intervalo entre os pontos de retomada deve ser positivo.'
+            )
+
+        self.file_path = file_path
+        self.interval = interval
+        self.resume = resume
+        # A qntd. de buscas refeitas a partir do arquivo, na retomada.
+        self.restored_queries = 0
+        # A qntd. de pontos gravados nesta execução.
+        self.checkpoints_count = 0
+        self.__file: Union[IO[str], None] = None
+        self.__paths: list[list[str]] = []
+
+    @staticmethod
+    def __header(
+            network: Any,
+            algorithm: str,
+            queries: list[tuple[str, str]],
+            ttl: Union[int, float],
+            seed: Union[int, None]
+        ) -> dict[str, Any]:
+        """Identifica a carga e a topologia em que ela é executada."""
+        # Lazy Import.
+        # pylint: disable=import-outside-toplevel
+        from graph import topology_fingerprint
+
+        return {
+            'version': CHECKPOINT_VERSION,
+            'algorithm': algorithm,
+            'ttl': ttl,
+            'seed': seed,
+            'queries': len(queries),
+            'queries_digest': sha256(
+                json.dumps(queries).encode()
+            ).hexdigest(),
+            'fingerprint': topology_fingerprint(network=network),
+        }
+
+    def start(
+            self,
+            network: Any,
+            algorithm: str,
+            queries: list[tuple[str, str]],
+            ttl: Union[int, float],
+            seed: Union[int, None],
+            rng: Random,
+            summary: Any,
+            ttl_controller: Any = None
+        ) -> int:
+        """Inicia o arquivo ou, na retomada, refaz o estado salvo.
+
+        Parameters
+        ----------
+        network : Any
+            A topologia onde as buscas são executadas.
+        algorithm : str
+            O nome do algoritmo de busca.
+        queries : list[tuple[str, str]]
+            As buscas da carga.
+        ttl : Union[int, float]
+            O limitador de 'saltos' das buscas.
+        seed : Union[int, None]
+            A semente da carga.
+        rng : Random
+            O gerador das sementes das buscas, que recebe o estado salvo.
+        summary : Any
+            As métricas agregadas (`WorkloadSummary`), que recebem as
+            métricas salvas.
+        ttl_controller : Any, optional
+            O controlador adaptativo (`AdaptiveTTL`), que recebe o
+            histórico das buscas refeitas, por padrão nada.
+
+        Returns
+        -------
+        int
+            A posição, na carga, da primeira busca a ser executada.
+
+        Raises
+        ------
+        TopologyMismatch
+            Caso os pontos tenham sido salvos em outra topologia.
+        InvalidParam
+            Caso os pontos tenham sido salvos por outra carga.
+        """
+        header: dict[str, Any] = self.__header(
+            network=network,
+            algorithm=algorithm,
+            queries=queries,
+            ttl=ttl,
+            seed=seed
+        )
+        records: list[dict[str, Any]] = []
+        # O tamanho do arquivo até a última linha completa.
+        valid_size: int = 0
+        if self.resume and os.path.isfile(self.file_path):
+            with open(file=self.file_path, mode='rb') as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+                    if not line.endswith(b'\n'):
+                        records.pop()
+                        break
+                    valid_size += len(line)
+
+        # Sem pontos salvos, a carga começa do início.
+        if not records:
+            self.__file = open(file=self.file_path, mode='w', encoding='utf-8')
+            self.__write(record=header)
+            return 0
+
+        saved: dict[str, Any] = records[0]
+        # Lança uma exceção se a topologia mudou desde que os pontos foram salvos.
+        if saved.get('fingerprint') != header['fingerprint']:
+            raise TopologyMismatch(
+                f'Os pontos de retomada de {self.file_path} foram salvos' +\
+                ' em uma topologia diferente da atual.'
+            )
+        # Lança uma exceção se a carga não for a mesma.
+        if any(saved.get(field) != value for field, value in header.items()):
+            raise InvalidParam(
+                f'Os pontos de retomada de {self.file_path} foram salvos' +\
+                ' por uma carga de buscas diferente da atual.'
+            )
+
+        position: int = 0
+        for record in records[1:]:
+            for path_ids in record['paths']:
+                self.__replay(
+                    network=network,
+                    algorithm=algorithm,
+                    query=queries[position],
+                    path_ids=path_ids,
+                    ttl_controller=ttl_controller
+                )
+                position += 1
+        if len(records) > 1:
+            version, internal_state, gauss_next = records[-1]['rng']
+            rng.setstate((version, tuple(internal_state), gauss_next))
+            for field in _SUMMARY_FIELDS:
+                setattr(summary, field, records[-1]['summary'][field])
+        self.restored_queries = position
+
+        # Descarta a linha incompleta e continua o registro.
+        self.__file = open(file=self.file_path, mode='r+', encoding='utf-8')
+        self.__file.truncate(valid_size)
+        self.__file.seek(valid_size)
+        return position
+
+    @staticmethod
+    def __replay(
+            network: Any,
+            algorithm: str,
+            query: tuple[str, str],
+            path_ids: list[str],
+            ttl_controller: Any
+        ) -> None:
+        """Refaz o que uma busca alterou, a partir do seu caminho."""
+        node_id, resource = query
+        path: list[Any] = [
+            network.find_node_by_id(node_id=path_id) for path_id in path_ids
+        ]
+        if path:
+            if algorithm in NETWORK_SEARCH_ALGORITHMS:
+                network.record_success(path=path)
+            if algorithm in CACHING_SEARCH_ALGORITHMS:
+                for node_path in path:
+                    node_path.add_cache(node=path[-1], resource=resource)
+        if ttl_controller is not None:
+            node: Any = network.find_node_by_id(node_id=node_id)
+            ttl: int = ttl_controller.select(
+                algorithm=algorithm,
+                node=node,
+                resource=resource
+            )
+            ttl_controller.observe(
+                node=node,
+                ttl=ttl,
+                result=SearchResult(
+                    algorithm=algorithm,
+                    resource=resource,
+                    node=path[-1] if path else None,
+                    path=path
+                )
+            )
+
+    def record(
+            self,
+            position: int,
+            result: SearchResult,
+            rng: Random,
+            summary: Any,
+            total: int
+        ) -> None:
+        """Registra uma busca executada, gravando um ponto ao fim de
+        cada intervalo e ao fim da carga.
+
+        Parameters
+        ----------
+        position : int
+            A posição da busca na carga.
+        result : SearchResult
+            O resultado da busca.
+        rng : Random
+            O gerador das sementes das buscas.
+        summary : Any
+            As métricas agregadas (`WorkloadSummary`), já com a busca.
+        total : int
+            A qntd. de buscas da carga.
+        """
+        self.__paths.append(
+            [node.node_id for node in result.path] if result.found else []
+        )
+        if (position + 1) % self.interval == 0 or position + 1 == total:
+            self.__write(record={
+                'position': position + 1,
+                'rng': rng.getstate(),
+                'summary': {
+                    field: getattr(summary, field) for field in _SUMMARY_FIELDS
+                },
+                'paths': self.__paths,
+            })
+            self.__paths = []
+            self.checkpoints_count += 1
+
+    def __write(self, record: dict[str, Any]) -> None:
+        """Acrescenta uma linha ao arquivo, garantindo que ela foi
+        gravada em disco antes de continuar."""
+        self.__file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+    def close(self) -> None:
+        """Fecha o arquivo. As buscas após o último ponto não são
+        gravadas, sendo executadas novamente na retomada."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        self.__paths = []
@@ -3,11 +3,12 @@ de um algoritmo de busca."""
 
 from time import time
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable, Union
 
 # Exceções.
 from exceptions import InvalidParam
 from exceptions import InvalidSearchAlgorithm
+from exceptions import MessageBudgetExceeded
 
 # Busca por inundação.
 from .flooding import flooding
@@ -17,14 +18,141 @@ from .informed_flooding import informed_flooding
 from .random_walk import random_walk
 from .informed_random_walk import informed_random_walk
 
+# Busca por passeio aleatório enviesado.
+from .biased_random_walk import mixed_random_walk
+from .biased_random_walk import degree_random_walk
+from .biased_random_walk import success_random_walk
+from .biased_random_walk import MAX_WALK_STEPS_FACTOR
+
+# Busca por inundação de múltiplos recursos.
+from .multi_flooding import multi_flooding
+from .multi_flooding import multi_informed_flooding
+
+# Resultados das buscas.
+from .result import SearchResult
+from .result import MultiSearchResult
+
+# Medição da memória das buscas.
+from .profiling import SearchProfiler
+
 # * Buscas disponíveis para uso.
 AVAILABLE_SEARCH_ALGORITHMS: dict[str, Callable] = {
     'flooding': flooding,
     'random_walk': random_walk,
     'informed_flooding': informed_flooding,
-    'informed_random_walk': informed_random_walk
+    'informed_random_walk': informed_random_walk,
+    'multi_flooding': multi_flooding,
+    'multi_informed_flooding': multi_informed_flooding,
+    'degree_random_walk': degree_random_walk,
+    'success_random_walk': success_random_walk,
+    'mixed_random_walk': mixed_random_walk,
+}
+
+# * Buscas que aceitam múltiplos recursos, separados por vírgula.
+MULTI_RESOURCE_SEARCH_ALGORITHMS: set[str] = {
+    'multi_flooding',
+    'multi_informed_flooding',
+}
+
+# * Buscas aleatórias, que aceitam uma semente.
+RANDOMIZED_SEARCH_ALGORITHMS: set[str] = {
+    'random_walk',
+    'informed_random_walk',
+    'degree_random_walk',
+    'success_random_walk',
+    'mixed_random_walk',
+}
+
+# * Buscas que dependem da topologia (ex.: tabelas de sorteio).
+NETWORK_SEARCH_ALGORITHMS: set[str] = {
+    'degree_random_walk',
+    'success_random_walk',
+    'mixed_random_walk',
+}
+
+# * Buscas que, opcionalmente, reaproveitam os vizinhos mantidos pela topologia.
+NEIGHBOR_SEARCH_ALGORITHMS: set[str] = {
+    'random_walk',
+    'informed_random_walk',
+}
+
+# * Buscas que atualizam o cache dos nós do caminho encontrado.
+CACHING_SEARCH_ALGORITHMS: set[str] = {
+    'informed_flooding',
+    'informed_random_walk',
+    'multi_informed_flooding',
+    'success_random_walk',
+    'mixed_random_walk',
 }
 
+def _optional_int(name: str, value: Union[str, int, None]) -> Union[int, None]:
+    """Valida um parâmetro inteiro opcional, informado pelo usuário.
+
+    Parameters
+    ----------
+    name : str
+        O nome do parâmetro, usado na mensagem de erro.
+    value : Union[str, int, None]
+        O valor fornecido.
+
+    Returns
+    -------
+    Union[int, None]
+        O valor convertido para inteiro, ou nada, caso não
+        tenha sido fornecido.
+
+    Raises
+    ------
+    InvalidParam
+        Caso o valor não seja um dígito.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.isdigit(): # Se for um dígito, converte para inteiro.
+        return int(value)
+    if not value: # Nada foi fornecido.
+        return None
+    # Lança uma exceção se o valor não for um dígito.
+    raise InvalidParam(
+        f'O valor \'{value}\' fornecido para {name} é inválido.'
+    )
+
+def predict_messages(
+        algorithm: str,
+        node: Any,
+        ttl: Union[int, float],
+        network: Any
+    ) -> float:
+    """Prevê, antes da execução, a qntd. máxima de mensagens
+    de uma busca.
+
+    Os passeios de um único andarilho trocam, no máximo, uma
+    mensagem por passo; as demais buscas são limitadas pelo custo
+    de uma inundação que não encontra o recurso, previsto pelo
+    índice de vizinhança da topologia (ver `Network.neighborhood`),
+    exato nas inundações pequenas e, nas demais, um limite superior
+    com alta probabilidade.
+
+    Parameters
+    ----------
+    algorithm : str
+        O nome do algoritmo de busca.
+    node : Any
+        O nó de origem da busca.
+    ttl : Union[int, float]
+        O limitador de 'saltos' na busca.
+    network : Any
+        A topologia.
+
+    Returns
+    -------
+    float
+        A qntd. máxima (prevista) de mensagens.
+    """
+    if algorithm in NETWORK_SEARCH_ALGORITHMS:
+        return min(ttl, MAX_WALK_STEPS_FACTOR * len(network.nodes))
+    return network.neighborhood().predict_messages(node=node, ttl=ttl)
+
 def metrics(func: Callable) -> Callable:
     """'Wrapper' responsável pelo cálculo do tempo
     de execução de algum algoritmo de busca.
@@ -41,26 +169,42 @@ def metrics(func: Callable) -> Callable:
     """
 
     @wraps(wrapped=func)
-    def wrapper(algorithm: str, **kwargs) -> None:
+    def wrapper(
+            algorithm: str,
+            **kwargs
+        ) -> Union[SearchResult, MultiSearchResult]:
         """Calcula o tempo de execução de algum algoritmo de busca.
 
         Parameters
         ----------
         algorithm : str
             O nome do algoritmo de busca a ser executado.
+
+        Returns
+        -------
+        Union[SearchResult, MultiSearchResult]
+            O resultado da busca.
         """
         start_time: float = time()
-        func(algorithm, **kwargs)
+        result: Union[SearchResult, MultiSearchResult] = func(
+            algorithm,
+            **kwargs
+        )
         execution_time: float = time() - start_time
+        print(result.report())
         print(
             f'[Tempo de Execução] O algoritmo \'{algorithm}\'' +\
             f' levou {execution_time:.4f} segundos.'
         )
+        return result
 
     return wrapper
 
 @metrics
-def execute(algorithm: str, **kwargs) -> None:
+def execute(
+        algorithm: str,
+        **kwargs
+    ) -> Union[SearchResult, MultiSearchResult]:
     """Executa um algoritmo de busca.
 
     Parameters
@@ -70,7 +214,22 @@ def execute(algorithm: str, **kwargs) -> None:
 
     **kwargs: Any
         Os parâmetros necessários para o algoritmo de busca,
-        deve conter: node: Any, resource: str, ttl: int (opcional)
+        deve conter: node: Any, resource: str, ttl: int (opcional,
+        'auto' escolhe o TTL pelo histórico da topologia)
+        network: Any (opcional, usada apenas pelas buscas que
+        dependem da topologia), seed: str (opcional, usada apenas
+        pelas buscas aleatórias, sorteada quando não fornecida),
+        budget: str (opcional, o orçamento de mensagens, que, junto
+        da topologia, faz a previsão do custo antes da execução) e
+        profiler: SearchProfiler (opcional, mede a memória usada
+        pela busca).
+        Para as buscas por múltiplos recursos, 'resource' deve
+        conter os recursos separados por vírgula.
+
+    Returns
+    -------
+    Union[SearchResult, MultiSearchResult]
+        O resultado da busca.
 
     Raises
     ------
@@ -79,6 +238,8 @@ def execute(algorithm: str, **kwargs) -> None:
     InvalidParam
         Caso esteja faltando algum parâmetro essencial para o
         funcionamento do algoritmo de busca.
+    MessageBudgetExceeded
+        Caso a qntd. prevista de mensagens ultrapasse o orçamento.
     """
     # Lança uma exceção ao tentar um algoritmo de busca inválido.
     if algorithm not in AVAILABLE_SEARCH_ALGORITHMS:
@@ -87,22 +248,104 @@ def execute(algorithm: str, **kwargs) -> None:
         )
 
     # Lança uma exceção caso não seja passado os parâmetros essenciais.
-    expected_params: list[str] = ['node', 'resource', 'ttl']
+    expected_params: list[str] = [
+        'node', 'resource', 'ttl', 'network', 'seed', 'budget', 'profiler'
+    ]
     if any(param not in expected_params for param in kwargs):
         raise InvalidParam(
             f'Está faltando parâmetros para o algoritmo {algorithm}.'
         )
 
+    # Apenas as buscas que dependem da topologia a recebem.
+    network: Any = kwargs.pop('network', None)
+    profiler: Union[SearchProfiler, None] = kwargs.pop('profiler', None)
+
     # Valida o TTL.
     if kwargs['ttl'].isdigit(): # Se for um dígito, converte para inteiro.
         kwargs['ttl'] = int(kwargs['ttl'])
     elif not kwargs['ttl']: # Usa um valor padrão (-1), se nada for fornecido.
         kwargs['ttl'] = float('inf')
+    # Escolhe o TTL pelo histórico de buscas da topologia.
+    elif kwargs['ttl'] == 'auto' and network is not None and \
+        algorithm not in MULTI_RESOURCE_SEARCH_ALGORITHMS:
+        kwargs['ttl'] = network.ttl_controller.select(
+            algorithm=algorithm,
+            node=kwargs['node'],
+            resource=kwargs['resource']
+        )
+        print(f'[TTL Adaptativo] TTL escolhido: {kwargs["ttl"]}.')
     # Lança uma exceção se o TTL não for um dígito.
     else:
         raise InvalidParam(
             f'O valor \'{kwargs["ttl"]}\'fornecido para o TTL é inválido.'
         )
 
-    # Executa o algoritmo de busca.
-    AVAILABLE_SEARCH_ALGORITHMS[algorithm](**kwargs)
+    if algorithm in NETWORK_SEARCH_ALGORITHMS or \
+        algorithm in NEIGHBOR_SEARCH_ALGORITHMS:
+        kwargs['network'] = network
+
+    # Valida a semente (sorteada, se não fornecida) das buscas aleatórias.
+    seed: Union[int, None] = _optional_int(
+        name='a semente',
+        value=kwargs.pop('seed', None)
+    )
+    if algorithm in RANDOMIZED_SEARCH_ALGORITHMS:
+        kwargs['seed'] = seed
+
+    # Prevê o custo da busca, caso seja fornecido um orçamento de mensagens
+    # ou o índice de vizinhança da topologia já exista.
+    budget: Union[int, None] = _optional_int(
+        name='o orçamento de mensagens',
+        value=kwargs.pop('budget', None)
+    )
+    if network is not None and (
+            budget is not None or network.neighborhood_index is not None
+        ):
+        predicted_messages: float = predict_messages(
+            algorithm=algorithm,
+            node=kwargs['node'],
+            ttl=kwargs['ttl'],
+            network=network
+        )
+        print(
+            f'[Previsão] O algoritmo \'{algorithm}\' deve trocar até' +\
+            f' {predicted_messages:.0f} mensagens (limite superior).'
+        )
+        # Lança uma exceção se a previsão ultrapassar o orçamento.
+        if budget is not None and predicted_messages > budget:
+            raise MessageBudgetExceeded(
+                f'A busca deve trocar até {predicted_messages:.0f}' +\
+                f' mensagens, acima do orçamento de {budget} mensagens.'
+            )
+
+    # Separa os recursos, caso a busca seja por múltiplos recursos.
+    if algorithm in MULTI_RESOURCE_SEARCH_ALGORITHMS:
+        kwargs['resources'] = {
+            resource.strip()
+            for resource in kwargs.pop('resource').split(',')
+            if resource.strip()
+        }
+
+    # Executa o algoritmo de busca, medindo a memória, se solicitado.
+    if profiler is None:
+        result: Union[SearchResult, MultiSearchResult] = \
+            AVAILABLE_SEARCH_ALGORITHMS[algorithm](**kwargs)
+    else:
+        result = profiler.profile(
+            search=AVAILABLE_SEARCH_ALGORITHMS[algorithm],
+            algorithm=algorithm,
+            **kwargs
+        )
+        print(profiler.last.report())
+
+    # Alimenta o histórico usado na escolha adaptativa do TTL.
+    if network is not None and isinstance(result, SearchResult):
+        network.ttl_controller.observe(
+            node=kwargs['node'],
+            ttl=kwargs['ttl'],
+            result=result
+        )
+        # Mede o caminho encontrado, caso o índice de marcos já exista.
+        if network.landmark_index is not None:
+            result.stretch = network.landmark_index.stretch(result=result)
+    return result
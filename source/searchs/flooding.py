@@ -1,8 +1,12 @@
 """Arquivo responsável pela busca por inundação."""
 
-from typing import Any
+from typing import Any, Union
 
-def flooding(node: Any, resource: str, ttl: int) -> None:
+from .result import SearchResult
+from .tracing import Tracer
+from .tracing import current_tracer
+
+def flooding(node: Any, resource: str, ttl: int) -> SearchResult:
     """Aplica o algoritmo de busca por inundação.
      
     Parte do nó de origem 'node', buscando pelo
@@ -17,31 +21,52 @@ def flooding(node: Any, resource: str, ttl: int) -> None:
         O recurso a ser buscado na topologia.
     ttl : int
         O limitador de 'saltos' na busca.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
     """
     # Qntd. de mensagens trocadas entre os nós.
     messages_count: int = 0
-    resource_found: bool = False
+    result: SearchResult = SearchResult(
+        algorithm='flooding',
+        resource=resource
+    )
     # A lista dos nós (FIFO) a ser visitados.
     # * 1. O nó a ser visitado; 2. O TTL do nó a ser visitado; 3. O caminho.
     queue: list[tuple[Any, int]] = [(node, ttl, [node])]
     # Os nós que já foram visitados.
     visited_nodes: set[Any] = set()
+    # O rastreador, se instalado (ver `tracing.install_tracer`).
+    tracer: Union[Tracer, None] = current_tracer()
+    if tracer is not None:
+        tracer.on_start(
+            algorithm='flooding',
+            node=node,
+            resource=resource,
+            ttl=ttl
+        )
+        tracer.on_enqueue(node=node, ttl=ttl)
 
     while queue:
         current_node, current_ttl, current_path = queue.pop(0)
         visited_nodes.add(current_node)
+        if tracer is not None:
+            tracer.on_visit(node=current_node, ttl=current_ttl)
 
         # Recurso foi encontrado!
         if resource in current_node.resources:
-            print(
-                f'\nO recurso {resource} FOI' +\
-                f' encontrado no nó {current_node.node_id}!' +\
-                '\n\t`--> Caminho: ' +\
-                ' -> '.join(n.node_id for n in current_path) +\
-                f'\n\t`--> Qntd. de mensagens trocadas: {messages_count}' +\
-                f'\n\t`--> Qntd. de nós envolvidos: {len(visited_nodes)}'
-            )
-            resource_found = True
+            result.node = current_node
+            result.path = current_path
+            result.messages_count = messages_count
+            result.involved_nodes = len(visited_nodes)
+            if tracer is not None:
+                tracer.on_found(
+                    node=current_node,
+                    resource=resource,
+                    path=current_path
+                )
             # ! current_path ta com o caminho da origem até o nó com o recurso.
             break
 
@@ -50,17 +75,26 @@ def flooding(node: Any, resource: str, ttl: int) -> None:
             # Ignora os nós já visitados e que tenham TTL > 0
             if current_ttl > 0:
                 messages_count += 1
+                if tracer is not None:
+                    tracer.on_message(sender=current_node, receiver=neighbor)
                 if neighbor not in visited_nodes and current_ttl > 0:
                     queue.append(
                         (neighbor, current_ttl - 1, current_path + [neighbor])
                     )
                     visited_nodes.add(neighbor)
+                    if tracer is not None:
+                        tracer.on_enqueue(node=neighbor, ttl=current_ttl - 1)
                     # messages_count += 1
 
     # Caso o recurso não seja encontrado.
-    if not resource_found:
-        print(
-            f'\nO recurso {resource} NÃO foi encontrado.' +\
-            f'\n\t`--> Qntd. de mensagens trocadas: {messages_count}' +\
-            f'\n\t`--> Qntd. de nós envolvidos: {len(visited_nodes)}'
+    if not result.found:
+        result.messages_count = messages_count
+        result.involved_nodes = len(visited_nodes)
+    if tracer is not None:
+        tracer.on_structures(
+            frontier=len(queue),
+            visited=len(visited_nodes),
+            paths=sum(len(entry[2]) for entry in queue) + len(result.path)
         )
+        tracer.on_end(result=result)
+    return result
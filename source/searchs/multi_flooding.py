@@ -0,0 +1,279 @@
+"""Arquivo responsável pelas buscas por inundação, e por inundação
+informada, de múltiplos recursos com uma única travessia."""
+
+from typing import Any, Union
+
+from .result import SearchResult
+from .result import MultiSearchResult
+from .tracing import Tracer
+from .tracing import current_tracer
+
+def _found(
+        algorithm: str,
+        resource: str,
+        node: Any,
+        path: list[Any],
+        messages_count: int,
+        involved_nodes: int
+    ) -> SearchResult:
+    """Cria o registro de um recurso encontrado durante
+    uma busca por múltiplos recursos."""
+    return SearchResult(
+        algorithm=algorithm,
+        resource=resource,
+        node=node,
+        path=path,
+        messages_count=messages_count,
+        involved_nodes=involved_nodes
+    )
+
+def multi_flooding(
+        node: Any,
+        resources: set[str],
+        ttl: int
+    ) -> MultiSearchResult:
+    """Aplica o algoritmo de busca por inundação para
+    múltiplos recursos.
+
+    Parte do nó de origem 'node', buscando por todos os
+    recursos 'resources' em uma única travessia, que é
+    encerrada quando todos forem encontrados ou quando o
+    Time To Live (TTL) se esgotar.
+
+    Parameters
+    ----------
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resources : set[str]
+        Os recursos a serem buscados na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+
+    Returns
+    -------
+    MultiSearchResult
+        O resultado da busca, por recurso.
+    """
+    # Qntd. de mensagens trocadas entre os nós.
+    messages_count: int = 0
+    # Os recursos que ainda não foram encontrados.
+    pending: set[str] = set(resources)
+    results: dict[str, SearchResult] = {}
+    # A lista dos nós (FIFO) a ser visitados.
+    # * 1. O nó a ser visitado; 2. O TTL do nó a ser visitado; 3. O caminho.
+    queue: list[tuple[Any, int, list[Any]]] = [(node, ttl, [node])]
+    # Os nós que já foram visitados.
+    visited_nodes: set[Any] = set()
+    # O rastreador, se instalado (ver `tracing.install_tracer`).
+    tracer: Union[Tracer, None] = current_tracer()
+    if tracer is not None:
+        tracer.on_start(
+            algorithm='multi_flooding',
+            node=node,
+            resource=','.join(sorted(resources)),
+            ttl=ttl
+        )
+        tracer.on_enqueue(node=node, ttl=ttl)
+
+    while queue and pending:
+        current_node, current_ttl, current_path = queue.pop(0)
+        visited_nodes.add(current_node)
+        if tracer is not None:
+            tracer.on_visit(node=current_node, ttl=current_ttl)
+
+        # Recursos encontrados!
+        for resource in pending & current_node.resources:
+            results[resource] = _found(
+                algorithm='multi_flooding',
+                resource=resource,
+                node=current_node,
+                path=current_path,
+                messages_count=messages_count,
+                involved_nodes=len(visited_nodes)
+            )
+            if tracer is not None:
+                tracer.on_found(
+                    node=current_node,
+                    resource=resource,
+                    path=current_path
+                )
+        pending -= current_node.resources
+        if not pending:
+            break
+
+        for neighbor in current_node.neighbors:
+            # Ignora os nós já visitados e que tenham TTL > 0
+            if current_ttl > 0:
+                messages_count += 1
+                if tracer is not None:
+                    tracer.on_message(sender=current_node, receiver=neighbor)
+                if neighbor not in visited_nodes:
+                    queue.append(
+                        (neighbor, current_ttl - 1, current_path + [neighbor])
+                    )
+                    visited_nodes.add(neighbor)
+                    if tracer is not None:
+                        tracer.on_enqueue(node=neighbor, ttl=current_ttl - 1)
+
+    # Os recursos que não foram encontrados.
+    for resource in pending:
+        results[resource] = SearchResult(
+            algorithm='multi_flooding',
+            resource=resource,
+            messages_count=messages_count,
+            involved_nodes=len(visited_nodes)
+        )
+
+    multi_result: MultiSearchResult = MultiSearchResult(
+        algorithm='multi_flooding',
+        results={resource: results[resource] for resource in resources},
+        messages_count=messages_count,
+        involved_nodes=len(visited_nodes)
+    )
+    if tracer is not None:
+        tracer.on_structures(
+            frontier=len(queue),
+            visited=len(visited_nodes),
+            paths=sum(len(entry[2]) for entry in queue) +\
+                sum(len(found.path) for found in results.values())
+        )
+        tracer.on_end(result=multi_result)
+    return multi_result
+
+def multi_informed_flooding(
+        node: Any,
+        resources: set[str],
+        ttl: int
+    ) -> MultiSearchResult:
+    """Aplica o algoritmo de busca por inundação informada
+    para múltiplos recursos.
+
+    Parte do nó de origem 'node', buscando por todos os
+    recursos 'resources' em uma única travessia, que é
+    encerrada quando todos forem encontrados ou quando o
+    Time To Live (TTL) se esgotar. Ao chegar em um vizinho
+    que conhece, pelo cache, o nó de algum recurso pendente,
+    a busca vai direto para ele, sem deixar de inundar os
+    demais vizinhos em busca dos outros recursos.
+
+    Parameters
+    ----------
+    node : Any
+        O nó de origem, onde será iniciado a busca.
+    resources : set[str]
+        Os recursos a serem buscados na topologia.
+    ttl : int
+        O limitador de 'saltos' na busca.
+
+    Returns
+    -------
+    MultiSearchResult
+        O resultado da busca, por recurso.
+    """
+    # Qntd. de mensagens trocadas entre os nós.
+    messages_count: int = 0
+    # Os recursos que ainda não foram encontrados.
+    pending: set[str] = set(resources)
+    results: dict[str, SearchResult] = {}
+    # A lista dos nós (FIFO) a ser visitados.
+    # * 1. O nó a ser visitado; 2. O TTL do nó a ser visitado; 3. O caminho.
+    queue: list[tuple[Any, int, list[Any]]] = [(node, ttl, [node])]
+    # Os nós que já foram visitados.
+    visited_nodes: set[Any] = set()
+    # O rastreador, se instalado (ver `tracing.install_tracer`).
+    tracer: Union[Tracer, None] = current_tracer()
+    if tracer is not None:
+        tracer.on_start(
+            algorithm='multi_informed_flooding',
+            node=node,
+            resource=','.join(sorted(resources)),
+            ttl=ttl
+        )
+        tracer.on_enqueue(node=node, ttl=ttl)
+
+    while queue and pending:
+        current_node, current_ttl, current_path = queue.pop(0)
+        visited_nodes.add(current_node)
+        if tracer is not None:
+            tracer.on_visit(node=current_node, ttl=current_ttl)
+
+        # Recursos encontrados!
+        for resource in pending & current_node.resources:
+            results[resource] = _found(
+                algorithm='multi_informed_flooding',
+                resource=resource,
+                node=current_node,
+                path=current_path,
+                messages_count=messages_count,
+                involved_nodes=len(visited_nodes)
+            )
+            if tracer is not None:
+                tracer.on_found(
+                    node=current_node,
+                    resource=resource,
+                    path=current_path
+                )
+            # Atualiza o cache dos nós da origem até o nó com o recurso.
+            for node_path in current_path:
+                node_path.add_cache(node=current_node, resource=resource)
+        pending -= current_node.resources
+        if not pending:
+            break
+
+        for neighbor in current_node.neighbors:
+            # Ignora os nós já visitados e que tenham TTL > 0
+            if current_ttl > 0:
+                messages_count += 1
+                if tracer is not None:
+                    tracer.on_message(sender=current_node, receiver=neighbor)
+                if neighbor not in visited_nodes:
+                    visited_nodes.add(neighbor)
+                    # Vai direto para os nós que têm algum recurso pendente.
+                    for resource in pending:
+                        if neighbor.know_resource(resource=resource):
+                            # O nó que contém o recurso (cache).
+                            target_node: Any = neighbor.get_node_by_resource(
+                                resource=resource
+                            )
+                            queue.insert(
+                                0,
+                                (target_node, 0, current_path + [target_node])
+                            )
+                            visited_nodes.add(target_node)
+                            if tracer is not None:
+                                tracer.on_cache_hit(
+                                    node=neighbor,
+                                    resource=resource,
+                                    target=target_node
+                                )
+                                tracer.on_enqueue(node=target_node, ttl=0)
+                    queue.append(
+                        (neighbor, current_ttl - 1, current_path + [neighbor])
+                    )
+                    if tracer is not None:
+                        tracer.on_enqueue(node=neighbor, ttl=current_ttl - 1)
+
+    # Os recursos que não foram encontrados.
+    for resource in pending:
+        results[resource] = SearchResult(
+            algorithm='multi_informed_flooding',
+            resource=resource,
+            messages_count=messages_count,
+            involved_nodes=len(visited_nodes)
+        )
+
+    multi_result: MultiSearchResult = MultiSearchResult(
+        algorithm='multi_informed_flooding',
+        results={resource: results[resource] for resource in resources},
+        messages_count=messages_count,
+        involved_nodes=len(visited_nodes)
+    )
+    if tracer is not None:
+        tracer.on_structures(
+            frontier=len(queue),
+            visited=len(visited_nodes),
+            paths=sum(len(entry[2]) for entry in queue) +\
+                sum(len(found.path) for found in results.values())
+        )
+        tracer.on_end(result=multi_result)
+    return multi_result
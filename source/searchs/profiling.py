@@ -0,0 +1,231 @@
+"""Arquivo responsável pela medição da memória usada por cada busca,
+pelo `tracemalloc` e pelos tamanhos das estruturas das buscas."""
+
+import tracemalloc
+from typing import Any, Callable, Union
+
+from .tracing import Tracer
+from .tracing import install_tracer
+
+class QueryProfile:
+    """Representa a memória usada por uma busca."""
+    algorithm: str
+    peak_memory: int
+    allocations: int
+    frontier: int
+    visited: int
+    paths: int
+
+    def __init__(self, algorithm: str) -> None:
+        self.algorithm = algorithm
+        # O pico de memória (em bytes) acima do uso antes da busca.
+        self.peak_memory = 0
+        # A qntd. de blocos alocados, e não liberados, pela busca.
+        self.allocations = 0
+        # Os tamanhos das estruturas ao fim da busca (ver `Tracer`).
+        self.frontier = 0
+        self.visited = 0
+        self.paths = 0
+
+    def report(self) -> str:
+        """Descreve a memória usada pela busca.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return f'\n[Memória] Pico de {self.peak_memory / 1024:.1f} KiB' +\
+            f' ({self.allocations} blocos alocados)' +\
+            f'\n\t`--> Fila: {self.frontier} nós' +\
+            f'\n\t`--> Visitados: {self.visited} nós' +\
+            f'\n\t`--> Caminhos: {self.paths} nós'
+
+
+class AlgorithmProfile:
+    """Representa a memória usada pelas buscas de um algoritmo."""
+    algorithm: str
+    queries: int
+    peak_memory_sum: int
+    peak_memory_max: int
+    allocations_sum: int
+    frontier_max: int
+    visited_max: int
+    paths_max: int
+
+    def __init__(self, algorithm: str) -> None:
+        self.algorithm = algorithm
+        self.queries = 0
+        self.peak_memory_sum = 0
+        self.peak_memory_max = 0
+        self.allocations_sum = 0
+        self.frontier_max = 0
+        self.visited_max = 0
+        self.paths_max = 0
+
+    def add(self, profile: QueryProfile) -> None:
+        """Agrega a memória usada por uma busca.
+
+        Parameters
+        ----------
+        profile : QueryProfile
+            A memória usada pela busca.
+        """
+        self.queries += 1
+        self.peak_memory_sum += profile.peak_memory
+        self.peak_memory_max = max(self.peak_memory_max, profile.peak_memory)
+        self.allocations_sum += profile.allocations
+        self.frontier_max = max(self.frontier_max, profile.frontier)
+        self.visited_max = max(self.visited_max, profile.visited)
+        self.paths_max = max(self.paths_max, profile.paths)
+
+    def report(self) -> str:
+        """Descreve a memória usada pelas buscas do algoritmo.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        queries: int = max(self.queries, 1)
+        return f'\n[{self.algorithm}] {self.queries} buscas' +\
+            f'\n\t`--> Pico médio: {self.peak_memory_sum / queries / 1024:.1f}' +\
+            f' KiB (máximo de {self.peak_memory_max / 1024:.1f} KiB)' +\
+            f'\n\t`--> Média de blocos alocados:' +\
+            f' {self.allocations_sum / queries:.1f}' +\
+            f'\n\t`--> Máximos ao fim da busca: fila de {self.frontier_max},' +\
+            f' {self.visited_max} visitados e {self.paths_max} nós em caminhos'
+
+
+class SearchProfiler(Tracer):
+    """Representa a medição, opcional, da memória usada pelas buscas.
+
+    Cada busca é executada com o `tracemalloc` ativo, registrando o
+    pico de memória e, comparando os 'snapshots' de antes e depois, os
+    blocos alocados (e não liberados) e os locais do código que os
+    alocaram. Como rastreador, recebe os tamanhos das estruturas ao
+    fim da busca. Os 'snapshots' percorrem toda a memória rastreada,
+    logo, em topologias grandes, podem ser desativados ('snapshots').
+    """
+    snapshots: bool
+    profiles: dict[str, AlgorithmProfile]
+    last: Union[QueryProfile, None]
+
+    def __init__(self, snapshots: bool = True) -> None:
+        self.snapshots = snapshots
+        self.profiles = {}
+        self.last = None
+        # Os locais de alocação: (bytes, blocos) por arquivo e linha.
+        self.__sites: dict[str, list[int]] = {}
+
+    def on_structures(self, frontier: int, visited: int, paths: int) -> None:
+        if self.last is not None:
+            self.last.frontier = frontier
+            self.last.visited = visited
+            self.last.paths = paths
+
+    def profile(self, search: Callable, algorithm: str, **kwargs) -> Any:
+        """Executa uma busca, medindo a memória usada por ela.
+
+        Parameters
+        ----------
+        search : Callable
+            O algoritmo de busca.
+        algorithm : str
+            O nome do algoritmo, usado na agregação.
+        **kwargs: Any
+            Os parâmetros do algoritmo de busca.
+
+        Returns
+        -------
+        Any
+            O resultado da busca.
+        """
+        profile: QueryProfile = QueryProfile(algorithm=algorithm)
+        self.last = profile
+        started: bool = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        before: Union[tracemalloc.Snapshot, None] = \
+            tracemalloc.take_snapshot() if self.snapshots else None
+        tracemalloc.reset_peak()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        previous: Union[Tracer, None] = install_tracer(tracer=self)
+        try:
+            result: Any = search(**kwargs)
+        finally:
+            install_tracer(tracer=previous)
+            profile.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+            after: Union[tracemalloc.Snapshot, None] = \
+                tracemalloc.take_snapshot() if self.snapshots else None
+            if started:
+                tracemalloc.stop()
+
+        if before is not None:
+            # Ignora as alocações do próprio rastreamento.
+            ignored: list[tracemalloc.Filter] = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+            for stat in after.filter_traces(ignored).compare_to(
+                    before.filter_traces(ignored),
+                    'lineno'
+                ):
+                if stat.count_diff > 0:
+                    profile.allocations += stat.count_diff
+                    frame: Any = stat.traceback[0]
+                    site: list[int] = self.__sites.setdefault(
+                        f'{frame.filename}:{frame.lineno}', [0, 0]
+                    )
+                    site[0] += stat.size_diff
+                    site[1] += stat.count_diff
+
+        self.profiles.setdefault(
+            algorithm,
+            AlgorithmProfile(algorithm=algorithm)
+        ).add(profile=profile)
+        return result
+
+    def top_sites(self, limit: int = 10) -> list[tuple[str, int, int]]:
+        """Informa os locais do código que mais alocaram memória.
+
+        Parameters
+        ----------
+        limit : int, optional
+            A qntd. de locais, por padrão 10.
+
+        Returns
+        -------
+        list[tuple[str, int, int]]
+            O local (arquivo:linha), os bytes e os blocos alocados,
+            em ordem decrescente de bytes.
+        """
+        return sorted(
+            ((site, size, count) for site, (size, count) in self.__sites.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )[:limit]
+
+    def report(self, limit: int = 10) -> str:
+        """Descreve a memória usada por algoritmo e os locais que
+        mais alocaram memória.
+
+        Parameters
+        ----------
+        limit : int, optional
+            A qntd. de locais exibidos, por padrão 10.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        text: str = ''.join(
+            profile.report() for profile in self.profiles.values()
+        )
+        if sites := self.top_sites(limit=limit):
+            text += '\n[Locais de alocação]' + ''.join(
+                f'\n\t`--> {site}: {size / 1024:.1f} KiB em {count} blocos'
+                for site, size, count in sites
+            )
+        return text
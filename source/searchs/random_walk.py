@@ -1,9 +1,22 @@
 """Arquivo responsável pela busca por passeio aleatório."""
 
-from typing import Any
-from random import shuffle
+from random import Random
+from typing import Any, Union
 
-def random_walk(node: Any, resource: str, ttl: int) -> None:
+from .result import SearchResult
+from .rng import make_seed
+from .rng import lazy_permutation
+from .rng import neighbor_sequence
+from .tracing import Tracer
+from .tracing import current_tracer
+
+def random_walk(
+        node: Any,
+        resource: str,
+        ttl: int,
+        seed: Union[int, None] = None,
+        network: Any = None
+    ) -> SearchResult:
     """Aplica o algoritmo de busca por passeio aleatório.
 
     Parte do nó de origem 'node', buscando pelo recurso
@@ -18,12 +31,38 @@ def random_walk(node: Any, resource: str, ttl: int) -> None:
         O recurso a ser buscado na topologia.
     ttl : int
         O limitador de 'saltos' na busca.
+    seed : Union[int, None], optional
+        A semente da busca, que, se repetida, repete exatamente
+        o mesmo passeio, por padrão uma nova semente.
+    network : Any, optional
+        A topologia, que mantém os vizinhos de cada nó em uma tupla,
+        evitando copiá-los a cada 'salto', por padrão nada.
+
+    Returns
+    -------
+    SearchResult
+        O resultado da busca.
     """
     # Qntd. de mensagens trocadas entre os nós.
     messages_count: int = 0
-    resource_found: bool = False
+    result: SearchResult = SearchResult(
+        algorithm='random_walk',
+        resource=resource,
+        seed=make_seed(seed=seed)
+    )
+    rng: Random = Random(result.seed)
     # Os nós que já foram visitados.
     visited_nodes: set[str] = set()
+    # O rastreador, se instalado (ver `tracing.install_tracer`).
+    tracer: Union[Tracer, None] = current_tracer()
+    if tracer is not None:
+        tracer.on_start(
+            algorithm='random_walk',
+            node=node,
+            resource=resource,
+            ttl=ttl
+        )
+        tracer.on_enqueue(node=node, ttl=ttl)
 
     def recursive_walk(
             node: Any,
@@ -44,33 +83,35 @@ def random_walk(node: Any, resource: str, ttl: int) -> None:
         path : list[Any]
             O caminho do nó origem até o nó atual.
         """
-        nonlocal messages_count, resource_found, visited_nodes
+        nonlocal messages_count, visited_nodes
 
         # Recurso foi encontrado!
-        if resource in node.resources:
-            print(
-                f'\nO recurso {resource} FOI' +\
-                f' encontrado no nó {node.node_id}!' +\
-                '\n\t`--> Caminho: ' +\
-                ' -> '.join(n.node_id for n in path) +\
-                f'\n\t`--> Qntd. de mensagens trocadas: {messages_count}' +\
-                f'\n\t`--> Qntd. de nós envolvidos: {len(visited_nodes)}'
-            )
-            resource_found = True
+        if resource in node.resources and not result.found:
+            result.node = node
+            result.path = path
+            result.messages_count = messages_count
+            result.involved_nodes = len(visited_nodes)
+            if tracer is not None:
+                tracer.on_found(node=node, resource=resource, path=path)
 
         # Marca o nó atual como visitado.
         visited_nodes.add(node)
+        if tracer is not None:
+            tracer.on_visit(node=node, ttl=ttl)
 
-        # Cria uma cópia e randomiza a ordem dos vizinhos.
-        neighbors: list[Any] = list(node.neighbors)
-        random_neighbors: list[Any] = list(neighbors)
-        shuffle(x=random_neighbors)
-
-        for neighbor in random_neighbors:
+        # Percorre os vizinhos em ordem aleatória, sorteando-os sob demanda.
+        for neighbor in lazy_permutation(
+                items=neighbor_sequence(node=node, network=network),
+                rng=rng
+            ):
             # Ignora os nós já visitados e que tenham TTL > 0
             if ttl > 0:
                 messages_count += 1
+                if tracer is not None:
+                    tracer.on_message(sender=node, receiver=neighbor)
                 if neighbor not in visited_nodes:
+                    if tracer is not None:
+                        tracer.on_enqueue(node=neighbor, ttl=ttl - 1)
                     recursive_walk(
                         node=neighbor,
                         resource=resource,
@@ -81,9 +122,14 @@ def random_walk(node: Any, resource: str, ttl: int) -> None:
     recursive_walk(node=node, resource=resource, ttl=ttl, path=[node])
 
     # Caso o recurso não seja encontrado.
-    if not resource_found:
-        print(
-            f'\nO recurso {resource} NÃO foi encontrado.' +\
-            f'\n\t`--> Qntd. de mensagens trocadas: {messages_count}' +\
-            f'\n\t`--> Qntd. de nós envolvidos: {len(visited_nodes)}'
+    if not result.found:
+        result.messages_count = messages_count
+        result.involved_nodes = len(visited_nodes)
+    if tracer is not None:
+        tracer.on_structures(
+            frontier=0,
+            visited=len(visited_nodes),
+            paths=len(result.path)
         )
+        tracer.on_end(result=result)
+    return result
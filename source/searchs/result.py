@@ -0,0 +1,123 @@
+"""Arquivo responsável pelos registros de resultado
+dos algoritmos de busca."""
+
+from typing import Any, Union
+
+class SearchResult:
+    """Representa o resultado de uma busca por um recurso."""
+    algorithm: str
+    resource: str
+    node: Union[Any, None]
+    path: list[Any]
+    messages_count: int
+    involved_nodes: int
+    seed: Union[int, None]
+    stretch: Union[float, None]
+
+    def __init__(
+            self,
+            algorithm: str,
+            resource: str,
+            node: Union[Any, None] = None,
+            path: Union[list[Any], None] = None,
+            messages_count: int = 0,
+            involved_nodes: int = 0,
+            seed: Union[int, None] = None
+        ) -> None:
+        self.algorithm = algorithm
+        self.resource = resource
+        self.node = node
+        self.path = path or []
+        self.messages_count = messages_count
+        self.involved_nodes = involved_nodes
+        self.seed = seed
+        # O estiramento do caminho, informado pelo índice de marcos.
+        self.stretch = None
+
+    @property
+    def found(self) -> bool:
+        """Se o recurso foi encontrado."""
+        return self.node is not None
+
+    @property
+    def hops(self) -> Union[int, None]:
+        """A qntd. de 'saltos' da origem até o nó com o recurso,
+        ou nada, caso o recurso não tenha sido encontrado."""
+        return len(self.path) - 1 if self.found else None
+
+    def report(self) -> str:
+        """Descreve o resultado da busca.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        # A semente só existe nas buscas aleatórias e o estiramento,
+        # apenas com o índice de marcos da topologia.
+        seed: str = '' if self.seed is None else \
+            f'\n\t`--> Semente: {self.seed}'
+        stretch: str = '' if self.stretch is None else \
+            f'\n\t`--> Estiramento do caminho: {self.stretch:.2f}'
+        if self.found:
+            return f'\nO recurso {self.resource} FOI' +\
+                f' encontrado no nó {self.node.node_id}!' +\
+                '\n\t`--> Caminho: ' +\
+                ' -> '.join(n.node_id for n in self.path) +\
+                f'\n\t`--> Qntd. de mensagens trocadas: {self.messages_count}' +\
+                f'\n\t`--> Qntd. de nós envolvidos: {self.involved_nodes}' +\
+                seed + stretch
+        return f'\nO recurso {self.resource} NÃO foi encontrado.' +\
+            f'\n\t`--> Qntd. de mensagens trocadas: {self.messages_count}' +\
+            f'\n\t`--> Qntd. de nós envolvidos: {self.involved_nodes}' +\
+            seed
+
+
+class MultiSearchResult:
+    """Representa o resultado de uma busca, com uma única
+    travessia, por múltiplos recursos."""
+    algorithm: str
+    results: dict[str, SearchResult]
+    messages_count: int
+    involved_nodes: int
+
+    def __init__(
+            self,
+            algorithm: str,
+            results: dict[str, SearchResult],
+            messages_count: int = 0,
+            involved_nodes: int = 0
+        ) -> None:
+        self.algorithm = algorithm
+        self.results = results
+        self.messages_count = messages_count
+        self.involved_nodes = involved_nodes
+
+    @property
+    def found(self) -> bool:
+        """Se todos os recursos foram encontrados."""
+        return all(result.found for result in self.results.values())
+
+    @property
+    def amortized_messages(self) -> float:
+        """A qntd. de mensagens trocadas por recurso buscado."""
+        return self.messages_count / max(len(self.results), 1)
+
+    def report(self) -> str:
+        """Descreve o resultado da busca, recurso por recurso.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return ''.join(
+            result.report() for result in self.results.values()
+        ) +\
+            '\n\nTotal de recursos encontrados: ' +\
+            f'{sum(r.found for r in self.results.values())}' +\
+            f'/{len(self.results)}' +\
+            f'\n\t`--> Qntd. de mensagens trocadas: {self.messages_count}' +\
+            '\n\t`--> Qntd. de mensagens por recurso: ' +\
+            f'{self.amortized_messages:.2f}' +\
+            f'\n\t`--> Qntd. de nós envolvidos: {self.involved_nodes}'
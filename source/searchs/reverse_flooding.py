@@ -0,0 +1,209 @@
+"""Arquivo responsável pela busca por inundação reversa, partindo,
+simultaneamente, de todos os nós que contém determinado recurso."""
+
+from collections import deque
+from typing import Any, Iterable, Union
+
+class FloodingIndex:
+    """Representa o resultado de uma inundação reversa.
+
+    Guarda, para cada nó da topologia, a distância (em 'saltos')
+    até o nó mais próximo que contém o recurso e o próximo 'salto'
+    em direção a ele, permitindo responder, por consulta, se uma
+    busca por inundação, partindo de qualquer nó e com qualquer TTL,
+    encontraria o recurso.
+
+    As métricas que dependem da ordem de visita de uma inundação
+    partindo de um nó específico (qntd. de mensagens trocadas e
+    qntd. de nós envolvidos) NÃO podem ser derivadas de uma única
+    inundação reversa, veja `messages`.
+    """
+    resource: str
+    holders: set[Any]
+    distances: dict[Any, int]
+    next_hops: dict[Any, Any]
+
+    def __init__(
+            self,
+            resource: str,
+            holders: set[Any],
+            distances: dict[Any, int],
+            next_hops: dict[Any, Any]
+        ) -> None:
+        self.resource = resource
+        self.holders = holders
+        self.distances = distances
+        self.next_hops = next_hops
+
+    def distance(self, node: Any) -> Union[int, float]:
+        """Informa a distância, em 'saltos', de um nó até
+        o nó mais próximo que contém o recurso.
+
+        Parameters
+        ----------
+        node : Any
+            Um nó qualquer da topologia.
+
+        Returns
+        -------
+        Union[int, float]
+            A distância até o nó mais próximo com o recurso, ou
+            infinito, caso nenhum nó com o recurso seja alcançável.
+        """
+        return self.distances.get(node, float('inf'))
+
+    def next_hop(self, node: Any) -> Union[Any, None]:
+        """Informa o vizinho de um nó que está mais próximo
+        do nó com o recurso.
+
+        Parameters
+        ----------
+        node : Any
+            Um nó qualquer da topologia.
+
+        Returns
+        -------
+        Union[Any, None]
+            O próximo 'salto', ou nada, caso o nó já contenha
+            o recurso ou nenhum nó com o recurso seja alcançável.
+        """
+        return self.next_hops.get(node)
+
+    def path(self, node: Any) -> list[Any]:
+        """Reconstrói o caminho mais curto de um nó até o nó
+        mais próximo que contém o recurso.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem.
+
+        Returns
+        -------
+        list[Any]
+            O caminho, do nó de origem até o nó com o recurso, ou
+            uma lista vazia, caso o recurso não seja alcançável.
+        """
+        if node not in self.distances:
+            return []
+
+        path: list[Any] = [node]
+        while (hop := self.next_hops.get(path[-1])) is not None:
+            path.append(hop)
+        return path
+
+    def is_found(self, node: Any, ttl: Union[int, float]) -> bool:
+        """Informa se uma busca por inundação, partindo de um nó
+        e limitada por um TTL, encontraria o recurso.
+
+        Na busca por inundação, um nó a 'd' saltos da origem é
+        visitado com TTL igual a 'ttl - d', logo, o recurso é
+        encontrado se, e somente se, 'd <= ttl'.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem da busca.
+        ttl : Union[int, float]
+            O limitador de 'saltos' na busca.
+
+        Returns
+        -------
+        bool
+            Se o recurso seria encontrado.
+        """
+        return self.distance(node=node) <= ttl
+
+    def messages(self, node: Any, ttl: Union[int, float]) -> Union[int, None]:
+        """Informa a qntd. de mensagens trocadas por uma busca por
+        inundação partindo de um nó, quando for possível derivá-la.
+
+        A qntd. só é conhecida quando a origem não envia nenhuma
+        mensagem, isto é, quando a própria origem contém o recurso ou
+        quando o TTL é zero. Nos demais casos, a qntd. depende da ordem
+        de visita dos vizinhos e de todos os nós dentro do raio do TTL
+        da origem, o que exige uma inundação própria para cada origem.
+
+        Parameters
+        ----------
+        node : Any
+            O nó de origem da busca.
+        ttl : Union[int, float]
+            O limitador de 'saltos' na busca.
+
+        Returns
+        -------
+        Union[int, None]
+            A qntd. de mensagens, ou nada, caso não seja possível
+            derivá-la.
+        """
+        if node in self.holders or ttl == 0:
+            return 0
+        return None
+
+    def reachable_within(self, ttl: Union[int, float]) -> set[Any]:
+        """Informa todos os nós a partir dos quais uma busca por
+        inundação, limitada pelo TTL, encontraria o recurso.
+
+        Parameters
+        ----------
+        ttl : Union[int, float]
+            O limitador de 'saltos' na busca.
+
+        Returns
+        -------
+        set[Any]
+            Os nós de origem em que a busca teria sucesso.
+        """
+        return {
+            node for node, distance in self.distances.items()
+            if distance <= ttl
+        }
+
+
+def reverse_flooding(nodes: Iterable[Any], resource: str) -> FloodingIndex:
+    """Aplica o algoritmo de busca por inundação reversa.
+
+    Realiza uma única busca em largura (BFS), com múltiplas
+    origens, partindo de todos os nós que contém o recurso
+    'resource', respondendo, em O(N + E), a busca por inundação
+    de todos os nós de origem de uma só vez.
+
+    Parameters
+    ----------
+    nodes : Iterable[Any]
+        Os nós da topologia.
+    resource : str
+        O recurso a ser buscado na topologia.
+
+    Returns
+    -------
+    FloodingIndex
+        As distâncias e os próximos 'saltos' de cada nó até
+        o nó mais próximo que contém o recurso.
+    """
+    holders: set[Any] = {
+        node for node in nodes if resource in node.resources
+    }
+    distances: dict[Any, int] = dict.fromkeys(holders, 0)
+    next_hops: dict[Any, Any] = {}
+
+    # As conexões são bidirecionais, logo, quem alcança um nó com
+    # o recurso é alcançado por ele.
+    queue: deque[Any] = deque(holders)
+    while queue:
+        current_node = queue.popleft()
+        next_distance: int = distances[current_node] + 1
+
+        for neighbor in current_node.neighbors:
+            if neighbor not in distances:
+                distances[neighbor] = next_distance
+                next_hops[neighbor] = current_node
+                queue.append(neighbor)
+
+    return FloodingIndex(
+        resource=resource,
+        holders=holders,
+        distances=distances,
+        next_hops=next_hops
+    )
@@ -0,0 +1,76 @@
+"""Arquivo responsável pela geração de números aleatórios
+reproduzíveis dos algoritmos de busca."""
+
+from random import Random
+from secrets import randbits
+from typing import Any, Iterator, Sequence, Union
+
+def make_seed(seed: Union[int, None] = None) -> int:
+    """Informa a semente de uma busca, sorteando uma nova,
+    caso nenhuma seja fornecida.
+
+    Parameters
+    ----------
+    seed : Union[int, None], optional
+        A semente fornecida, por padrão nada.
+
+    Returns
+    -------
+    int
+        A semente a ser usada (e registrada no resultado), que
+        permite repetir exatamente a mesma busca.
+    """
+    return randbits(63) if seed is None else seed
+
+def neighbor_sequence(node: Any, network: Any = None) -> Sequence[Any]:
+    """Informa os vizinhos de um nó como uma sequência, para
+    `lazy_permutation`, reaproveitando a tupla dos nós congelados ou
+    a mantida pela topologia (ver `Network.neighbor_sequence`) e
+    copiando o conjunto apenas quando a topologia não é fornecida.
+
+    Parameters
+    ----------
+    node : Any
+        O nó visitado.
+    network : Any, optional
+        A topologia do nó, por padrão nada.
+
+    Returns
+    -------
+    Sequence[Any]
+        Os vizinhos do nó, na ordem do conjunto.
+    """
+    if network is not None:
+        return network.neighbor_sequence(node=node)
+    if isinstance(node.neighbors, tuple):
+        return node.neighbors
+    return tuple(node.neighbors)
+
+def lazy_permutation(items: Sequence[Any], rng: Random) -> Iterator[Any]:
+    """Percorre os elementos em uma ordem aleatória, sorteando
+    cada elemento apenas quando ele é pedido.
+
+    Aplica o algoritmo de Fisher-Yates sem copiar a sequência: as
+    trocas ficam em um dicionário, logo, parar a iteração após 'k'
+    elementos custa O(k), e não O(n), sorteios e memória.
+
+    Parameters
+    ----------
+    items : Sequence[Any]
+        Os elementos a serem percorridos (não são alterados).
+    rng : Random
+        O gerador de números aleatórios da busca.
+
+    Yields
+    ------
+    Any
+        O próximo elemento da permutação.
+    """
+    size: int = len(items)
+    random = rng.random
+    swaps: dict[int, int] = {}
+    for index in range(size - 1, -1, -1):
+        chosen: int = min(int(random() * (index + 1)), index)
+        yield items[swaps.get(chosen, chosen)]
+        # O elemento da última posição ocupa o lugar do sorteado.
+        swaps[chosen] = swaps.get(index, index)
@@ -0,0 +1,405 @@
+"""Arquivo responsável pelo rastreamento (tracing) dos algoritmos de
+busca: os ganchos chamados durante as buscas, a gravação compactada
+dos eventos e a sua exportação para o formato de eventos do Chrome."""
+
+import gzip
+from json import dumps, loads
+from struct import Struct
+from time import perf_counter_ns
+from typing import Any, Iterator, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+# * Os tipos de evento.
+START: int = 0      # A busca começou.
+ENQUEUE: int = 1    # Um nó entrou na fila (ou pilha) de nós a visitar.
+MESSAGE: int = 2    # Uma mensagem foi trocada entre dois nós.
+VISIT: int = 3      # Um nó foi visitado.
+CACHE_HIT: int = 4  # Um nó conhecia, pelo cache, o nó com o recurso.
+FOUND: int = 5      # O recurso foi encontrado.
+END: int = 6        # A busca terminou.
+
+# * Os nomes dos eventos, usados nos arquivos JSONL e no Chrome.
+EVENT_NAMES: list[str] = [
+    'start',
+    'enqueue',
+    'message',
+    'visit',
+    'cache_hit',
+    'found',
+    'end',
+]
+
+# * Os formatos de gravação disponíveis.
+TRACE_FORMATS: set[str] = {
+    'binary',
+    'jsonl',
+}
+
+# * O cabeçalho dos arquivos binários.
+BINARY_MAGIC: bytes = b'P2PTRACE\x01'
+
+# * A qntd. máxima de textos (ids dos nós) codificados reaproveitados.
+TEXT_CACHE_SIZE: int = 4096
+
+_RECORD: Struct = Struct('<BQIq')
+_TEXT: Struct = Struct('<H')
+
+# O rastreador instalado (ver `install_tracer`).
+_TRACER: Union['Tracer', None] = None
+
+def _ttl(ttl: Union[int, float]) -> int:
+    """Converte o TTL para inteiro (-1 se infinito)."""
+    return -1 if ttl == float('inf') else int(ttl)
+
+def current_tracer() -> Union['Tracer', None]:
+    """Informa o rastreador instalado.
+
+    As buscas o consultam uma única vez, ao começar, e só chamam os
+    ganchos se houver um rastreador, logo, sem rastreador, o custo é
+    o de uma comparação com nada por evento.
+
+    Returns
+    -------
+    Union[Tracer, None]
+        O rastreador, ou nada, caso nenhum esteja instalado.
+    """
+    return _TRACER
+
+def install_tracer(tracer: Union['Tracer', None]) -> Union['Tracer', None]:
+    """Instala um rastreador, usado pelas buscas seguintes.
+
+    Parameters
+    ----------
+    tracer : Union[Tracer, None]
+        O rastreador, ou nada, para desinstalar o atual.
+
+    Returns
+    -------
+    Union[Tracer, None]
+        O rastreador instalado anteriormente.
+    """
+    global _TRACER
+    previous: Union[Tracer, None] = _TRACER
+    _TRACER = tracer
+    return previous
+
+
+class Tracer:
+    """Representa um rastreador, cujos ganchos são chamados durante
+    as buscas; por padrão, nenhum gancho faz nada, logo, basta
+    sobrescrever os de interesse."""
+
+    def on_start(
+            self,
+            algorithm: str,
+            node: Any,
+            resource: str,
+            ttl: Union[int, float]
+        ) -> None:
+        """A busca 'algorithm' começou no nó 'node'."""
+
+    def on_enqueue(self, node: Any, ttl: Union[int, float]) -> None:
+        """O nó 'node' entrou na fila de nós a visitar, com o TTL 'ttl'."""
+
+    def on_message(self, sender: Any, receiver: Any) -> None:
+        """Uma mensagem foi enviada de 'sender' para 'receiver'."""
+
+    def on_visit(self, node: Any, ttl: Union[int, float]) -> None:
+        """O nó 'node' foi visitado, com o TTL 'ttl'."""
+
+    def on_cache_hit(self, node: Any, resource: str, target: Any) -> None:
+        """O nó 'node' conhecia, pelo cache, o nó 'target' com o recurso."""
+
+    def on_found(self, node: Any, resource: str, path: list[Any]) -> None:
+        """O recurso foi encontrado no nó 'node', pelo caminho 'path'."""
+
+    def on_structures(self, frontier: int, visited: int, paths: int) -> None:
+        """Os tamanhos das estruturas da busca, ao terminar: os nós
+        ainda na fila, os nós visitados e os nós guardados nos caminhos
+        (da fila e dos resultados)."""
+
+    def on_end(self, result: Any) -> None:
+        """A busca terminou, com o resultado 'result'."""
+
+
+class TraceRecorder(Tracer):
+    """Representa o rastreador que grava os eventos em um arquivo
+    compactado (gzip), em binário ou em JSONL.
+
+    Os eventos são codificados, ao ocorrerem, em um buffer de no
+    máximo 'capacity' eventos, gravado (e esvaziado) sempre que fica
+    cheio, logo, a memória usada não depende da qntd. de mensagens
+    da busca. Pode ser usado como gerenciador de contexto, que o
+    instala e, ao fim, grava os eventos restantes e fecha o arquivo.
+
+    Cada evento é uma tupla (tipo, instante em ns, busca, nó, alvo,
+    recurso, valor), em que o valor é o TTL (-1 se infinito) em
+    'start', 'enqueue' e 'visit', os saltos em 'found' e as mensagens
+    trocadas em 'end'.
+    """
+    file_path: str
+    trace_format: str
+    capacity: int
+    events_count: int
+    flushes: int
+
+    def __init__(
+            self,
+            file_path: str,
+            trace_format: str = 'binary',
+            capacity: int = 65536
+        ) -> None:
+        # Lança uma exceção caso algum parâmetro seja inválido.
+        if trace_format not in TRACE_FORMATS:
+            raise InvalidParam(
+                f'O formato \'{trace_format}\' fornecido é inválido.'
+            )
+        if capacity < 1:
+            raise InvalidParam('A capacidade do buffer deve ser positiva.')
+
+        self.file_path = file_path
+        self.trace_format = trace_format
+        self.capacity = capacity
+        self.events_count = 0
+        self.flushes = 0
+        # Os eventos já codificados, ainda não gravados.
+        self.__buffer: bytearray = bytearray()
+        self.__buffered: int = 0
+        self.__texts: dict[str, bytes] = {}
+        self.__query: int = -1
+        self.__previous: Union[Tracer, None] = None
+        self.__file: Any = gzip.open(file_path, 'wb', compresslevel=6)
+        if trace_format == 'binary':
+            self.__file.write(BINARY_MAGIC)
+
+    def __enter__(self) -> 'TraceRecorder':
+        self.__previous = install_tracer(tracer=self)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        install_tracer(tracer=self.__previous)
+        self.close()
+
+    def __record(
+            self,
+            kind: int,
+            node: str = '',
+            target: str = '',
+            resource: str = '',
+            value: int = 0
+        ) -> None:
+        """Codifica um evento no buffer, gravando-o se estiver cheio."""
+        if self.trace_format == 'binary':
+            self.__buffer += _RECORD.pack(
+                kind, perf_counter_ns(), self.__query, value
+            )
+            for text in (node, target, resource):
+                if (data := self.__texts.get(text)) is None:
+                    # Os textos codificados são reaproveitados, até o
+                    # limite de 'TEXT_CACHE_SIZE' textos.
+                    if len(self.__texts) >= TEXT_CACHE_SIZE:
+                        self.__texts.clear()
+                    encoded: bytes = text.encode('utf-8')
+                    data = self.__texts[text] = _TEXT.pack(len(encoded)) + encoded
+                self.__buffer += data
+        else:
+            self.__buffer += dumps(
+                _event_to_dict(
+                    event=(
+                        kind,
+                        perf_counter_ns(),
+                        self.__query,
+                        node,
+                        target,
+                        resource,
+                        value
+                    )
+                )
+            ).encode('utf-8') + b'\n'
+        self.__buffered += 1
+        if self.__buffered >= self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        """Grava (e descarta) os eventos do buffer."""
+        if not self.__buffered:
+            return
+        self.__file.write(self.__buffer)
+        self.events_count += self.__buffered
+        self.flushes += 1
+        self.__buffer.clear()
+        self.__buffered = 0
+
+    def close(self) -> None:
+        """Grava os eventos restantes e fecha o arquivo."""
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+    def on_start(
+            self,
+            algorithm: str,
+            node: Any,
+            resource: str,
+            ttl: Union[int, float]
+        ) -> None:
+        self.__query += 1
+        self.__record(
+            kind=START,
+            node=node.node_id,
+            target=algorithm,
+            resource=resource,
+            value=_ttl(ttl=ttl)
+        )
+
+    def on_enqueue(self, node: Any, ttl: Union[int, float]) -> None:
+        self.__record(kind=ENQUEUE, node=node.node_id, value=_ttl(ttl=ttl))
+
+    def on_message(self, sender: Any, receiver: Any) -> None:
+        self.__record(kind=MESSAGE, node=sender.node_id, target=receiver.node_id)
+
+    def on_visit(self, node: Any, ttl: Union[int, float]) -> None:
+        self.__record(kind=VISIT, node=node.node_id, value=_ttl(ttl=ttl))
+
+    def on_cache_hit(self, node: Any, resource: str, target: Any) -> None:
+        self.__record(
+            kind=CACHE_HIT,
+            node=node.node_id,
+            target=target.node_id,
+            resource=resource
+        )
+
+    def on_found(self, node: Any, resource: str, path: list[Any]) -> None:
+        self.__record(
+            kind=FOUND,
+            node=node.node_id,
+            resource=resource,
+            value=len(path) - 1
+        )
+
+    def on_end(self, result: Any) -> None:
+        # As buscas por múltiplos recursos não têm um único nó.
+        node: Any = getattr(result, 'node', None)
+        self.__record(
+            kind=END,
+            node='' if node is None else node.node_id,
+            resource=getattr(result, 'resource', ''),
+            value=result.messages_count
+        )
+
+
+def _event_to_dict(event: tuple) -> dict[str, Any]:
+    """Converte um evento para o seu registro JSONL."""
+    kind, time_ns, query, node, target, resource, value = event
+    return {
+        'event': EVENT_NAMES[kind],
+        'time_ns': time_ns,
+        'query': query,
+        'node': node,
+        'target': target,
+        'resource': resource,
+        'value': value,
+    }
+
+def read_trace(file_path: str) -> Iterator[tuple]:
+    """Lê, sob demanda, os eventos de um arquivo gravado por
+    `TraceRecorder`, em qualquer formato.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo.
+
+    Yields
+    ------
+    tuple
+        O próximo evento (ver `TraceRecorder`).
+    """
+    with gzip.open(file_path, 'rb') as file:
+        if file.peek(len(BINARY_MAGIC)).startswith(BINARY_MAGIC):
+            file.read(len(BINARY_MAGIC))
+            while header := file.read(_RECORD.size):
+                kind, time_ns, query, value = _RECORD.unpack(header)
+                texts: list[str] = []
+                for _ in range(3):
+                    (size,) = _TEXT.unpack(file.read(_TEXT.size))
+                    texts.append(file.read(size).decode('utf-8'))
+                yield (kind, time_ns, query, *texts, value)
+        else:
+            for line in file:
+                record: dict[str, Any] = loads(line)
+                yield (
+                    EVENT_NAMES.index(record['event']),
+                    record['time_ns'],
+                    record['query'],
+                    record['node'],
+                    record['target'],
+                    record['resource'],
+                    record['value']
+                )
+
+def export_chrome_trace(file_path: str, output_path: str) -> int:
+    """Exporta um arquivo gravado por `TraceRecorder` para o formato
+    de eventos do Chrome (legível em 'chrome://tracing' ou Perfetto).
+
+    Cada busca é uma 'thread', com a sua duração como um bloco e os
+    demais eventos como instantes. A conversão é feita evento a
+    evento, sem carregar o arquivo na memória.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo gravado.
+    output_path : str
+        O caminho do arquivo '.json' a ser criado.
+
+    Returns
+    -------
+    int
+        A qntd. de eventos exportados.
+    """
+    count: int = 0
+    origin: Union[int, None] = None
+    with open(output_path, 'w', encoding='utf-8') as output:
+        output.write('{"traceEvents": [\n')
+        for kind, time_ns, query, node, target, resource, value in \
+            read_trace(file_path=file_path):
+            if origin is None:
+                origin = time_ns
+            event: dict[str, Any] = {
+                'pid': 0,
+                'tid': query,
+                'ts': (time_ns - origin) / 1000,
+            }
+            if kind == START:
+                event.update(
+                    name=f'{target} {resource}',
+                    ph='B',
+                    args={'node': node, 'ttl': value}
+                )
+            elif kind == END:
+                event.update(
+                    name='end',
+                    ph='E',
+                    args={'node': node, 'messages_count': value}
+                )
+            else:
+                event.update(
+                    name=EVENT_NAMES[kind],
+                    ph='i',
+                    s='t',
+                    args={
+                        key: field for key, field in (
+                            ('node', node),
+                            ('target', target),
+                            ('resource', resource),
+                            ('value', value),
+                        ) if field != ''
+                    }
+                )
+            output.write((',\n' if count else '') + dumps(event))
+            count += 1
+        output.write('\n]}\n')
+    return count
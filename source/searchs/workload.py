@@ -0,0 +1,278 @@
+"""Arquivo responsável pela execução, sem interação com o
+usuário, de uma carga de buscas (workload) em uma topologia."""
+
+from random import Random
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidSearchAlgorithm
+
+from .result import SearchResult
+from .execute import AVAILABLE_SEARCH_ALGORITHMS
+from .execute import NETWORK_SEARCH_ALGORITHMS
+from .execute import NEIGHBOR_SEARCH_ALGORITHMS
+from .execute import RANDOMIZED_SEARCH_ALGORITHMS
+from .execute import MULTI_RESOURCE_SEARCH_ALGORITHMS
+
+class WorkloadSummary:
+    """Representa as métricas agregadas de uma carga de buscas.
+
+    Guarda também a soma dos quadrados das mensagens e dos 'saltos',
+    permitindo calcular a variância (e intervalos de confiança) sem
+    guardar cada busca.
+    """
+    algorithm: str
+    queries: int
+    found: int
+    messages_count: int
+    messages_squares: int
+    hops_count: int
+    hops_squares: int
+    stretch_count: int
+    stretch_sum: float
+
+    def __init__(self, algorithm: str) -> None:
+        self.algorithm = algorithm
+        self.queries = 0
+        self.found = 0
+        self.messages_count = 0
+        self.messages_squares = 0
+        self.hops_count = 0
+        self.hops_squares = 0
+        self.stretch_count = 0
+        self.stretch_sum = 0.0
+
+    def add(self, result: SearchResult) -> None:
+        """Contabiliza o resultado de uma busca.
+
+        Parameters
+        ----------
+        result : SearchResult
+            O resultado de uma busca da carga.
+        """
+        self.queries += 1
+        self.messages_count += result.messages_count
+        self.messages_squares += result.messages_count ** 2
+        if result.found:
+            self.found += 1
+            self.hops_count += result.hops
+            self.hops_squares += result.hops ** 2
+        if result.stretch is not None:
+            self.stretch_count += 1
+            self.stretch_sum += result.stretch
+
+    def merge(self, other: 'WorkloadSummary') -> None:
+        """Contabiliza as métricas de outra carga do mesmo algoritmo.
+
+        Parameters
+        ----------
+        other : WorkloadSummary
+            As métricas agregadas da outra carga.
+        """
+        self.queries += other.queries
+        self.found += other.found
+        self.messages_count += other.messages_count
+        self.messages_squares += other.messages_squares
+        self.hops_count += other.hops_count
+        self.hops_squares += other.hops_squares
+        self.stretch_count += other.stretch_count
+        self.stretch_sum += other.stretch_sum
+
+    @property
+    def success_rate(self) -> float:
+        """A fração das buscas que encontraram o recurso."""
+        return self.found / max(self.queries, 1)
+
+    @property
+    def mean_messages(self) -> float:
+        """A média de mensagens trocadas por busca."""
+        return self.messages_count / max(self.queries, 1)
+
+    @property
+    def mean_hops(self) -> float:
+        """A média de 'saltos' das buscas com sucesso."""
+        return self.hops_count / max(self.found, 1)
+
+    @property
+    def mean_stretch(self) -> Union[float, None]:
+        """A média do estiramento dos caminhos encontrados, ou nada,
+        caso a topologia não tenha o índice de marcos."""
+        if not self.stretch_count:
+            return None
+        return self.stretch_sum / self.stretch_count
+
+    def report(self) -> str:
+        """Descreve as métricas agregadas da carga.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        stretch: str = '' if self.mean_stretch is None else \
+            f'\n\t`--> Média do estiramento: {self.mean_stretch:.2f}'
+        return f'\n[{self.algorithm}] {self.queries} buscas' +\
+            f'\n\t`--> Taxa de sucesso: {self.success_rate:.2%}' +\
+            f'\n\t`--> Média de mensagens trocadas: {self.mean_messages:.2f}' +\
+            f'\n\t`--> Média de saltos: {self.mean_hops:.2f}' +\
+            stretch
+
+
+def run_workload(
+        network: Any,
+        algorithm: str,
+        queries: list[tuple[str, str]],
+        ttl: Union[int, float] = float('inf'),
+        seed: Union[int, None] = None,
+        ttl_controller: Any = None,
+        profiler: Any = None,
+        checkpoint: Any = None
+    ) -> WorkloadSummary:
+    """Executa uma carga de buscas em uma topologia.
+
+    Diferente de `execute`, nada é exibido ao usuário, permitindo
+    a execução de cargas grandes. Caso a topologia tenha o índice de
+    marcos (ver `Network.landmarks`), o estiramento dos caminhos
+    encontrados também é agregado.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia onde as buscas serão executadas.
+    algorithm : str
+        O nome do algoritmo de busca a ser executado.
+    queries : list[tuple[str, str]]
+        As buscas, cada uma composta pelo id do nó de origem
+        e pelo recurso a ser buscado.
+    ttl : Union[int, float], optional
+        O limitador de 'saltos' das buscas, por padrão infinito.
+    seed : Union[int, None], optional
+        A semente da carga, da qual são derivadas as sementes de
+        cada busca aleatória, por padrão nada (não reproduzível).
+    ttl_controller : Any, optional
+        O controlador adaptativo (`AdaptiveTTL`), que, se fornecido,
+        escolhe o TTL de cada busca e aprende com o seu resultado,
+        substituindo o TTL fixo, por padrão nada.
+    profiler : Any, optional
+        A medição da memória (`SearchProfiler`), que, se fornecida,
+        agrega a memória usada por cada busca, por padrão nada.
+    checkpoint : Any, optional
+        Os pontos de retomada (`WorkloadCheckpoint`), que, se
+        fornecidos, são gravados periodicamente e, na retomada,
+        continuam a carga de onde ela parou, por padrão nada.
+
+    Returns
+    -------
+    WorkloadSummary
+        As métricas agregadas da carga.
+
+    Raises
+    ------
+    InvalidSearchAlgorithm
+        Caso o algoritmo seja inválido ou busque por múltiplos recursos.
+    TopologyMismatch
+        Caso, na retomada, os pontos tenham sido salvos em outra topologia.
+    InvalidParam
+        Caso, na retomada, os pontos tenham sido salvos por outra carga.
+    """
+    # Lança uma exceção ao tentar um algoritmo de busca inválido.
+    if algorithm not in AVAILABLE_SEARCH_ALGORITHMS or \
+        algorithm in MULTI_RESOURCE_SEARCH_ALGORITHMS:
+        raise InvalidSearchAlgorithm(
+            f'O algoritmo \'{algorithm}\' fornecido é inválido' +\
+            ' para uma carga de buscas.'
+        )
+
+    rng: Random = Random(seed)
+    summary: WorkloadSummary = WorkloadSummary(algorithm=algorithm)
+    start: int = 0 if checkpoint is None else checkpoint.start(
+        network=network,
+        algorithm=algorithm,
+        queries=queries,
+        ttl=ttl,
+        seed=seed,
+        rng=rng,
+        summary=summary,
+        ttl_controller=ttl_controller
+    )
+    try:
+        _run_queries(
+            network=network,
+            algorithm=algorithm,
+            queries=queries,
+            start=start,
+            ttl=ttl,
+            rng=rng,
+            summary=summary,
+            ttl_controller=ttl_controller,
+            profiler=profiler,
+            checkpoint=checkpoint
+        )
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+    return summary
+
+def _run_queries(
+        network: Any,
+        algorithm: str,
+        queries: list[tuple[str, str]],
+        start: int,
+        ttl: Union[int, float],
+        rng: Random,
+        summary: WorkloadSummary,
+        ttl_controller: Any,
+        profiler: Any,
+        checkpoint: Any
+    ) -> None:
+    """Executa as buscas da carga a partir de uma posição,
+    agregando-as em 'summary' (ver `run_workload`)."""
+    search = AVAILABLE_SEARCH_ALGORITHMS[algorithm]
+    # Apenas as buscas que dependem da topologia a recebem.
+    extra_params: dict[str, Any] = {
+        'network': network
+    } if algorithm in NETWORK_SEARCH_ALGORITHMS or \
+        algorithm in NEIGHBOR_SEARCH_ALGORITHMS else {}
+    randomized: bool = algorithm in RANDOMIZED_SEARCH_ALGORITHMS
+
+    for position in range(start, len(queries)):
+        node_id, resource = queries[position]
+        if randomized:
+            extra_params['seed'] = rng.getrandbits(63)
+        node: Any = network.find_node_by_id(node_id=node_id)
+        query_ttl: Union[int, float] = ttl if ttl_controller is None else \
+            ttl_controller.select(
+                algorithm=algorithm,
+                node=node,
+                resource=resource
+            )
+        if profiler is None:
+            result: SearchResult = search(
+                node=node,
+                resource=resource,
+                ttl=query_ttl,
+                **extra_params
+            )
+        else:
+            result = profiler.profile(
+                search=search,
+                algorithm=algorithm,
+                node=node,
+                resource=resource,
+                ttl=query_ttl,
+                **extra_params
+            )
+        if ttl_controller is not None:
+            ttl_controller.observe(node=node, ttl=query_ttl, result=result)
+        # Mede o caminho encontrado, caso o índice de marcos já exista.
+        if network.landmark_index is not None:
+            result.stretch = network.landmark_index.stretch(result=result)
+        summary.add(result=result)
+        if checkpoint is not None:
+            checkpoint.record(
+                position=position,
+                result=result,
+                rng=rng,
+                summary=summary,
+                total=len(queries)
+            )
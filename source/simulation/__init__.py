@@ -0,0 +1,23 @@
+"""Pacote responsável pelas simulações, em rodadas,
+de protocolos executados sobre uma topologia."""
+
+from .gossip import GossipRound
+from .gossip import GossipProtocol
+from .peers import PeerRuntime
+from .peers import RuntimeStats
+from .peers import run_concurrent_workload
+from .sockets import SocketCluster
+from .sockets import TransportStats
+from .sockets import run_socket_workload
+
+# Indica o que está disponível para uso no pacote.
+__all__: list[str] = [
+    'GossipRound',
+    'GossipProtocol',
+    'PeerRuntime',
+    'RuntimeStats',
+    'run_concurrent_workload',
+    'SocketCluster',
+    'TransportStats',
+    'run_socket_workload',
+]
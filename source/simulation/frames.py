@@ -0,0 +1,297 @@
+"""Arquivo responsável pela codificação binária das mensagens trocadas
+entre os processos da execução distribuída (ver `sockets.py`), agrupadas
+em quadros (frames) prefixados pelo tamanho."""
+
+import asyncio
+from struct import Struct
+from typing import Any, Union
+
+# * Os tipos de mensagem.
+QUERY: int = 0      # Inundação.
+WALK: int = 1       # O andarilho de um passeio aleatório.
+BACK: int = 2       # O retorno do andarilho ao par anterior.
+HIT: int = 3        # O recurso foi encontrado (e os caches, atualizados).
+RETURN: int = 4     # O peso (e as métricas) devolvido ao coordenador.
+FORGET: int = 5     # A busca terminou: o estado dos passeios é descartado.
+HELLO: int = 6      # Um processo informa o seu endereço ao coordenador.
+ADDRESSES: int = 7  # O coordenador informa os endereços de todos os processos.
+READY: int = 8      # Um processo já está conectado aos demais.
+STOP: int = 9       # O processo deve terminar.
+STATS: int = 10     # As métricas do processo, enviadas ao terminar.
+
+# * Os códigos dos algoritmos de busca.
+ALGORITHM_CODES: dict[str, int] = {
+    'flooding': 0,
+    'informed_flooding': 1,
+    'random_walk': 2,
+    'informed_random_walk': 3,
+}
+
+# * O TTL infinito, codificado em 32 bits.
+INFINITE_TTL: int = 0xFFFFFFFF
+
+_HEADER: Struct = Struct('<BB16sI')
+_TYPE: Struct = Struct('<B')
+_GUID: Struct = Struct('<B16s')
+_COUNT: Struct = Struct('<H')
+_LENGTH: Struct = Struct('<I')
+_INDEX: Struct = Struct('<I')
+_RETURN_COUNTS: Struct = Struct('<II')
+_STATS: Struct = Struct('<BQQQI')
+
+def _encode_path(path: list[int]) -> bytes:
+    """Codifica um caminho (os índices dos nós)."""
+    return _COUNT.pack(len(path)) + b''.join(map(_INDEX.pack, path))
+
+def _encode_text(text: str) -> bytes:
+    """Codifica um texto em UTF-8, prefixado pelo tamanho."""
+    data: bytes = text.encode('utf-8')
+    return _COUNT.pack(len(data)) + data
+
+def _encode_weight(weight: int) -> bytes:
+    """Codifica um peso (inteiro de até 255 bytes)."""
+    data: bytes = weight.to_bytes((weight.bit_length() + 7) // 8, 'big')
+    return bytes((len(data),)) + data
+
+def encode_search(
+        kind: int,
+        algorithm: int,
+        guid: bytes,
+        ttl: Union[int, float],
+        weight: int,
+        resource: str,
+        path: list[int]
+    ) -> bytes:
+    """Codifica uma mensagem de busca ('QUERY', 'WALK' ou 'BACK').
+
+    Parameters
+    ----------
+    kind : int
+        O tipo da mensagem.
+    algorithm : int
+        O código do algoritmo de busca.
+    guid : bytes
+        O identificador (16 bytes) da busca.
+    ttl : Union[int, float]
+        O TTL restante.
+    weight : int
+        O peso carregado pela mensagem (ver `SocketCluster`).
+    resource : str
+        O recurso buscado.
+    path : list[int]
+        Os índices dos nós, da origem até o destinatário.
+
+    Returns
+    -------
+    bytes
+        A mensagem codificada.
+    """
+    return _HEADER.pack(
+        kind,
+        algorithm,
+        guid,
+        INFINITE_TTL if ttl == float('inf') else int(ttl)
+    ) + _encode_weight(weight=weight) + _encode_text(text=resource) +\
+        _encode_path(path=path)
+
+def encode_hit(guid: bytes, resource: str, path: list[int]) -> bytes:
+    """Codifica uma mensagem 'HIT', com o caminho até o recurso."""
+    return _GUID.pack(HIT, guid) + _encode_text(text=resource) +\
+        _encode_path(path=path)
+
+def encode_return(
+        guid: bytes,
+        weight: int,
+        messages_count: int,
+        involved_nodes: int
+    ) -> bytes:
+    """Codifica uma mensagem 'RETURN', com o peso devolvido e as
+    métricas da busca no processo."""
+    return _GUID.pack(RETURN, guid) + _encode_weight(weight=weight) +\
+        _RETURN_COUNTS.pack(messages_count, involved_nodes)
+
+def encode_forget(guid: bytes) -> bytes:
+    """Codifica uma mensagem 'FORGET'."""
+    return _GUID.pack(FORGET, guid)
+
+def encode_hello(shard: int, address: str) -> bytes:
+    """Codifica uma mensagem 'HELLO', com o endereço do processo."""
+    return _TYPE.pack(HELLO) + _COUNT.pack(shard) + _encode_text(text=address)
+
+def encode_addresses(addresses: list[str]) -> bytes:
+    """Codifica uma mensagem 'ADDRESSES'."""
+    return _TYPE.pack(ADDRESSES) + _COUNT.pack(len(addresses)) + b''.join(
+        _encode_text(text=address) for address in addresses
+    )
+
+def encode_signal(kind: int) -> bytes:
+    """Codifica uma mensagem sem conteúdo ('READY' ou 'STOP')."""
+    return _TYPE.pack(kind)
+
+def encode_stats(
+        frames_sent: int,
+        bytes_sent: int,
+        messages_count: int,
+        connections: int
+    ) -> bytes:
+    """Codifica uma mensagem 'STATS', com as métricas do processo."""
+    return _STATS.pack(
+        STATS, frames_sent, bytes_sent, messages_count, connections
+    )
+
+def decode_batch(payload: bytes) -> list[tuple]:
+    """Decodifica as mensagens de um quadro.
+
+    Parameters
+    ----------
+    payload : bytes
+        O conteúdo do quadro (sem o prefixo de tamanho).
+
+    Returns
+    -------
+    list[tuple]
+        As mensagens, cada uma uma tupla iniciada pelo tipo:
+        (tipo, algoritmo, guid, ttl, peso, recurso, caminho) nas
+        buscas, (tipo, guid, recurso, caminho) em 'HIT', (tipo, guid,
+        peso, mensagens, nós envolvidos) em 'RETURN', (tipo, guid) em
+        'FORGET', (tipo, processo, endereço) em 'HELLO', (tipo,
+        endereços) em 'ADDRESSES', (tipo, quadros, bytes, mensagens,
+        conexões) em 'STATS' e (tipo,) nas demais.
+    """
+    view: memoryview = memoryview(payload)
+    offset: int = _COUNT.size
+    messages: list[tuple] = []
+
+    def text() -> str:
+        nonlocal offset
+        (size,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size + size
+        return str(view[offset - size:offset], 'utf-8')
+
+    def weight() -> int:
+        nonlocal offset
+        size: int = view[offset]
+        offset += 1 + size
+        return int.from_bytes(view[offset - size:offset], 'big')
+
+    def path() -> list[int]:
+        nonlocal offset
+        (size,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        nodes: list[int] = [
+            index for (index,) in _INDEX.iter_unpack(
+                view[offset:offset + size * _INDEX.size]
+            )
+        ]
+        offset += size * _INDEX.size
+        return nodes
+
+    for _ in range(_COUNT.unpack_from(view, 0)[0]):
+        kind: int = view[offset]
+        if kind in (QUERY, WALK, BACK):
+            _, algorithm, guid, ttl = _HEADER.unpack_from(view, offset)
+            offset += _HEADER.size
+            messages.append((
+                kind,
+                algorithm,
+                guid,
+                float('inf') if ttl == INFINITE_TTL else ttl,
+                weight(),
+                text(),
+                path()
+            ))
+        elif kind in (HIT, RETURN, FORGET):
+            _, guid = _GUID.unpack_from(view, offset)
+            offset += _GUID.size
+            if kind == HIT:
+                messages.append((kind, guid, text(), path()))
+            elif kind == RETURN:
+                returned: int = weight()
+                counts: tuple[int, int] = _RETURN_COUNTS.unpack_from(view, offset)
+                offset += _RETURN_COUNTS.size
+                messages.append((kind, guid, returned) + counts)
+            else:
+                messages.append((kind, guid))
+        elif kind == HELLO:
+            (shard,) = _COUNT.unpack_from(view, offset + 1)
+            offset += 1 + _COUNT.size
+            messages.append((kind, shard, text()))
+        elif kind == ADDRESSES:
+            (size,) = _COUNT.unpack_from(view, offset + 1)
+            offset += 1 + _COUNT.size
+            messages.append((kind, [text() for _ in range(size)]))
+        elif kind == STATS:
+            messages.append(_STATS.unpack_from(view, offset))
+            offset += _STATS.size
+        else:
+            offset += 1
+            messages.append((kind,))
+    return messages
+
+
+class FrameWriter:
+    """Representa uma conexão persistente de saída, que agrupa as
+    mensagens em quadros: o quadro é enviado ao atingir 'batch_size'
+    mensagens ou, no máximo, ao fim da iteração atual do laço de
+    eventos, logo, as mensagens geradas por um mesmo quadro recebido
+    seguem juntas."""
+    writer: asyncio.StreamWriter
+    batch_size: int
+    frames_sent: int
+    bytes_sent: int
+
+    def __init__(self, writer: asyncio.StreamWriter, batch_size: int) -> None:
+        self.writer = writer
+        self.batch_size = batch_size
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.__buffer: list[bytes] = []
+        self.__scheduled: bool = False
+
+    def send(self, message: bytes) -> None:
+        """Adiciona uma mensagem codificada ao próximo quadro.
+
+        Parameters
+        ----------
+        message : bytes
+            A mensagem codificada.
+        """
+        self.__buffer.append(message)
+        if len(self.__buffer) >= self.batch_size:
+            self.flush()
+        elif not self.__scheduled:
+            self.__scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Envia as mensagens pendentes em um único quadro."""
+        self.__scheduled = False
+        if not self.__buffer or self.writer.is_closing():
+            return
+        payload: bytes = _COUNT.pack(len(self.__buffer)) + b''.join(self.__buffer)
+        self.__buffer.clear()
+        self.writer.write(_LENGTH.pack(len(payload)) + payload)
+        self.frames_sent += 1
+        self.bytes_sent += _LENGTH.size + len(payload)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Union[list[tuple], None]:
+    """Lê e decodifica o próximo quadro de uma conexão.
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        A conexão de entrada.
+
+    Returns
+    -------
+    Union[list[tuple], None]
+        As mensagens do quadro, ou nada, caso a conexão tenha sido
+        fechada.
+    """
+    try:
+        (size,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+        payload: Any = await reader.readexactly(size)
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        return None
+    return decode_batch(payload=payload)
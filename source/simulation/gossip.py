@@ -0,0 +1,269 @@
+"""Arquivo responsável pela simulação do protocolo de fofoca
+(gossip), em que os nós anunciam, periodicamente, seus recursos
+aos vizinhos, populando os caches usados pelas buscas informadas."""
+
+from random import Random
+from typing import Any, Union
+
+# Exceções.
+from exceptions import InvalidParam
+
+class GossipRound:
+    """Representa as métricas de uma rodada do protocolo."""
+    round: int
+    messages_count: int
+    total_messages: int
+    entries_count: int
+    expired_entries: int
+    coverage: float
+
+    def __init__(
+            self,
+            round: int, # pylint: disable=redefined-builtin
+            messages_count: int,
+            total_messages: int,
+            entries_count: int,
+            expired_entries: int,
+            coverage: float
+        ) -> None:
+        self.round = round
+        self.messages_count = messages_count
+        self.total_messages = total_messages
+        self.entries_count = entries_count
+        self.expired_entries = expired_entries
+        self.coverage = coverage
+
+    def report(self) -> str:
+        """Descreve as métricas da rodada.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return f'[Rodada {self.round}]' +\
+            f' Mensagens: {self.messages_count}' +\
+            f' (total: {self.total_messages}),' +\
+            f' entradas anunciadas: {self.entries_count},' +\
+            f' entradas expiradas: {self.expired_entries},' +\
+            f' cobertura: {self.coverage:.2%}'
+
+
+class GossipProtocol:
+    """Representa o protocolo de fofoca sobre uma topologia.
+
+    A cada rodada, os nós (em ordem aleatória) enviam um resumo
+    (digest) para 'fanout' vizinhos aleatórios, até que o orçamento
+    de mensagens da rodada se esgote. O resumo contém os recursos
+    do próprio nó e, até 'digest_size' entradas, as entradas mais
+    recentes que o nó conhece, cada uma marcada com a rodada em que
+    o nó dono do recurso a anunciou, logo, uma entrada só se mantém
+    recente enquanto o dono continuar anunciando o recurso e é
+    removida do cache após 'max_age' rodadas sem ser renovada. Apenas
+    as entradas criadas pelo protocolo são removidas: as que o nó já
+    conhecia (ex.: pelas buscas informadas) são anunciadas, mas nunca
+    expiram.
+    """
+    network: Any
+    fanout: int
+    budget: Union[int, float]
+    max_age: int
+    digest_size: int
+    round: int
+    total_messages: int
+    stamps: dict[Any, dict[tuple[Any, str], int]]
+
+    def __init__(
+            self,
+            network: Any,
+            fanout: int = 1,
+            budget: Union[int, float] = float('inf'),
+            max_age: int = 10,
+            digest_size: int = 0,
+            seed: Union[int, None] = None
+        ) -> None:
+        # Lança uma exceção caso algum parâmetro seja inválido.
+        if fanout < 1 or budget < 0 or max_age < 0 or digest_size < 0:
+            raise InvalidParam(
+                'O \'fanout\' deve ser positivo e o orçamento, a idade' +\
+                ' máxima e o tamanho do resumo não podem ser negativos.'
+            )
+
+        self.network = network
+        self.fanout = fanout
+        self.budget = budget
+        self.max_age = max_age
+        self.digest_size = digest_size
+        self.round = 0
+        self.total_messages = 0
+        self.stamps = {}
+        # As entradas que o protocolo adicionou aos caches, as únicas
+        # removidas ao expirarem.
+        self.__created: dict[Any, set[tuple[Any, str]]] = {}
+        self.__rng = Random(seed)
+        self.__nodes = list(network.nodes_by_id.values())
+        self.__resources = {
+            resource for node in self.__nodes for resource in node.resources
+        }
+
+    def __digest(self, node: Any) -> list[tuple[Any, str, int]]:
+        """Monta o resumo anunciado por um nó.
+
+        Parameters
+        ----------
+        node : Any
+            O nó que fará o anúncio.
+
+        Returns
+        -------
+        list[tuple[Any, str, int]]
+            As entradas do resumo, compostas pelo nó dono do
+            recurso, pelo recurso e pela rodada do anúncio.
+        """
+        digest: list[tuple[Any, str, int]] = [
+            (node, resource, self.round) for resource in node.resources
+        ]
+        if self.digest_size and (known := self.stamps.get(node)):
+            digest.extend(
+                (holder, resource, stamp)
+                for (holder, resource), stamp in sorted(
+                    known.items(),
+                    key=lambda entry: entry[1],
+                    reverse=True
+                )[:self.digest_size]
+            )
+        return digest
+
+    def __deliver(
+            self,
+            receiver: Any,
+            digest: list[tuple[Any, str, int]]
+        ) -> None:
+        """Entrega um resumo a um nó, atualizando o seu cache.
+
+        Parameters
+        ----------
+        receiver : Any
+            O nó que recebe o resumo.
+        digest : list[tuple[Any, str, int]]
+            As entradas do resumo.
+        """
+        known: dict[tuple[Any, str], int] = self.stamps.setdefault(
+            receiver, {}
+        )
+        for holder, resource, stamp in digest:
+            if holder is receiver:
+                continue
+            if known.get((holder, resource), -1) < stamp:
+                created: set[tuple[Any, str]] = self.__created.setdefault(
+                    receiver, set()
+                )
+                if (holder, resource) not in known and \
+                        resource not in receiver.cache.get(holder, ()):
+                    created.add((holder, resource))
+                if (holder, resource) in created:
+                    receiver.add_cache(node=holder, resource=resource)
+                known[(holder, resource)] = stamp
+
+    def __expire(self) -> int:
+        """Remove dos caches as entradas que não foram renovadas
+        nas últimas 'max_age' rodadas.
+
+        Returns
+        -------
+        int
+            A qntd. de entradas removidas.
+        """
+        expired_entries: int = 0
+        for receiver, known in self.stamps.items():
+            expired: list[tuple[Any, str]] = [
+                entry for entry, stamp in known.items()
+                if self.round - stamp > self.max_age
+            ]
+            created: set[tuple[Any, str]] = self.__created.get(receiver, set())
+            for holder, resource in expired:
+                del known[(holder, resource)]
+                if (holder, resource) not in created:
+                    continue
+                created.discard((holder, resource))
+                expired_entries += 1
+                if (resources := receiver.cache.get(holder)) is not None:
+                    resources.discard(resource)
+                    if not resources:
+                        del receiver.cache[holder]
+        return expired_entries
+
+    def coverage(self) -> float:
+        """Calcula a cobertura do protocolo.
+
+        Returns
+        -------
+        float
+            A fração dos pares (nó, recurso) em que o nó contém
+            o recurso ou conhece, pelo cache, um nó que o contém.
+        """
+        if not self.__nodes or not self.__resources:
+            return 1.0
+
+        covered: int = 0
+        for node in self.__nodes:
+            known: set[str] = set(node.resources)
+            for resources in node.cache.values():
+                known |= resources
+            covered += len(known & self.__resources)
+        return covered / (len(self.__nodes) * len(self.__resources))
+
+    def run_round(self) -> GossipRound:
+        """Executa uma rodada do protocolo.
+
+        Returns
+        -------
+        GossipRound
+            As métricas da rodada.
+        """
+        self.round += 1
+        messages_count: int = 0
+        entries_count: int = 0
+
+        self.__rng.shuffle(self.__nodes)
+        for node in self.__nodes:
+            if messages_count >= self.budget:
+                break
+
+            neighbors: list[Any] = list(node.neighbors)
+            digest: list[tuple[Any, str, int]] = self.__digest(node=node)
+            for neighbor in self.__rng.sample(
+                    neighbors,
+                    min(self.fanout, len(neighbors))
+                ):
+                if messages_count >= self.budget:
+                    break
+                messages_count += 1
+                entries_count += len(digest)
+                self.__deliver(receiver=neighbor, digest=digest)
+
+        self.total_messages += messages_count
+        return GossipRound(
+            round=self.round,
+            messages_count=messages_count,
+            total_messages=self.total_messages,
+            entries_count=entries_count,
+            expired_entries=self.__expire(),
+            coverage=self.coverage()
+        )
+
+    def run(self, rounds: int) -> list[GossipRound]:
+        """Executa várias rodadas do protocolo.
+
+        Parameters
+        ----------
+        rounds : int
+            A qntd. de rodadas.
+
+        Returns
+        -------
+        list[GossipRound]
+            As métricas de cada rodada, mostrando como a cobertura
+            cresce em relação às mensagens gastas.
+        """
+        return [self.run_round() for _ in range(rounds)]
@@ -0,0 +1,610 @@
+"""Arquivo responsável pela execução concorrente das buscas, em que
+cada nó é um par (peer) com a sua própria fila de mensagens,
+processada por uma tarefa do asyncio."""
+
+import asyncio
+from time import perf_counter
+from random import Random
+from collections import deque
+from collections import OrderedDict
+from typing import Any, Iterator, Union
+
+# Exceções.
+from exceptions import InvalidParam
+from exceptions import InvalidSearchAlgorithm
+
+from searchs import SearchResult
+from searchs.rng import lazy_permutation
+
+# * Os algoritmos de busca disponíveis como tratadores de mensagens.
+PEER_SEARCH_ALGORITHMS: set[str] = {
+    'flooding',
+    'informed_flooding',
+    'random_walk',
+    'informed_random_walk',
+}
+
+# * Os algoritmos que consultam o cache dos nós.
+INFORMED_SEARCH_ALGORITHMS: set[str] = {
+    'informed_flooding',
+    'informed_random_walk',
+}
+
+class PeerMessage:
+    """Representa uma mensagem entre dois pares.
+
+    Os tipos são 'query' (inundação), 'walk' (o andarilho de um
+    passeio aleatório) e 'back' (o retorno do andarilho ao par
+    anterior, quando não há mais vizinhos a visitar).
+    """
+    guid: int
+    kind: str
+    path: list[Any]
+    ttl: Union[int, float]
+
+    def __init__(
+            self,
+            guid: int,
+            kind: str,
+            path: list[Any],
+            ttl: Union[int, float]
+        ) -> None:
+        self.guid = guid
+        self.kind = kind
+        self.path = path
+        self.ttl = ttl
+
+
+class PeerQuery:
+    """Representa uma busca em andamento, terminada quando nenhuma
+    das suas mensagens estiver mais em trânsito."""
+    guid: int
+    result: SearchResult
+    rng: Random
+    in_flight: int
+    dropped: int
+    walkers: list['Peer']
+    started: float
+    done: asyncio.Event
+
+    def __init__(
+            self,
+            guid: int,
+            algorithm: str,
+            resource: str,
+            seed: int
+        ) -> None:
+        self.guid = guid
+        self.result = SearchResult(
+            algorithm=algorithm,
+            resource=resource,
+            seed=seed
+        )
+        self.rng = Random(seed)
+        self.in_flight = 0
+        # As mensagens da busca descartadas por filas cheias.
+        self.dropped = 0
+        # Os pares com o estado do passeio, descartado ao fim da busca.
+        self.walkers = []
+        self.started = perf_counter()
+        self.done = asyncio.Event()
+
+
+class Peer:
+    """Representa um par, com a fila limitada de mensagens recebidas e
+    os GUIDs das mensagens já vistas (também limitados, descartando os
+    mais antigos, exceto os dos passeios em andamento no par), usados
+    para ignorar mensagens duplicadas."""
+    node: Any
+    inbox: deque[PeerMessage]
+    seen: OrderedDict[int, None]
+    walks: dict[int, tuple[Iterator[Any], list[Any], Union[int, float]]]
+    task: Union[asyncio.Task, None]
+
+    def __init__(self, node: Any) -> None:
+        self.node = node
+        # A fila é limitada por `PeerRuntime` e esvaziada pela tarefa do
+        # par, sem esperas, logo, não precisa de uma `asyncio.Queue`.
+        self.inbox = deque()
+        self.seen = OrderedDict()
+        # O estado dos passeios que passaram pelo par: os vizinhos ainda
+        # não tentados, o caminho até o par e o TTL restante.
+        self.walks = {}
+        self.task = None
+
+
+class RuntimeStats:
+    """Representa as métricas de uma execução concorrente."""
+    queries: int
+    found: int
+    messages_count: int
+    duplicates: int
+    dropped: int
+    lossy_misses: int
+    max_queue_depth: int
+    queue_depth_sum: int
+    admission_waits: int
+    admission_wait_time: float
+    latency_sum: float
+    elapsed: float
+    peers: int
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.found = 0
+        self.messages_count = 0
+        self.duplicates = 0
+        self.dropped = 0
+        # As buscas sem sucesso que perderam mensagens, separadas das
+        # que, de fato, não encontraram o recurso.
+        self.lossy_misses = 0
+        self.max_queue_depth = 0
+        self.queue_depth_sum = 0
+        self.admission_waits = 0
+        self.admission_wait_time = 0.0
+        self.latency_sum = 0.0
+        self.elapsed = 0.0
+        self.peers = 0
+
+    @property
+    def throughput(self) -> float:
+        """A qntd. de buscas concluídas por segundo."""
+        return self.queries / max(self.elapsed, 1e-9)
+
+    @property
+    def message_rate(self) -> float:
+        """A qntd. de mensagens entregues por segundo."""
+        return self.messages_count / max(self.elapsed, 1e-9)
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """A média do tamanho da fila do par ao receber uma mensagem."""
+        return self.queue_depth_sum / max(self.messages_count, 1)
+
+    @property
+    def mean_latency(self) -> float:
+        """A média do tempo, em segundos, até a conclusão das buscas."""
+        return self.latency_sum / max(self.queries, 1)
+
+    def report(self) -> str:
+        """Descreve as métricas da execução.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return f'\n[Execução concorrente] {self.queries} buscas,' +\
+            f' {self.peers} pares acionados' +\
+            f'\n\t`--> Taxa de sucesso: {self.found / max(self.queries, 1):.2%}' +\
+            f'\n\t`--> Vazão: {self.throughput:.1f} buscas/s,' +\
+            f' {self.message_rate:.0f} mensagens/s' +\
+            f'\n\t`--> Latência média: {self.mean_latency * 1000:.2f} ms' +\
+            f'\n\t`--> Fila: média {self.mean_queue_depth:.2f},' +\
+            f' máxima {self.max_queue_depth}' +\
+            f'\n\t`--> Duplicadas ignoradas: {self.duplicates}' +\
+            f'\n\t`--> Descartadas (fila cheia): {self.dropped}' +\
+            f' ({self.lossy_misses} buscas sem sucesso com descartes)' +\
+            f'\n\t`--> Esperas na admissão: {self.admission_waits}' +\
+            f' ({self.admission_wait_time:.2f} s)'
+
+
+class PeerRuntime:
+    """Representa a execução concorrente das buscas em uma topologia.
+
+    Cada par recebe uma tarefa apenas enquanto tiver mensagens na fila,
+    logo, a memória e o escalonamento acompanham a carga, e não a qntd.
+    de nós. Uma mensagem de inundação para uma fila cheia é descartada
+    (e contada), já que esperar por espaço poderia travar dois pares
+    enviando um para o outro; a pressão é aplicada na admissão: novas
+    buscas esperam enquanto houver 'max_pending' mensagens em trânsito.
+    O andarilho de um passeio é a única mensagem da busca, logo, nunca
+    é descartado (a fila excede o limite em, no máximo, um andarilho
+    por busca em andamento), e as buscas sem sucesso que perderam
+    mensagens são contadas à parte das demais.
+
+    Diferente das buscas síncronas, uma inundação não é interrompida
+    ao encontrar o recurso, já que os pares não sabem do sucesso, e o
+    passeio aleatório em profundidade retrocede com mensagens 'back'.
+    """
+    network: Any
+    inbox_size: int
+    dedup_capacity: int
+    max_pending: int
+    stats: RuntimeStats
+
+    def __init__(
+            self,
+            network: Any,
+            inbox_size: int = 64,
+            dedup_capacity: int = 1024,
+            max_pending: int = 10_000,
+            seed: Union[int, None] = None
+        ) -> None:
+        # Lança uma exceção caso algum limite seja inválido.
+        if inbox_size < 1 or dedup_capacity < 1 or max_pending < 1:
+            raise InvalidParam(
+                'O tamanho das filas, a qntd. de GUIDs guardados e o' +\
+                ' limite de mensagens em trânsito devem ser positivos.'
+            )
+
+        self.network = network
+        self.inbox_size = inbox_size
+        self.dedup_capacity = dedup_capacity
+        self.max_pending = max_pending
+        self.stats = RuntimeStats()
+        self.__rng: Random = Random(seed)
+        self.__peers: dict[Any, Peer] = {}
+        self.__queries: dict[int, PeerQuery] = {}
+        self.__pending: int = 0
+        self.__drained: Union[asyncio.Event, None] = None
+
+    def __send(
+            self,
+            node: Any,
+            query: PeerQuery,
+            kind: str,
+            path: list[Any],
+            ttl: Union[int, float]
+        ) -> None:
+        """Entrega uma mensagem na fila de um par, criando a tarefa
+        do par, caso ele esteja ocioso."""
+        if (peer := self.__peers.get(node)) is None:
+            peer = self.__peers[node] = Peer(node=node)
+
+        # Fila cheia: a mensagem é perdida, exceto o andarilho, cuja
+        # perda terminaria o passeio sem resultado.
+        if len(peer.inbox) >= self.inbox_size and kind == 'query':
+            self.stats.dropped += 1
+            query.dropped += 1
+            return
+
+        peer.inbox.append(
+            PeerMessage(guid=query.guid, kind=kind, path=path, ttl=ttl)
+        )
+        query.in_flight += 1
+        self.__pending += 1
+        if self.__pending >= self.max_pending:
+            self.__drained.clear()
+        depth: int = len(peer.inbox)
+        self.stats.queue_depth_sum += depth
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth)
+        if kind != 'back' and len(path) > 1:
+            query.result.messages_count += 1
+        if peer.task is None:
+            peer.task = asyncio.create_task(self.__serve(peer=peer))
+
+    async def __serve(self, peer: Peer) -> None:
+        """Processa as mensagens de um par até esvaziar a fila."""
+        while peer.inbox:
+            message: PeerMessage = peer.inbox.popleft()
+            self.stats.messages_count += 1
+            query: PeerQuery = self.__queries[message.guid]
+            if message.kind == 'query':
+                self.__handle_query(peer=peer, query=query, message=message)
+            elif message.kind == 'walk':
+                self.__handle_walk(peer=peer, query=query, message=message)
+            else:
+                self.__advance_walk(peer=peer, query=query)
+
+            self.__pending -= 1
+            if self.__pending < self.max_pending:
+                self.__drained.set()
+            query.in_flight -= 1
+            self.__finish_if_idle(query=query)
+            # Dá a vez aos outros pares.
+            await asyncio.sleep(0)
+        peer.task = None
+
+    def __first_visit(self, peer: Peer, query: PeerQuery) -> bool:
+        """Marca o GUID da busca como visto pelo par, informando se
+        é a primeira vez que o par recebe a busca."""
+        if query.guid in peer.seen:
+            self.stats.duplicates += 1
+            return False
+        peer.seen[query.guid] = None
+        if len(peer.seen) > self.dedup_capacity:
+            # Descarta o GUID mais antigo sem passeio em andamento no
+            # par (nem o da própria busca, cujo passeio ainda será
+            # registrado), já que esquecê-lo faria o andarilho
+            # sobrescrever o estado do passeio, retrocedendo
+            # indefinidamente.
+            for guid in peer.seen:
+                if guid not in peer.walks and guid != query.guid:
+                    del peer.seen[guid]
+                    break
+        query.result.involved_nodes += 1
+        return True
+
+    def __hit(self, query: PeerQuery, path: list[Any]) -> None:
+        """Registra o primeiro par encontrado com o recurso."""
+        if query.result.found:
+            return
+        query.result.node = path[-1]
+        query.result.path = path
+        # Atualiza o cache dos nós da origem até o nó com o recurso.
+        if query.result.algorithm in INFORMED_SEARCH_ALGORITHMS:
+            for node_path in path:
+                node_path.add_cache(node=path[-1], resource=query.result.resource)
+
+    def __handle_query(
+            self,
+            peer: Peer,
+            query: PeerQuery,
+            message: PeerMessage
+        ) -> None:
+        """Trata uma mensagem de inundação (informada ou não)."""
+        if not self.__first_visit(peer=peer, query=query):
+            return
+
+        node: Any = peer.node
+        resource: str = query.result.resource
+        if resource in node.resources:
+            self.__hit(query=query, path=message.path)
+            return
+
+        # Vai direto para o nó que tem o recurso (cache).
+        if query.result.algorithm in INFORMED_SEARCH_ALGORITHMS and \
+            node.know_resource(resource=resource):
+            target_node: Any = node.get_node_by_resource(resource=resource)
+            self.__send(
+                node=target_node,
+                query=query,
+                kind='query',
+                path=message.path + [target_node],
+                ttl=0
+            )
+            return
+
+        if message.ttl > 0:
+            sender: Any = message.path[-2] if len(message.path) > 1 else None
+            for neighbor in node.neighbors:
+                if neighbor is not sender:
+                    self.__send(
+                        node=neighbor,
+                        query=query,
+                        kind='query',
+                        path=message.path + [neighbor],
+                        ttl=message.ttl - 1
+                    )
+
+    def __handle_walk(
+            self,
+            peer: Peer,
+            query: PeerQuery,
+            message: PeerMessage
+        ) -> None:
+        """Trata a chegada do andarilho de um passeio aleatório."""
+        # Já visitado: o andarilho volta para o par anterior.
+        if not self.__first_visit(peer=peer, query=query):
+            self.__send(
+                node=message.path[-2],
+                query=query,
+                kind='back',
+                path=message.path[:-1],
+                ttl=message.ttl + 1
+            )
+            return
+
+        node: Any = peer.node
+        resource: str = query.result.resource
+        if resource in node.resources:
+            self.__hit(query=query, path=message.path)
+            return
+
+        # Os vizinhos são sorteados sob demanda, exceto o par anterior.
+        sender: Any = message.path[-2] if len(message.path) > 1 else None
+        peer.walks[query.guid] = (
+            lazy_permutation(
+                items=tuple(n for n in node.neighbors if n is not sender),
+                rng=query.rng
+            ),
+            message.path,
+            message.ttl
+        )
+        query.walkers.append(peer)
+
+        # Vai direto para o nó que tem o recurso (cache).
+        if query.result.algorithm in INFORMED_SEARCH_ALGORITHMS and \
+            message.ttl > 0 and node.know_resource(resource=resource):
+            target_node: Any = node.get_node_by_resource(resource=resource)
+            self.__send(
+                node=target_node,
+                query=query,
+                kind='walk',
+                path=message.path + [target_node],
+                ttl=message.ttl - 1
+            )
+            return
+        self.__advance_walk(peer=peer, query=query)
+
+    def __advance_walk(self, peer: Peer, query: PeerQuery) -> None:
+        """Envia o andarilho ao próximo vizinho ainda não tentado, ou
+        de volta ao par anterior, caso não haja mais vizinhos."""
+        neighbors, path, ttl = peer.walks[query.guid]
+        if ttl > 0 and (neighbor := next(neighbors, None)) is not None:
+            self.__send(
+                node=neighbor,
+                query=query,
+                kind='walk',
+                path=path + [neighbor],
+                ttl=ttl - 1
+            )
+        elif len(path) > 1:
+            self.__send(
+                node=path[-2],
+                query=query,
+                kind='back',
+                path=path[:-1],
+                ttl=ttl + 1
+            )
+
+    def __finish_if_idle(self, query: PeerQuery) -> None:
+        """Conclui a busca quando nenhuma mensagem dela está em trânsito."""
+        if query.in_flight > 0 or query.done.is_set():
+            return
+        for peer in query.walkers:
+            peer.walks.pop(query.guid, None)
+        query.walkers.clear()
+        del self.__queries[query.guid]
+
+        self.stats.queries += 1
+        self.stats.found += query.result.found
+        self.stats.lossy_misses += bool(query.dropped) and not query.result.found
+        self.stats.latency_sum += perf_counter() - query.started
+        query.done.set()
+
+    async def search(
+            self,
+            algorithm: str,
+            node: Any,
+            resource: str,
+            ttl: Union[int, float] = float('inf')
+        ) -> SearchResult:
+        """Executa uma busca, concorrendo com as demais.
+
+        Parameters
+        ----------
+        algorithm : str
+            O nome do algoritmo de busca.
+        node : Any
+            O nó de origem da busca.
+        resource : str
+            O recurso a ser buscado.
+        ttl : Union[int, float], optional
+            O limitador de 'saltos' na busca, por padrão infinito.
+
+        Returns
+        -------
+        SearchResult
+            O resultado da busca.
+
+        Raises
+        ------
+        InvalidSearchAlgorithm
+            Caso o algoritmo não esteja disponível nos pares.
+        """
+        # Lança uma exceção ao tentar um algoritmo de busca inválido.
+        if algorithm not in PEER_SEARCH_ALGORITHMS:
+            raise InvalidSearchAlgorithm(
+                f'O algoritmo \'{algorithm}\' fornecido é inválido' +\
+                ' para a execução concorrente.'
+            )
+        if self.__drained is None:
+            self.__drained = asyncio.Event()
+            self.__drained.set()
+
+        # Aguarda enquanto houver mensagens demais em trânsito.
+        if not self.__drained.is_set():
+            self.stats.admission_waits += 1
+            waiting_since: float = perf_counter()
+            await self.__drained.wait()
+            self.stats.admission_wait_time += perf_counter() - waiting_since
+
+        guid: int = self.__rng.getrandbits(128)
+        query: PeerQuery = PeerQuery(
+            guid=guid,
+            algorithm=algorithm,
+            resource=resource,
+            seed=self.__rng.getrandbits(63)
+        )
+        self.__queries[guid] = query
+        self.__send(
+            node=node,
+            query=query,
+            kind='walk' if algorithm.endswith('random_walk') else 'query',
+            path=[node],
+            ttl=ttl
+        )
+        self.__finish_if_idle(query=query)
+        await query.done.wait()
+        return query.result
+
+    async def run(
+            self,
+            algorithm: str,
+            queries: list[tuple[str, str]],
+            ttl: Union[int, float] = float('inf'),
+            concurrency: int = 100
+        ) -> RuntimeStats:
+        """Executa uma carga de buscas, com até 'concurrency' buscas
+        simultâneas.
+
+        Parameters
+        ----------
+        algorithm : str
+            O nome do algoritmo de busca.
+        queries : list[tuple[str, str]]
+            As buscas, cada uma composta pelo id do nó de origem
+            e pelo recurso a ser buscado.
+        ttl : Union[int, float], optional
+            O limitador de 'saltos' das buscas, por padrão infinito.
+        concurrency : int, optional
+            A qntd. máxima de buscas simultâneas, por padrão 100.
+
+        Returns
+        -------
+        RuntimeStats
+            As métricas da execução.
+        """
+        remaining: Iterator[tuple[str, str]] = iter(queries)
+
+        async def client() -> None:
+            """Executa as buscas restantes, uma de cada vez."""
+            for node_id, resource in remaining:
+                await self.search(
+                    algorithm=algorithm,
+                    node=self.network.find_node_by_id(node_id=node_id),
+                    resource=resource,
+                    ttl=ttl
+                )
+
+        started: float = perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        self.stats.elapsed += perf_counter() - started
+        self.stats.peers = len(self.__peers)
+        return self.stats
+
+
+def run_concurrent_workload(
+        network: Any,
+        algorithm: str,
+        queries: list[tuple[str, str]],
+        ttl: Union[int, float] = float('inf'),
+        concurrency: int = 100,
+        **kwargs
+    ) -> RuntimeStats:
+    """Executa uma carga de buscas concorrentes em um novo laço de
+    eventos.
+
+    Parameters
+    ----------
+    network : Any
+        A topologia onde as buscas serão executadas.
+    algorithm : str
+        O nome do algoritmo de busca.
+    queries : list[tuple[str, str]]
+        As buscas, cada uma composta pelo id do nó de origem
+        e pelo recurso a ser buscado.
+    ttl : Union[int, float], optional
+        O limitador de 'saltos' das buscas, por padrão infinito.
+    concurrency : int, optional
+        A qntd. máxima de buscas simultâneas, por padrão 100.
+    **kwargs: Any
+        Os parâmetros de `PeerRuntime` (inbox_size, dedup_capacity,
+        max_pending e seed).
+
+    Returns
+    -------
+    RuntimeStats
+        As métricas da execução.
+    """
+    runtime: PeerRuntime = PeerRuntime(network=network, **kwargs)
+    return asyncio.run(
+        runtime.run(
+            algorithm=algorithm,
+            queries=queries,
+            ttl=ttl,
+            concurrency=concurrency
+        )
+    )
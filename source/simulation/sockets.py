@@ -0,0 +1,841 @@
+"""Arquivo responsável pela execução distribuída das buscas, em que
+os nós são divididos entre processos locais que trocam mensagens por
+sockets (Unix ou TCP), permitindo comparar as previsões do simulador
+com a troca real de mensagens."""
+
+import asyncio
+from os import path as os_path
+from shutil import rmtree
+from random import Random
+from tempfile import mkdtemp
+from time import perf_counter
+from collections import deque
+from collections import OrderedDict
+from multiprocessing import get_context
+from typing import Any, Callable, Iterator, Union
+
+# Exceções.
+from exceptions import InvalidParam
+from exceptions import InvalidSearchAlgorithm
+
+from graph import Network
+from reader import read_json_file
+from searchs import SearchResult
+from searchs.rng import lazy_permutation
+
+from .frames import QUERY, WALK, BACK, HIT, RETURN, FORGET
+from .frames import HELLO, ADDRESSES, READY, STOP, STATS
+from .frames import ALGORITHM_CODES
+from .frames import FrameWriter
+from .frames import read_frame
+from .frames import encode_hit
+from .frames import encode_stats
+from .frames import encode_hello
+from .frames import encode_forget
+from .frames import encode_search
+from .frames import encode_signal
+from .frames import encode_return
+from .frames import encode_addresses
+
+# * Os meios de transporte disponíveis.
+TRANSPORTS: set[str] = {
+    'unix',
+    'tcp',
+}
+
+# * O peso inicial de cada busca (ver `SocketCluster`).
+INITIAL_WEIGHT: int = 1 << 1024
+
+# * Os códigos dos algoritmos que consultam o cache dos nós.
+INFORMED_CODES: set[int] = {
+    ALGORITHM_CODES['informed_flooding'],
+    ALGORITHM_CODES['informed_random_walk'],
+}
+
+# * Os códigos dos passeios aleatórios.
+WALK_CODES: set[int] = {
+    ALGORITHM_CODES['random_walk'],
+    ALGORITHM_CODES['informed_random_walk'],
+}
+
+async def _start_server(
+        handler: Callable,
+        transport: str,
+        socket_path: str
+    ) -> tuple[asyncio.AbstractServer, str]:
+    """Inicia um servidor, informando o seu endereço."""
+    if transport == 'unix':
+        server = await asyncio.start_unix_server(handler, path=socket_path)
+        return server, socket_path
+    server = await asyncio.start_server(handler, host='127.0.0.1', port=0)
+    return server, '127.0.0.1:' + str(server.sockets[0].getsockname()[1])
+
+async def _connect(
+        address: str,
+        transport: str
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Abre uma conexão com o endereço de outro processo."""
+    if transport == 'unix':
+        return await asyncio.open_unix_connection(path=address)
+    host, port = address.rsplit(':', 1)
+    return await asyncio.open_connection(host=host, port=int(port))
+
+def _owner(index: int, num_shards: int) -> int:
+    """Informa o processo que hospeda um nó."""
+    return index % num_shards
+
+
+class ShardServer:
+    """Representa um processo que hospeda parte dos nós.
+
+    Cada mensagem de busca recebida carrega um peso; ao tratá-la, o
+    processo divide o peso entre as mensagens geradas e as métricas
+    devolvidas ao coordenador.
+    """
+    shard: int
+    num_shards: int
+    network: Network
+    nodes: list[Any]
+    index: dict[Any, int]
+
+    def __init__(
+            self,
+            shard: int,
+            num_shards: int,
+            data_info: dict[str, Any],
+            batch_size: int,
+            dedup_capacity: int
+        ) -> None:
+        self.shard = shard
+        self.num_shards = num_shards
+        self.network = Network(data_info=data_info)
+        self.nodes = list(self.network.nodes_by_id.values())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.__batch_size: int = batch_size
+        self.__dedup_capacity: int = dedup_capacity
+        # O maior TTL com que cada nó recebeu cada busca.
+        self.__seen: dict[Any, OrderedDict[bytes, Union[int, float]]] = {}
+        self.__walks: dict[bytes, dict[Any, tuple]] = {}
+        self.__pool: dict[int, FrameWriter] = {}
+        self.__inbound: set[asyncio.Task] = set()
+        self.__coordinator: Union[FrameWriter, None] = None
+        self.__returns: dict[bytes, list[int]] = {}
+        # As mensagens locais, tratadas em ordem de chegada, logo, uma
+        # inundação percorre o processo em largura, como no simulador.
+        self.__local: deque[tuple] = deque()
+        self.__messages_count: int = 0
+        self.__stopped: Union[asyncio.Event, None] = None
+
+    async def serve(self, coordinator: str, transport: str, socket_path: str) -> None:
+        """Executa o processo até receber a mensagem 'STOP'.
+
+        Parameters
+        ----------
+        coordinator : str
+            O endereço do coordenador.
+        transport : str
+            O meio de transporte ('unix' ou 'tcp').
+        socket_path : str
+            O caminho do socket Unix deste processo.
+        """
+        self.__stopped = asyncio.Event()
+        server, address = await _start_server(
+            handler=self.__on_connection,
+            transport=transport,
+            socket_path=socket_path
+        )
+        reader, writer = await _connect(address=coordinator, transport=transport)
+        self.__coordinator = FrameWriter(writer=writer, batch_size=self.__batch_size)
+        self.__coordinator.send(encode_hello(shard=self.shard, address=address))
+
+        # Mensagens do coordenador.
+        while (messages := await read_frame(reader=reader)) is not None:
+            for message in messages:
+                if message[0] == ADDRESSES:
+                    # Abre, de uma vez, as conexões persistentes com os demais.
+                    for shard, peer_address in enumerate(message[1]):
+                        if shard != self.shard:
+                            _, peer_writer = await _connect(
+                                address=peer_address,
+                                transport=transport
+                            )
+                            self.__pool[shard] = FrameWriter(
+                                writer=peer_writer,
+                                batch_size=self.__batch_size
+                            )
+                    self.__coordinator.send(encode_signal(kind=READY))
+                elif message[0] == STOP:
+                    self.__stopped.set()
+                else:
+                    self.__process(message=message)
+            if self.__stopped.is_set():
+                break
+            self.__after_frame()
+
+        # Envia as métricas e encerra as conexões, aguardando os demais
+        # processos encerrarem as suas.
+        for peer_writer in self.__pool.values():
+            peer_writer.flush()
+            peer_writer.writer.close()
+        await asyncio.gather(*self.__inbound)
+        self.__coordinator.send(
+            encode_stats(
+                frames_sent=sum(w.frames_sent for w in self.__pool.values()),
+                bytes_sent=sum(w.bytes_sent for w in self.__pool.values()),
+                messages_count=self.__messages_count,
+                connections=len(self.__pool)
+            )
+        )
+        self.__coordinator.flush()
+        await writer.drain()
+        writer.close()
+        server.close()
+
+    async def __on_connection(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+        ) -> None:
+        """Trata as mensagens recebidas de outro processo."""
+        self.__inbound.add(asyncio.current_task())
+        while (messages := await read_frame(reader=reader)) is not None:
+            for message in messages:
+                self.__process(message=message)
+            self.__after_frame()
+        writer.close()
+
+    def __after_frame(self) -> None:
+        """Devolve os pesos acumulados e envia os quadros pendentes.
+
+        As conexões de saída não são aguardadas: dois processos que
+        aguardam um ao outro deixariam de ler as suas conexões, logo,
+        a pressão é aplicada na admissão das buscas (ver
+        `SocketCluster.run`).
+        """
+        for guid, (weight, messages_count, involved_nodes) in self.__returns.items():
+            self.__coordinator.send(
+                encode_return(
+                    guid=guid,
+                    weight=weight,
+                    messages_count=messages_count,
+                    involved_nodes=involved_nodes
+                )
+            )
+        self.__returns.clear()
+        self.__coordinator.flush()
+        for peer_writer in self.__pool.values():
+            peer_writer.flush()
+
+    def __process(self, message: tuple) -> None:
+        """Trata uma mensagem e as mensagens locais geradas por ela."""
+        self.__local.append(message)
+        while self.__local:
+            current: tuple = self.__local.popleft()
+            kind: int = current[0]
+            if kind == HIT:
+                _, _, resource, path = current
+                holder: Any = self.nodes[path[-1]]
+                for index in path:
+                    if _owner(index=index, num_shards=self.num_shards) == self.shard:
+                        self.nodes[index].add_cache(node=holder, resource=resource)
+            elif kind == FORGET:
+                self.__walks.pop(current[1], None)
+            else:
+                self.__search(message=current)
+
+    def __visit(
+            self,
+            node: Any,
+            guid: bytes,
+            ttl: Union[int, float]
+        ) -> Union[int, float, None]:
+        """Marca o GUID da busca como visto pelo nó, informando o
+        maior TTL com que o nó já o tinha recebido (nada, caso seja a
+        primeira visita)."""
+        if (seen := self.__seen.get(node)) is None:
+            seen = self.__seen[node] = OrderedDict()
+        previous: Union[int, float, None] = seen.get(guid)
+        if previous is not None:
+            seen[guid] = max(previous, ttl)
+            return previous
+        seen[guid] = ttl
+        if len(seen) > self.__dedup_capacity:
+            # Descarta o GUID mais antigo sem passeio em andamento no nó
+            # (nem o da própria busca), já que esquecê-lo faria o
+            # andarilho sobrescrever o estado do passeio.
+            for seen_guid in seen:
+                if seen_guid != guid and \
+                        node not in self.__walks.get(seen_guid, ()):
+                    del seen[seen_guid]
+                    break
+        return None
+
+    def __search(self, message: tuple) -> None:
+        """Trata uma mensagem de busca ('QUERY', 'WALK' ou 'BACK')."""
+        kind, algorithm, guid, ttl, weight, resource, path = message
+        node: Any = self.nodes[path[-1]]
+        informed: bool = algorithm in INFORMED_CODES
+        # As mensagens geradas: (tipo, caminho, TTL).
+        sends: list[tuple[int, list[int], Union[int, float]]] = []
+        involved: int = 0
+
+        previous: Union[int, float, None] = None
+        if kind == BACK:
+            self.__advance_walk(guid=guid, node=node, sends=sends)
+        elif (previous := self.__visit(node=node, guid=guid, ttl=ttl)) is not None:
+            # Já visitado: o andarilho volta para o nó anterior.
+            if kind == WALK:
+                sends.append((BACK, path[:-1], ttl + 1))
+            # Uma cópia da inundação que chega, por outro caminho, com mais
+            # TTL continua a partir deste nó, já que, entre processos, a
+            # primeira cópia a chegar nem sempre é a do caminho mais curto.
+            elif ttl > previous and resource not in node.resources and \
+                    not (informed and node.know_resource(resource=resource)):
+                self.__flood(node=node, path=path, ttl=ttl, sends=sends)
+        elif resource in node.resources:
+            involved = 1
+            self.__hit(algorithm=algorithm, guid=guid, resource=resource, path=path)
+        else:
+            involved = 1
+            sender: Union[int, None] = path[-2] if len(path) > 1 else None
+            target: Union[Any, None] = node.get_node_by_resource(
+                resource=resource
+            ) if informed and ttl > 0 else None
+
+            if kind == WALK:
+                # Os vizinhos são sorteados sob demanda, exceto o anterior.
+                self.__walks.setdefault(guid, {})[node] = (
+                    lazy_permutation(
+                        items=tuple(
+                            n for n in node.neighbors
+                            if self.index[n] != sender
+                        ),
+                        rng=Random(guid + path[-1].to_bytes(4, 'big'))
+                    ),
+                    path,
+                    ttl
+                )
+                if target is not None:
+                    sends.append((WALK, path + [self.index[target]], ttl - 1))
+                else:
+                    self.__advance_walk(guid=guid, node=node, sends=sends)
+            # Vai direto para o nó que tem o recurso (cache).
+            elif target is not None:
+                sends.append((QUERY, path + [self.index[target]], 0))
+            elif ttl > 0:
+                self.__flood(node=node, path=path, ttl=ttl, sends=sends)
+
+        # Divide o peso entre as mensagens geradas; ao menos uma unidade
+        # acompanha as métricas devolvidas, logo, a busca só termina
+        # após recebê-las.
+        returned: list[int] = self.__returns.setdefault(guid, [0, 0, 0])
+        returned[2] += involved
+        share: int = (weight - 1) // max(len(sends), 1)
+        returned[0] += weight - share * len(sends)
+        for send_kind, send_path, send_ttl in sends:
+            if send_kind != BACK:
+                returned[1] += 1
+            self.__messages_count += 1
+            self.__route(
+                message=(
+                    send_kind,
+                    algorithm,
+                    guid,
+                    send_ttl,
+                    share,
+                    resource,
+                    send_path
+                )
+            )
+
+    def __flood(
+            self,
+            node: Any,
+            path: list[int],
+            ttl: Union[int, float],
+            sends: list[tuple[int, list[int], Union[int, float]]]
+        ) -> None:
+        """Envia a busca a todos os vizinhos do nó, exceto o anterior."""
+        sender: Union[int, None] = path[-2] if len(path) > 1 else None
+        for neighbor in node.neighbors:
+            index: int = self.index[neighbor]
+            if index != sender:
+                sends.append((QUERY, path + [index], ttl - 1))
+
+    def __advance_walk(
+            self,
+            guid: bytes,
+            node: Any,
+            sends: list[tuple[int, list[int], Union[int, float]]]
+        ) -> None:
+        """Envia o andarilho ao próximo vizinho ainda não tentado, ou
+        de volta ao nó anterior, caso não haja mais vizinhos."""
+        if (state := self.__walks.get(guid, {}).get(node)) is None:
+            return
+        neighbors, path, ttl = state
+        if ttl > 0 and (neighbor := next(neighbors, None)) is not None:
+            sends.append((WALK, path + [self.index[neighbor]], ttl - 1))
+        elif len(path) > 1:
+            sends.append((BACK, path[:-1], ttl + 1))
+
+    def __hit(
+            self,
+            algorithm: int,
+            guid: bytes,
+            resource: str,
+            path: list[int]
+        ) -> None:
+        """Informa o coordenador (e, nas buscas informadas, os nós do
+        caminho, para atualizarem os caches) do recurso encontrado."""
+        hit: bytes = encode_hit(guid=guid, resource=resource, path=path)
+        self.__coordinator.send(hit)
+        if algorithm in INFORMED_CODES:
+            for shard in {_owner(index=i, num_shards=self.num_shards) for i in path}:
+                if shard == self.shard:
+                    self.__local.append((HIT, guid, resource, path))
+                else:
+                    self.__pool[shard].send(hit)
+
+    def __route(self, message: tuple) -> None:
+        """Entrega uma mensagem ao processo que hospeda o destinatário."""
+        shard: int = _owner(index=message[6][-1], num_shards=self.num_shards)
+        if shard == self.shard:
+            self.__local.append(message)
+        else:
+            self.__pool[shard].send(encode_search(*message))
+
+
+def _run_shard(
+        shard: int,
+        num_shards: int,
+        data_info: dict[str, Any],
+        coordinator: str,
+        transport: str,
+        socket_path: str,
+        batch_size: int,
+        dedup_capacity: int
+    ) -> None:
+    """Ponto de entrada de cada processo."""
+    server: ShardServer = ShardServer(
+        shard=shard,
+        num_shards=num_shards,
+        data_info=data_info,
+        batch_size=batch_size,
+        dedup_capacity=dedup_capacity
+    )
+    asyncio.run(
+        server.serve(
+            coordinator=coordinator,
+            transport=transport,
+            socket_path=socket_path
+        )
+    )
+
+
+class TransportStats:
+    """Representa as métricas de uma execução distribuída."""
+    queries: int
+    found: int
+    query_messages: int
+    messages_count: int
+    latency_sum: float
+    elapsed: float
+    frames_sent: int
+    bytes_sent: int
+    connections: int
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.found = 0
+        self.query_messages = 0
+        self.messages_count = 0
+        self.latency_sum = 0.0
+        self.elapsed = 0.0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.connections = 0
+
+    @property
+    def throughput(self) -> float:
+        """A qntd. de buscas concluídas por segundo."""
+        return self.queries / max(self.elapsed, 1e-9)
+
+    @property
+    def mean_latency(self) -> float:
+        """A média do tempo, em segundos, até a conclusão das buscas."""
+        return self.latency_sum / max(self.queries, 1)
+
+    def report(self) -> str:
+        """Descreve as métricas da execução.
+
+        Returns
+        -------
+        str
+            O texto a ser exibido ao usuário.
+        """
+        return f'\n[Execução distribuída] {self.queries} buscas' +\
+            f'\n\t`--> Taxa de sucesso: {self.found / max(self.queries, 1):.2%}' +\
+            f'\n\t`--> Vazão: {self.throughput:.1f} buscas/s' +\
+            f'\n\t`--> Latência média: {self.mean_latency * 1000:.2f} ms' +\
+            f'\n\t`--> Média de mensagens por busca:' +\
+            f' {self.query_messages / max(self.queries, 1):.2f}' +\
+            f'\n\t`--> Mensagens entre nós: {self.messages_count}' +\
+            f'\n\t`--> Quadros entre processos: {self.frames_sent}' +\
+            f' ({self.bytes_sent} bytes, {self.connections} conexões)'
+
+
+class SocketQuery:
+    """Representa uma busca em andamento no coordenador."""
+    result: SearchResult
+    returned: int
+    started: float
+    done: asyncio.Event
+
+    def __init__(self, algorithm: str, resource: str) -> None:
+        self.result = SearchResult(algorithm=algorithm, resource=resource)
+        self.returned = 0
+        self.started = perf_counter()
+        self.done = asyncio.Event()
+
+
+class SocketCluster:
+    """Representa a execução distribuída das buscas.
+
+    Os nós são divididos entre 'num_processes' processos locais, cada
+    um com a sua cópia da topologia, que trocam quadros de mensagens
+    por conexões persistentes (uma por par de processos). O coordenador
+    (este processo) inicia as buscas e detecta o seu término pelo
+    método de 'lançamento de pesos' (weight throwing): a busca começa
+    com um peso, dividido, a cada nó, entre as mensagens geradas e as
+    métricas devolvidas ao coordenador; a busca termina quando todo o
+    peso volta, sem depender da ordem de chegada das mensagens de
+    processos diferentes.
+    """
+    data_info: dict[str, Any]
+    num_processes: int
+    transport: str
+    batch_size: int
+    dedup_capacity: int
+    stats: TransportStats
+
+    def __init__(
+            self,
+            data_info: dict[str, Any],
+            num_processes: int = 2,
+            transport: str = 'unix',
+            batch_size: int = 64,
+            dedup_capacity: int = 1024,
+            seed: Union[int, None] = None
+        ) -> None:
+        # Lança uma exceção caso algum parâmetro seja inválido.
+        if transport not in TRANSPORTS:
+            raise InvalidParam(
+                f'O meio de transporte \'{transport}\' fornecido é inválido.'
+            )
+        if num_processes < 1 or not 1 <= batch_size <= 0xFFFF or \
+            dedup_capacity < 1:
+            raise InvalidParam(
+                'A qntd. de processos e de GUIDs guardados devem ser' +\
+                ' positivas e o tamanho dos quadros deve estar em' +\
+                ' [1, 65535].'
+            )
+
+        self.data_info = data_info
+        self.num_processes = num_processes
+        self.transport = transport
+        self.batch_size = batch_size
+        self.dedup_capacity = dedup_capacity
+        self.stats = TransportStats()
+        self.__rng: Random = Random(seed)
+        self.__network: Network = Network(data_info=data_info)
+        self.__nodes: list[Any] = list(self.__network.nodes_by_id.values())
+        self.__index: dict[Any, int] = {
+            node: i for i, node in enumerate(self.__nodes)
+        }
+        self.__queries: dict[bytes, SocketQuery] = {}
+        self.__shards: dict[int, FrameWriter] = {}
+        self.__addresses: dict[int, str] = {}
+        self.__ready: int = 0
+        self.__stats_received: int = 0
+        self.__all_ready: Union[asyncio.Event, None] = None
+        self.__all_stopped: Union[asyncio.Event, None] = None
+        self.__processes: list[Any] = []
+        self.__server: Union[asyncio.AbstractServer, None] = None
+        self.__directory: str = ''
+
+    async def start(self) -> None:
+        """Inicia os processos e aguarda todos se conectarem."""
+        self.__all_ready = asyncio.Event()
+        self.__all_stopped = asyncio.Event()
+        self.__directory = mkdtemp(prefix='p2p-')
+        self.__server, address = await _start_server(
+            handler=self.__on_connection,
+            transport=self.transport,
+            socket_path=os_path.join(self.__directory, 'coordinator.sock')
+        )
+
+        # Processos iniciados do zero (sem herdar o laço de eventos).
+        context: Any = get_context('spawn')
+        for shard in range(self.num_processes):
+            process: Any = context.Process(
+                target=_run_shard,
+                kwargs={
+                    'shard': shard,
+                    'num_shards': self.num_processes,
+                    'data_info': self.data_info,
+                    'coordinator': address,
+                    'transport': self.transport,
+                    'socket_path': os_path.join(
+                        self.__directory, f'shard{shard}.sock'
+                    ),
+                    'batch_size': self.batch_size,
+                    'dedup_capacity': self.dedup_capacity
+                },
+                daemon=True
+            )
+            process.start()
+            self.__processes.append(process)
+        await self.__all_ready.wait()
+
+    async def stop(self) -> TransportStats:
+        """Encerra os processos, reunindo as suas métricas.
+
+        Returns
+        -------
+        TransportStats
+            As métricas da execução.
+        """
+        for shard_writer in self.__shards.values():
+            shard_writer.send(encode_signal(kind=STOP))
+            shard_writer.flush()
+        await self.__all_stopped.wait()
+        for process in self.__processes:
+            await asyncio.to_thread(process.join)
+        self.__server.close()
+        rmtree(self.__directory, ignore_errors=True)
+        return self.stats
+
+    async def __on_connection(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+        ) -> None:
+        """Trata as mensagens recebidas de um processo."""
+        while (messages := await read_frame(reader=reader)) is not None:
+            for message in messages:
+                kind: int = message[0]
+                if kind == RETURN:
+                    self.__on_return(message=message)
+                elif kind == HIT:
+                    query: Union[SocketQuery, None] = self.__queries.get(message[1])
+                    if query is not None and not query.result.found:
+                        query.result.path = [self.__nodes[i] for i in message[3]]
+                        query.result.node = query.result.path[-1]
+                elif kind == HELLO:
+                    self.__shards[message[1]] = FrameWriter(
+                        writer=writer,
+                        batch_size=self.batch_size
+                    )
+                    self.__addresses[message[1]] = message[2]
+                    # Todos se apresentaram: informa os endereços.
+                    if len(self.__addresses) == self.num_processes:
+                        addresses: bytes = encode_addresses(
+                            addresses=[
+                                self.__addresses[shard]
+                                for shard in range(self.num_processes)
+                            ]
+                        )
+                        for shard_writer in self.__shards.values():
+                            shard_writer.send(addresses)
+                elif kind == READY:
+                    self.__ready += 1
+                    if self.__ready == self.num_processes:
+                        self.__all_ready.set()
+                elif kind == STATS:
+                    _, frames_sent, bytes_sent, messages_count, connections = message
+                    self.stats.frames_sent += frames_sent
+                    self.stats.bytes_sent += bytes_sent
+                    self.stats.messages_count += messages_count
+                    self.stats.connections += connections
+                    self.__stats_received += 1
+                    if self.__stats_received == self.num_processes:
+                        self.__all_stopped.set()
+
+    def __on_return(self, message: tuple) -> None:
+        """Contabiliza o peso devolvido, concluindo a busca quando
+        todo o peso tiver voltado."""
+        _, guid, weight, messages_count, involved_nodes = message
+        # Ignora as métricas de buscas já concluídas.
+        if (query := self.__queries.get(guid)) is None:
+            return
+        query.returned += weight
+        query.result.messages_count += messages_count
+        query.result.involved_nodes += involved_nodes
+        if query.returned < INITIAL_WEIGHT:
+            return
+
+        del self.__queries[guid]
+        self.stats.queries += 1
+        self.stats.found += query.result.found
+        self.stats.query_messages += query.result.messages_count
+        self.stats.latency_sum += perf_counter() - query.started
+        # Descarta o estado dos passeios em todos os processos.
+        if ALGORITHM_CODES[query.result.algorithm] in WALK_CODES:
+            for shard_writer in self.__shards.values():
+                shard_writer.send(encode_forget(guid=guid))
+        query.done.set()
+
+    async def search(
+            self,
+            algorithm: str,
+            node: Any,
+            resource: str,
+            ttl: Union[int, float] = float('inf')
+        ) -> SearchResult:
+        """Executa uma busca, concorrendo com as demais.
+
+        Parameters
+        ----------
+        algorithm : str
+            O nome do algoritmo de busca.
+        node : Any
+            O nó de origem da busca.
+        resource : str
+            O recurso a ser buscado.
+        ttl : Union[int, float], optional
+            O limitador de 'saltos' na busca, por padrão infinito.
+
+        Returns
+        -------
+        SearchResult
+            O resultado da busca.
+
+        Raises
+        ------
+        InvalidSearchAlgorithm
+            Caso o algoritmo não esteja disponível nos processos.
+        """
+        # Lança uma exceção ao tentar um algoritmo de busca inválido.
+        if algorithm not in ALGORITHM_CODES:
+            raise InvalidSearchAlgorithm(
+                f'O algoritmo \'{algorithm}\' fornecido é inválido' +\
+                ' para a execução distribuída.'
+            )
+
+        guid: bytes = self.__rng.getrandbits(128).to_bytes(16, 'big')
+        query: SocketQuery = SocketQuery(algorithm=algorithm, resource=resource)
+        self.__queries[guid] = query
+        index: int = self.__index[node]
+        code: int = ALGORITHM_CODES[algorithm]
+        self.__shards[_owner(index=index, num_shards=self.num_processes)].send(
+            encode_search(
+                kind=WALK if code in WALK_CODES else QUERY,
+                algorithm=code,
+                guid=guid,
+                ttl=ttl,
+                weight=INITIAL_WEIGHT,
+                resource=resource,
+                path=[index]
+            )
+        )
+        await query.done.wait()
+        return query.result
+
+    async def run(
+            self,
+            algorithm: str,
+            queries: list[tuple[str, str]],
+            ttl: Union[int, float] = float('inf'),
+            concurrency: int = 100
+        ) -> TransportStats:
+        """Executa uma carga de buscas, com até 'concurrency' buscas
+        simultâneas.
+
+        Parameters
+        ----------
+        algorithm : str
+            O nome do algoritmo de busca.
+        queries : list[tuple[str, str]]
+            As buscas, cada uma composta pelo id do nó de origem
+            e pelo recurso a ser buscado.
+        ttl : Union[int, float], optional
+            O limitador de 'saltos' das buscas, por padrão infinito.
+        concurrency : int, optional
+            A qntd. máxima de buscas simultâneas, por padrão 100.
+
+        Returns
+        -------
+        TransportStats
+            As métricas da execução (as métricas dos quadros só são
+            reunidas em `stop`).
+        """
+        remaining: Iterator[tuple[str, str]] = iter(queries)
+
+        async def client() -> None:
+            """Executa as buscas restantes, uma de cada vez."""
+            for node_id, resource in remaining:
+                await self.search(
+                    algorithm=algorithm,
+                    node=self.__network.find_node_by_id(node_id=node_id),
+                    resource=resource,
+                    ttl=ttl
+                )
+
+        started: float = perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        self.stats.elapsed += perf_counter() - started
+        return self.stats
+
+
+def run_socket_workload(
+        file_path: str,
+        algorithm: str,
+        queries: list[tuple[str, str]],
+        ttl: Union[int, float] = float('inf'),
+        concurrency: int = 100,
+        **kwargs
+    ) -> TransportStats:
+    """Executa uma carga de buscas distribuída, lendo a topologia do
+    arquivo de entrada.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo de entrada.
+    algorithm : str
+        O nome do algoritmo de busca.
+    queries : list[tuple[str, str]]
+        As buscas, cada uma composta pelo id do nó de origem
+        e pelo recurso a ser buscado.
+    ttl : Union[int, float], optional
+        O limitador de 'saltos' das buscas, por padrão infinito.
+    concurrency : int, optional
+        A qntd. máxima de buscas simultâneas, por padrão 100.
+    **kwargs: Any
+        Os parâmetros de `SocketCluster` (num_processes, transport,
+        batch_size, dedup_capacity e seed).
+
+    Returns
+    -------
+    TransportStats
+        As métricas da execução.
+    """
+    cluster: SocketCluster = SocketCluster(
+        data_info=read_json_file(file_path=file_path),
+        **kwargs
+    )
+
+    async def execute() -> TransportStats:
+        await cluster.start()
+        try:
+            await cluster.run(
+                algorithm=algorithm,
+                queries=queries,
+                ttl=ttl,
+                concurrency=concurrency
+            )
+        finally:
+            stats: TransportStats = await cluster.stop()
+        return stats
+
+    return asyncio.run(execute())
@@ -0,0 +1,71 @@
+"""Arquivo responsável pelo aquecimento, offline, dos
+caches dos nós, a partir de uma carga de buscas."""
+
+import sys
+
+from typing import Any
+
+from graph import Network
+from graph import save_caches
+from graph import warm_caches
+from reader import read_json_file
+from reader import read_query_trace
+from searchs import WorkloadCheckpoint
+
+def main(
+        file_path: str,
+        trace_path: str,
+        cache_path: str,
+        checkpoint_path: str,
+        resume: bool = False
+    ) -> None:
+    """Aquece e salva os caches dos nós da topologia.
+
+    O aquecimento grava pontos de retomada (ver `WorkloadCheckpoint`)
+    e, com 'resume', continua de onde a execução anterior parou.
+
+    Parameters
+    ----------
+    file_path : str
+        O caminho do arquivo de entrada.
+    trace_path : str
+        O caminho da carga de buscas a ser reexecutada.
+    cache_path : str
+        O caminho onde os caches serão salvos.
+    checkpoint_path : str
+        O caminho dos pontos de retomada do aquecimento.
+    resume : bool, optional
+        Se o aquecimento continua a partir dos pontos de retomada,
+        por padrão não.
+    """
+    data_read: Any = read_json_file(file_path=file_path)
+    network: Network = Network(data_info=data_read)
+    network.check_network()
+
+    checkpoint: WorkloadCheckpoint = WorkloadCheckpoint(
+        file_path=checkpoint_path,
+        resume=resume
+    )
+    print(
+        warm_caches(
+            network=network,
+            queries=read_query_trace(file_path=trace_path),
+            checkpoint=checkpoint
+        ).report()
+    )
+    if checkpoint.restored_queries:
+        print(
+            f'\n{checkpoint.restored_queries} buscas retomadas de' +\
+            f' {checkpoint_path}.'
+        )
+    saved_nodes: int = save_caches(network=network, file_path=cache_path)
+    print(f'\nCaches de {saved_nodes} nós salvos em {cache_path}.')
+
+if __name__ == '__main__':
+    main(
+        file_path='source/input.json',
+        trace_path=sys.argv[1],
+        cache_path='source/caches.json',
+        checkpoint_path='source/caches.checkpoint.jsonl',
+        resume='--resume' in sys.argv[2:]
+    )